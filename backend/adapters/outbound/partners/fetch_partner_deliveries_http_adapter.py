@@ -2,49 +2,159 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from functools import lru_cache
+from typing import Any, Iterator, Mapping
 
 import httpx
 
 from backend.adapters.outbound.partners.http_config import HttpConfig, get_http_config
+from backend.adapters.outbound.partners.partner_http_client import PartnerHttpClient, get_partner_http_client
+from backend.adapters.outbound.partners.partner_payload_schemas import (
+    GENERIC_SCHEMA,
+    PartnerPayloadSchema,
+    partner_payload_schemas,
+)
 from backend.domain.partner_delivery import PartnerDelivery
 from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
 from backend.ports.fetch_partner_deliveries_port import FetchPartnerDeliveriesPort
+from backend.shared.config.settings import get_settings
+from backend.shared.utils.json_stream import iter_json_array
+from backend.shared.utils.metrics import PARTNER_FETCH_SECONDS
 
 logger = logging.getLogger(__name__)
 
+_END = object()
+
 
 class PartnerDeliveriesHttpAdapter(FetchPartnerDeliveriesPort):
-    def __init__(self, http_config: HttpConfig):
-        self._timeout = http_config.timeout
+    def __init__(
+        self,
+        http_config: HttpConfig,
+        http_client: PartnerHttpClient,
+        payload_schemas: Mapping[str, PartnerPayloadSchema] | None = None,
+    ):
         self.endpoints = http_config.endpoints
+        self._http_client = http_client
+        self._payload_schemas = payload_schemas or {}
 
-    async def _fetch_async(self, source: str, url: str) -> PartnerDelivery:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            logger.info("Fetching deliveries from %s", source)
+    async def _fetch_async(self, source: str, url: str, timeout: float | None) -> PartnerDelivery:
+        logger.info("Fetching deliveries from %s", source)
+        started = time.perf_counter()
+        try:
             try:
-                response = await client.post(url)
-                response.raise_for_status()
+                response = await asyncio.wait_for(self._http_client.post(source, url), timeout)
+            finally:
+                PARTNER_FETCH_SECONDS.labels(source, "request").observe(time.perf_counter() - started)
+            response.raise_for_status()
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Response body: %s", response.text)
-                return PartnerDelivery(delivery_data=response.json())
-            except httpx.HTTPStatusError as exc:
-                logger.error("HTTP error fetching deliveries from %s: %s", source, exc)
-                raise PartnerDeliveryFetchError(source, str(exc)) from exc
-            except httpx.RequestError as exc:
-                logger.error("Request error fetching deliveries from %s: %s", source, exc)
-                raise PartnerDeliveryFetchError(source, str(exc)) from exc
-            except Exception as exc:
-                logger.error("Unexpected error fetching deliveries from %s: %s", source, exc)
-                raise PartnerDeliveryFetchError(source, str(exc)) from exc
-
-    def fetch(self, source: str) -> PartnerDelivery:
+            return self._decode(source, response.content)
+        except TimeoutError as exc:
+            logger.error("Deadline of %ss exceeded fetching deliveries from %s", timeout, source)
+            raise PartnerDeliveryFetchError(source, f"Deadline of {timeout}s exceeded") from exc
+        except httpx.HTTPStatusError as exc:
+            logger.error("HTTP error fetching deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        except httpx.RequestError as exc:
+            logger.error("Request error fetching deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        except ValueError as exc:
+            logger.error("Malformed payload fetching deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        except Exception as exc:
+            logger.error("Unexpected error fetching deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+
+    def _decode(self, source: str, content: bytes) -> PartnerDelivery:
+        started = time.perf_counter()
+        records, malformed = self._payload_schemas.get(source, GENERIC_SCHEMA).decode(content)
+        decode_seconds = time.perf_counter() - started
+        if malformed:
+            logger.warning("%d malformed deliveries in the payload from %s", len(malformed), source)
+        return PartnerDelivery(
+            delivery_data=records,
+            malformed=malformed,
+            decoded_bytes=len(content),
+            decode_seconds=decode_seconds,
+        )
+
+    def fetch(self, source: str, timeout: float | None = None) -> PartnerDelivery:
+        url = self._endpoint_for(source)
+        return self._http_client.run(self._fetch_async(source, url, timeout))
+
+    def stream(
+        self,
+        source: str,
+        timeout: float | None = None,
+        stats: Stats | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        url = self._endpoint_for(source)
+        logger.info("Streaming deliveries from %s", source)
+        started = time.perf_counter()
+        try:
+            chunks = self._http_client.stream_post(source, url, timeout)
+            if stats is None:
+                yield from iter_json_array(chunks)
+            else:
+                yield from _timed_records(chunks, stats)
+        except TimeoutError as exc:
+            logger.error("Deadline of %ss exceeded streaming deliveries from %s", timeout, source)
+            raise PartnerDeliveryFetchError(source, f"Deadline of {timeout}s exceeded") from exc
+        except httpx.HTTPStatusError as exc:
+            logger.error("HTTP error streaming deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        except httpx.RequestError as exc:
+            logger.error("Request error streaming deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        except ValueError as exc:
+            logger.error("Malformed payload streaming deliveries from %s: %s", source, exc)
+            raise PartnerDeliveryFetchError(source, str(exc)) from exc
+        finally:
+            PARTNER_FETCH_SECONDS.labels(source, "stream").observe(time.perf_counter() - started)
+
+    def _endpoint_for(self, source: str) -> str:
         url = self.endpoints.get(source)
         if url is None:
             logger.error("Unknown partner source requested: %s", source)
             raise PartnerDeliveryFetchError(source, "Unknown partner source")
-        return asyncio.run(self._fetch_async(source, url))
+        return url
+
+
+def _timed_records(chunks: Iterator[bytes], stats: Stats) -> Iterator[dict[str, Any]]:
+    """Decode records from `chunks`, splitting the time spent into waiting for bytes and decoding them."""
+    waited = 0.0
+
+    def received() -> Iterator[bytes]:
+        nonlocal waited
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            waited += time.perf_counter() - started
+            if chunk is None:
+                return
+            stats.record_bytes_received(len(chunk))
+            yield chunk
+
+    records = iter_json_array(received())
+    while True:
+        started, waited_before = time.perf_counter(), waited
+        record = next(records, _END)
+        elapsed, waited_for_record = time.perf_counter() - started, waited - waited_before
+        stats.record_stage(PipelineStage.FETCH, waited_for_record)
+        stats.record_stage(PipelineStage.DECODE, elapsed - waited_for_record)
+        if record is _END:
+            return
+        yield record
+
 
 @lru_cache
 def get_fetch_partner_deliveries_port() -> FetchPartnerDeliveriesPort:
     http_config: HttpConfig = get_http_config()
-    return PartnerDeliveriesHttpAdapter(http_config=http_config)
+    return PartnerDeliveriesHttpAdapter(
+        http_config=http_config,
+        http_client=get_partner_http_client(),
+        payload_schemas=partner_payload_schemas(get_settings()),
+    )
@@ -1,23 +1,53 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Mapping
 
-from pydantic import ConfigDict, BaseModel
+from pydantic import ConfigDict, BaseModel, Field
 
 from backend.shared.config.settings import get_settings
 
 
+class ConnectionLimits(BaseModel):
+    """Connection pool limits applied to the client of a single partner."""
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+
+    model_config = ConfigDict(frozen=True)
+
+
 class HttpConfig(BaseModel):
     timeout: float
     endpoints: Mapping[str, str]
+    http2: bool = False
+    default_limits: ConnectionLimits = Field(default_factory=ConnectionLimits)
+    partner_limits: Mapping[str, ConnectionLimits] = Field(default_factory=lambda: MappingProxyType({}))
 
     model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
+    def limits_for(self, source: str) -> ConnectionLimits:
+        return self.partner_limits.get(source, self.default_limits)
+
+
 @lru_cache
 def get_http_config() -> HttpConfig:
     settings = get_settings()
+    default_limits = ConnectionLimits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    partner_limits = {
+        source: ConnectionLimits(**{**default_limits.model_dump(), **overrides})
+        for source, overrides in settings.http_partner_limits.items()
+    }
     return HttpConfig(
         timeout=settings.http_timeout,
         endpoints=settings.partner_endpoints,
+        http2=settings.http2_enabled,
+        default_limits=default_limits,
+        partner_limits=MappingProxyType(partner_limits),
     )
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Coroutine, Iterator, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from backend.adapters.outbound.partners.http_config import HttpConfig, get_http_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CONNECTION_OPENED_EVENT = "connection.connect_tcp.complete"
+_STREAM_QUEUE_SIZE = 16
+_END_OF_STREAM = object()
+
+
+class PoolMetrics(BaseModel):
+    """Connection usage counters for the pool of a single partner."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    async def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """httpcore trace hook; only fires ``connect_tcp`` when the pool has to open a new connection."""
+        if event_name == _CONNECTION_OPENED_EVENT:
+            self.connections_opened += 1
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connectionsOpened": self.connections_opened,
+            "connectionsReused": self.connections_reused,
+        }
+
+
+class PartnerHttpClient:
+    """Process-wide keep-alive HTTP clients, one connection pool per partner.
+
+    The clients live on a dedicated event loop thread so that connections survive
+    across scheduled job runs; callers on other threads submit coroutines via `run`.
+    """
+
+    def __init__(self, http_config: HttpConfig) -> None:
+        self._http_config = http_config
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._metrics: dict[str, PoolMetrics] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self._loop is not None
+
+    def open(self) -> None:
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._clients = {source: self._build_client(source) for source in self._http_config.endpoints}
+            self._metrics = {source: PoolMetrics() for source in self._http_config.endpoints}
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="partner-http-client", daemon=True)
+            thread.start()
+            self._loop, self._thread = loop, thread
+        logger.info("Partner HTTP client opened for sources %s.", sorted(self._clients))
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._close_clients(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop, self._thread = None, None
+            self._clients = {}
+        logger.info("Partner HTTP client closed.")
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client loop and block until it completes."""
+        loop = self._loop
+        if loop is None:
+            coroutine.close()
+            raise RuntimeError("Partner HTTP client is not open.")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def stream_post(self, source: str, url: str, timeout: float | None = None) -> Iterator[bytes]:
+        """POST and yield the response body chunk by chunk to a synchronous caller.
+
+        A single producer task reads the body into a bounded queue, so at most
+        `_STREAM_QUEUE_SIZE` chunks are held in memory. `timeout` bounds the whole stream.
+        """
+        deadline_at = time.monotonic() + timeout if timeout is not None else None
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("Partner HTTP client is not open.")
+        producer = asyncio.run_coroutine_threadsafe(self._produce_body(source, url, queue), loop)
+        try:
+            while True:
+                remaining = max(deadline_at - time.monotonic(), 0.0) if deadline_at is not None else None
+                item = self.run(asyncio.wait_for(queue.get(), remaining))
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def post(self, source: str, url: str) -> httpx.Response:
+        client = self._clients[source]
+        metrics = self._metrics[source]
+        metrics.requests += 1
+        return await client.post(url, extensions={"trace": metrics.trace})
+
+    async def _produce_body(self, source: str, url: str, queue: asyncio.Queue[Any]) -> None:
+        client = self._clients[source]
+        metrics = self._metrics[source]
+        metrics.requests += 1
+        try:
+            async with client.stream("POST", url, extensions={"trace": metrics.trace}) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    await queue.put(chunk)
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        await queue.put(_END_OF_STREAM)
+
+    def pool_metrics(self) -> dict[str, dict[str, int]]:
+        return {source: metrics.as_dict() for source, metrics in self._metrics.items()}
+
+    def _build_client(self, source: str) -> httpx.AsyncClient:
+        limits = self._http_config.limits_for(source)
+        return httpx.AsyncClient(
+            timeout=self._http_config.timeout,
+            http2=self._http_config.http2,
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+
+    async def _close_clients(self) -> None:
+        await asyncio.gather(*(client.aclose() for client in self._clients.values()))
+
+
+@lru_cache
+def get_partner_http_client() -> PartnerHttpClient:
+    return PartnerHttpClient(get_http_config())
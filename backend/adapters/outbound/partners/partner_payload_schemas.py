@@ -0,0 +1,90 @@
+"""Typed schemas of the partner payloads, decoded straight from response bytes.
+
+Each schema validates a whole JSON array in a single pass. A record that does not match is
+reported as a `MalformedRecord` instead of failing the payload, at the cost of a second pass
+over that payload; the records come out as plain dicts holding only the schema's fields.
+"""
+from dataclasses import dataclass
+from typing import Annotated, Any, Mapping
+
+from pydantic import TypeAdapter, ValidationError, ValidatorFunctionWrapHandler, WrapValidator
+from typing_extensions import NotRequired, TypedDict
+
+from backend.domain.malformed_record import MalformedRecord
+from backend.shared.config.settings import Settings
+
+
+class PartnerARecord(TypedDict):
+    deliveryId: str
+    supplier: str
+    timestamp: str
+    status: NotRequired[str]
+    signedBy: NotRequired[Any]
+
+
+class PartnerBReceiver(TypedDict, total=False):
+    signed: Any
+
+
+class PartnerBRecord(TypedDict):
+    id: str
+    provider: str
+    deliveredAt: str
+    statusCode: NotRequired[str]
+    receiver: NotRequired[PartnerBReceiver | None]
+
+
+@dataclass(slots=True)
+class _Rejected:
+    reason: str
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def _isolate(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except ValidationError as exc:
+        return _Rejected(_describe(exc))
+
+
+class PartnerPayloadSchema:
+    """Decoder for the JSON array of records returned by one partner."""
+
+    def __init__(self, record_type: Any) -> None:
+        self._adapter = TypeAdapter(list[record_type])
+        self._isolating_adapter = TypeAdapter(list[Annotated[record_type, WrapValidator(_isolate)]])
+
+    def decode(self, content: bytes) -> tuple[list[dict[str, Any]], list[MalformedRecord]]:
+        """Return the records matching the schema and the malformed ones; raises ValueError unless the body is an array."""
+        try:
+            return self._adapter.validate_json(content), []
+        except ValidationError:
+            # Only payloads with malformed records pay for isolating every record in Python.
+            pass
+        try:
+            items = self._isolating_adapter.validate_json(content)
+        except ValidationError as exc:
+            raise ValueError(f"Expected a JSON array of delivery objects ({_describe(exc)})") from exc
+        records: list[dict[str, Any]] = []
+        malformed: list[MalformedRecord] = []
+        for index, item in enumerate(items):
+            if isinstance(item, _Rejected):
+                malformed.append(MalformedRecord(index=index, reason=item.reason))
+            else:
+                records.append(item)
+        return records, malformed
+
+
+PARTNER_A_SCHEMA = PartnerPayloadSchema(PartnerARecord)
+PARTNER_B_SCHEMA = PartnerPayloadSchema(PartnerBRecord)
+# Sources without a dedicated schema only need every record to be a JSON object.
+GENERIC_SCHEMA = PartnerPayloadSchema(dict[str, Any])
+
+
+def partner_payload_schemas(settings: Settings) -> Mapping[str, PartnerPayloadSchema]:
+    return {settings.source_a: PARTNER_A_SCHEMA, settings.source_b: PARTNER_B_SCHEMA}
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from contextlib import AsyncExitStack, ExitStack
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.migrations import run_migrations
+from backend.adapters.repostory.postgres_config import PostgresConfig, get_postgres_config
+
+logger = logging.getLogger(__name__)
+
+
+class Database:
+    """The process-wide engine and connection pool shared by every repository.
+
+    Owned by the application lifespan: the schema is created and the pool warmed at
+    startup so no request pays for DDL or connection setup, and the pool is disposed
+    on shutdown.
+    """
+
+    def __init__(self, config: PostgresConfig) -> None:
+        self._config = config
+        self._engine = create_engine(config.postgres_dsn, **_engine_options(config))
+        self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False, class_=Session)
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    @property
+    def session_factory(self) -> sessionmaker[Session]:
+        return self._session_factory
+
+    def create_schema(self) -> None:
+        # Registers the tables on `Base.metadata`; imported here because the repositories import this module.
+        from backend.adapters.repostory import row_counts  # noqa: F401
+        from backend.adapters.repostory.unified_deliveries import unified_delivery_model  # noqa: F401
+
+        Base.metadata.create_all(self._engine)
+        run_migrations(self._engine)
+
+    def warm_up(self) -> int:
+        """Open up to `pool_warmup` connections at once and return them to the pool."""
+        count = min(self._config.pool_warmup, self._config.pool_size)
+        with ExitStack() as stack:
+            for _ in range(count):
+                stack.enter_context(self._engine.connect()).execute(text("SELECT 1"))
+        logger.info("Database pool warmed with %d connection(s).", count)
+        return count
+
+    def dispose(self) -> None:
+        self._engine.dispose()
+        logger.info("Database pool disposed.")
+
+
+class AsyncDatabase:
+    """An asyncio engine and pool on the same database, for request handlers that must not block a thread.
+
+    Sized like `Database` and owned by the application lifespan in the same way; the schema is
+    created through the synchronous engine.
+    """
+
+    def __init__(self, config: PostgresConfig) -> None:
+        self._config = config
+        self._engine = create_async_engine(config.postgres_dsn, **_engine_options(config))
+        self._session_factory = async_sessionmaker(bind=self._engine, expire_on_commit=False, class_=AsyncSession)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        return self._session_factory
+
+    async def warm_up(self) -> int:
+        """Open up to `pool_warmup` connections at once and return them to the pool."""
+        count = min(self._config.pool_warmup, self._config.pool_size)
+        async with AsyncExitStack() as stack:
+            for _ in range(count):
+                connection = await stack.enter_async_context(self._engine.connect())
+                await connection.execute(text("SELECT 1"))
+        logger.info("Async database pool warmed with %d connection(s).", count)
+        return count
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+        logger.info("Async database pool disposed.")
+
+
+def _engine_options(config: PostgresConfig) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "future": True,
+        "pool_pre_ping": True,
+        "pool_size": config.pool_size,
+        "max_overflow": config.max_overflow,
+        "pool_recycle": config.pool_recycle,
+        "pool_timeout": config.pool_timeout,
+        "insertmanyvalues_page_size": config.insert_batch_size,
+    }
+    if make_url(config.postgres_dsn).get_backend_name() == "postgresql" and config.statement_timeout_ms:
+        options["connect_args"] = {"options": f"-c statement_timeout={config.statement_timeout_ms}"}
+    return options
+
+
+@lru_cache
+def get_database() -> Database:
+    return Database(get_postgres_config())
+
+
+@lru_cache
+def get_async_database() -> AsyncDatabase:
+    return AsyncDatabase(get_postgres_config())
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from backend.adapters.repostory.database import get_async_database
+from backend.adapters.repostory.jobs.job_repository import get_jobs_port, list_jobs_json_page, list_jobs_page
+from backend.domain.count_mode import CountMode
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.ports.async_jobs_port import AsyncJobsPort
+from backend.ports.jobs_port import JobsPort
+from backend.shared.config.settings import get_settings
+
+
+class AsyncJobsRepository(AsyncJobsPort):
+    """List jobs over the asyncio engine, running the query shared with `JobsRepository`."""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def list_jobs(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page:
+        async with self._session_factory() as session:
+            return await session.run_sync(list_jobs_page, limit, offset, cursor, count_mode)
+
+    async def list_jobs_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> JsonPage:
+        async with self._session_factory() as session:
+            return await session.run_sync(list_jobs_json_page, limit, offset, cursor, count_mode)
+
+
+class ThreadedJobsRepository(AsyncJobsPort):
+    """List jobs with the synchronous repository on the worker thread pool, like a sync handler would."""
+
+    def __init__(self, jobs_port: JobsPort) -> None:
+        self._jobs_port = jobs_port
+
+    async def list_jobs(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page:
+        return await run_in_threadpool(self._jobs_port.list_jobs, limit, offset, cursor, count_mode)
+
+    async def list_jobs_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> JsonPage:
+        return await run_in_threadpool(self._jobs_port.list_jobs_json, limit, offset, cursor, count_mode)
+
+
+@lru_cache
+def get_async_jobs_port(jobs_port: JobsPort = Depends(get_jobs_port)) -> AsyncJobsPort:
+    if get_settings().db_async_enabled:
+        return AsyncJobsRepository(get_async_database().session_factory)
+    return ThreadedJobsRepository(jobs_port)
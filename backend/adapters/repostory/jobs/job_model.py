@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, String, JSON, Text
+from sqlalchemy import DateTime, Index, String, JSON, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from backend.adapters.scheduling.job_status import JobStatus
@@ -13,6 +13,10 @@ class Base(DeclarativeBase):
 
 class JobModel(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Serves keyset pagination ordered by (created_at, id) descending via a backward index scan.
+        Index("ix_jobs_created_at_keyset", "created_at", "id"),
+    )
 
     id: Mapped[String] = mapped_column(String(36), primary_key=True)
     status: Mapped[JobStatus] = mapped_column(String(64), nullable=False)
@@ -6,14 +6,63 @@ from typing import Any, Callable
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import create_engine, func, select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Select, bindparam, case, func, select, text, tuple_
+from sqlalchemy.orm import Session
 
 from backend.adapters.scheduling.job_status import JobStatus
-from backend.adapters.repostory.jobs.job_model import JobModel, Base
-from backend.adapters.repostory.postgres_config import PostgresConfig, get_postgres_config
+from backend.adapters.repostory.database import Database, get_database
+from backend.adapters.repostory.jobs.job_model import JobModel
+from backend.adapters.repostory.json_pages import (
+    PAGE_LIMIT,
+    fetch_json_page,
+    json_page_statement,
+    supports_json_pages,
+    utc_timestamp_json,
+)
+from backend.adapters.repostory.row_counts import count_rows, increment_row_count
+from backend.domain.count_mode import CountMode
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
 from backend.ports.jobs_port import JobsPort
+from backend.shared.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from backend.shared.utils.date_utils import to_utc
+from backend.shared.utils.json_response import to_json
 from backend.domain.stats import Stats
+from backend.domain.stats_fields import StatsFields
+
+_LISTED_COLUMNS = (
+    JobModel.id,
+    JobModel.status,
+    JobModel.created_at,
+    JobModel.updated_at,
+    JobModel.input,
+    JobModel.stats,
+    JobModel.error,
+)
+
+_ERROR = "error"
+
+
+def _merge_partner_stats(persisted: dict[str, Any] | None, stats: Stats, error: str | None) -> dict[str, Any]:
+    """Add one partner's entry, with its `error` if it failed; the top-level `stored` count sums over partners."""
+    merged = dict(persisted or {})
+    partner_stats = stats.as_dict()
+    stored = StatsFields.STORED.value
+    merged[stored] = merged.get(stored, 0) + partner_stats.pop(stored)
+    if error is not None:
+        partner_stats[stats.partner][_ERROR] = error
+    merged.update(partner_stats)
+    return merged
+
+
+def _job_error(job_stats: dict[str, Any]) -> str | None:
+    """Join the errors of every failed partner, in the order they were recorded."""
+    errors = [
+        f"{partner}: {entry[_ERROR]}"
+        for partner, entry in job_stats.items()
+        if isinstance(entry, dict) and _ERROR in entry
+    ]
+    return "; ".join(errors) or None
 
 
 class JobsRepository(JobsPort):
@@ -34,6 +83,7 @@ class JobsRepository(JobsPort):
                 error=None,
             )
             session.add(job_model)
+            increment_row_count(session, JobModel.__tablename__, 1)
             session.commit()
         return job_id
 
@@ -42,43 +92,135 @@ class JobsRepository(JobsPort):
             job_model = session.get(JobModel, str(job_id))
             if job_model is None:
                 raise ValueError(f"Job with id {job_id} does not exist.")
-            job_model.stats = stats.as_dict()
-            job_model.error = error
+            job_model.stats = _merge_partner_stats(job_model.stats, stats, error)
+            job_model.error = _job_error(job_model.stats)
             job_model.updated_at = updated_at
             session.commit()
 
-    def list_jobs(self, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
+    def list_jobs(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page:
+        """Return jobs newest first; a `cursor` resumes after a previous page via the keyset index."""
         with self._session_factory() as session:
-            total = session.scalar(select(func.count()).select_from(JobModel)) or 0
-            stmt = (
-                select(JobModel)
-                .order_by(JobModel.created_at.desc())
-                .offset(offset)
-                .limit(limit)
-            )
-            jobs = session.scalars(stmt).all()
-            items: list[dict[str, Any]] = []
-            for job in jobs:
-                items.append(
-                    {
-                        "jobId": job.id,
-                        "status": job.status,
-                        "createdAt": job.created_at,
-                        "updatedAt": job.updated_at,
-                        "input": job.input,
-                        "stats": job.stats,
-                        "error": job.error,
-                    },
-                )
-        return items, total
-
-def _build_session_factory(config: PostgresConfig) -> sessionmaker[Session]:
-    engine = create_engine(config.postgres_dsn, future=True, pool_pre_ping=True)
-    Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+            return list_jobs_page(session, limit, offset, cursor, count_mode)
+
+    def list_jobs_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> JsonPage:
+        with self._session_factory() as session:
+            return list_jobs_json_page(session, limit, offset, cursor, count_mode)
+
+
+def list_jobs_page(session: Session, limit: int, offset: int, cursor: str | None, count_mode: CountMode) -> Page:
+    """Query one page of jobs in the shape the API returns; shared by the synchronous and asyncio repositories.
+
+    `createdAt` and `updatedAt` are aware UTC datetimes.
+    """
+    total, count_mode = count_rows(session, JobModel, count_mode)
+    rows = session.execute(_page_statement(limit, offset, cursor)).all()
+    items = [
+        {
+            "jobId": job_id,
+            "status": job_status.lower(),
+            "createdAt": to_utc(created_at),
+            "updatedAt": to_utc(updated_at),
+            "input": job_input,
+            "stats": stats or {},
+            "error": error,
+        }
+        for job_id, job_status, created_at, updated_at, job_input, stats, error in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+    return Page.model_construct(items=items, total=total, count_mode=count_mode, next_cursor=next_cursor)
+
+
+def list_jobs_json_page(
+    session: Session,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count_mode: CountMode,
+) -> JsonPage:
+    """Like `list_jobs_page`, with Postgres rendering the items; elsewhere they are serialized here."""
+    if not supports_json_pages(session):
+        page = list_jobs_page(session, limit, offset, cursor, count_mode)
+        return JsonPage(
+            items_json=to_json(page.items).decode(),
+            total=page.total,
+            count_mode=page.count_mode,
+            next_cursor=page.next_cursor,
+        )
+    total, count_mode = count_rows(session, JobModel, count_mode)
+    parameters: dict[str, Any] = {PAGE_LIMIT.key: limit}
+    if cursor is not None:
+        parameters["created_at"], parameters["job_id"] = _decode_keyset(cursor)
+    else:
+        parameters["offset"] = offset
+    items_json, last_key = fetch_json_page(session, _json_page_statement(cursor is not None), parameters)
+    next_cursor = None
+    if last_key is not None:
+        created_at, job_id = last_key
+        next_cursor = encode_cursor(created_at.isoformat(), job_id)
+    return JsonPage(items_json=items_json, total=total, count_mode=count_mode, next_cursor=next_cursor)
+
+
+@lru_cache(maxsize=None)
+def _json_page_statement(keyset: bool) -> Select[Any]:
+    """The JSON page query, with every value left as a bound parameter."""
+    stmt = select(*_LISTED_COLUMNS).order_by(JobModel.created_at.desc(), JobModel.id.desc()).limit(PAGE_LIMIT + 1)
+    if keyset:
+        stmt = stmt.where(tuple_(JobModel.created_at, JobModel.id) < tuple_(bindparam("created_at"), bindparam("job_id")))
+    else:
+        stmt = stmt.offset(bindparam("offset"))
+    page = stmt.subquery()
+    # Jobs are created with JSON `null` stats, which the API reports as an empty object.
+    stats = case((func.json_typeof(page.c.stats) == "null", None), else_=page.c.stats)
+    item = func.json_build_object(
+        "jobId", page.c.id,
+        "status", func.lower(page.c.status),
+        "createdAt", utc_timestamp_json(page.c.created_at),
+        "updatedAt", utc_timestamp_json(page.c.updated_at),
+        "input", page.c.input,
+        "stats", func.coalesce(stats, text("'{}'::json")),
+        "error", page.c.error,
+    )
+    return json_page_statement(
+        page,
+        item,
+        order_by=(page.c.created_at.desc(), page.c.id.desc()),
+        key=(page.c.created_at, page.c.id),
+    )
+
+
+def _page_statement(limit: int, offset: int, cursor: str | None) -> Select[Any]:
+    # One row beyond the page tells whether there is a next one.
+    stmt = select(*_LISTED_COLUMNS).order_by(JobModel.created_at.desc(), JobModel.id.desc()).limit(limit + 1)
+    if cursor is not None:
+        return stmt.where(tuple_(JobModel.created_at, JobModel.id) < tuple(_decode_keyset(cursor)))
+    return stmt.offset(offset)
+
+
+def _decode_keyset(cursor: str) -> tuple[datetime, str]:
+    created_at, job_id = decode_cursor(cursor, size=2)
+    if not isinstance(created_at, str) or not isinstance(job_id, str):
+        raise InvalidCursorError("Malformed pagination cursor")
+    try:
+        return datetime.fromisoformat(created_at), job_id
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
 
 
 @lru_cache
-def get_jobs_port(config: PostgresConfig = Depends(get_postgres_config)) -> JobsPort:
-    session_factory = _build_session_factory(config)
-    return JobsRepository(session_factory)
+def get_jobs_port(database: Database = Depends(get_database)) -> JobsPort:
+    return JobsRepository(database.session_factory)
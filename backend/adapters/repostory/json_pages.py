@@ -0,0 +1,74 @@
+"""Listing pages rendered to JSON by Postgres, so their rows never become Python objects in the service.
+
+The SQL mirrors the API's Python formatting: field names, timestamps in UTC with a `Z` and
+microseconds only when non-zero, and floats that keep their `.0`. Key order and whitespace
+may differ from orjson's output; the decoded documents are equal.
+"""
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, Integer, Select, Subquery, Text, bindparam, case, cast, func, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import Session
+
+# float8 switches to exponent notation from 1e15 on; beyond that the `.0` suffix does not apply.
+_PLAIN_FLOAT_LIMIT = 1e15
+
+PAGE_LIMIT = bindparam("limit", type_=Integer)
+
+
+def supports_json_pages(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def utc_timestamp_json(column: ColumnElement[Any]) -> ColumnElement[str]:
+    """Format a timestamptz as ISO 8601 in UTC with a `Z`, like `datetime.isoformat` does for the API."""
+    utc = func.timezone("UTC", column)
+    fraction = case((func.date_trunc("second", utc) == utc, ""), else_=func.to_char(utc, ".US"))
+    return func.concat(func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS'), fraction, "Z")
+
+
+def float_json(column: ColumnElement[float]) -> ColumnElement[Any]:
+    """Render a float8 as a JSON number the way Python does; Postgres writes `1.0` as `1`."""
+    integral = (column == func.trunc(column)) & (func.abs(column) < _PLAIN_FLOAT_LIMIT)
+    return cast(func.concat(cast(column, Text), case((integral, ".0"), else_="")), JSON)
+
+
+def json_page_statement(
+    page: Subquery,
+    item: ColumnElement[Any],
+    order_by: Sequence[ColumnElement[Any]],
+    key: Sequence[ColumnElement[Any]],
+) -> Select[Any]:
+    """Aggregate the first `:limit` rows of `page` into a JSON array of `item`, in `order_by` order.
+
+    `page` selects up to `PAGE_LIMIT + 1` rows; the extra row only tells whether another page
+    follows. Building this takes longer than Postgres needs to run it, so callers build each
+    shape once and bind the values per request.
+    """
+    numbered = select(
+        item.label("item"),
+        *(column.label(f"key_{index}") for index, column in enumerate(key)),
+        func.row_number().over(order_by=order_by).label("position"),
+    ).subquery()
+    keys = [numbered.c[f"key_{index}"] for index in range(len(key))]
+    items = func.json_agg(aggregate_order_by(numbered.c.item, numbered.c.position)).filter(
+        numbered.c.position <= PAGE_LIMIT
+    )
+    return select(
+        # Cast to text so the driver hands the array over as a string instead of parsing it.
+        cast(items, Text),
+        func.count(),
+        *(func.max(column).filter(numbered.c.position == PAGE_LIMIT) for column in keys),
+    )
+
+
+def fetch_json_page(
+    session: Session,
+    statement: Select[Any],
+    parameters: dict[str, Any],
+) -> tuple[str, tuple[Any, ...] | None]:
+    """Run a `json_page_statement`; return the array text and, if another page follows, the last row's key."""
+    items_json, rows, *last_key = session.execute(statement, parameters).one()
+    return items_json or "[]", tuple(last_key) if rows > parameters[PAGE_LIMIT.key] else None
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+# Ordered, append-only list of PostgreSQL schema changes that `create_all` cannot apply to existing tables.
+_MIGRATIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "0001_unified_deliveries_identity",
+        (
+            """
+            DELETE FROM unified_deliveries older
+            USING unified_deliveries newer
+            WHERE older.source = newer.source
+              AND older.delivery_id = newer.delivery_id
+              AND older.site_id = newer.site_id
+              AND older.id < newer.id
+            """,
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_unified_deliveries_identity
+            ON unified_deliveries (source, delivery_id, site_id)
+            """,
+        ),
+    ),
+    (
+        "0002_keyset_pagination_indexes",
+        (
+            "CREATE INDEX IF NOT EXISTS ix_unified_deliveries_score_keyset ON unified_deliveries ((-delivery_score), id)",
+            "CREATE INDEX IF NOT EXISTS ix_jobs_created_at_keyset ON jobs (created_at, id)",
+        ),
+    ),
+    (
+        "0003_table_row_counts",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS table_row_counts (
+                table_name VARCHAR(64) PRIMARY KEY,
+                row_count BIGINT NOT NULL
+            )
+            """,
+            """
+            INSERT INTO table_row_counts (table_name, row_count)
+            SELECT 'unified_deliveries', count(*) FROM unified_deliveries
+            UNION ALL
+            SELECT 'jobs', count(*) FROM jobs
+            ON CONFLICT (table_name) DO UPDATE SET row_count = EXCLUDED.row_count
+            """,
+        ),
+    ),
+    (
+        "0004_unified_deliveries_timestamptz_and_indexes",
+        (
+            """
+            ALTER TABLE unified_deliveries
+            ALTER COLUMN delivered_at TYPE TIMESTAMPTZ USING delivered_at::timestamptz
+            """,
+            # Superseded by ix_unified_deliveries_job_score, which has job_id as its prefix.
+            "DROP INDEX IF EXISTS ix_unified_deliveries_job_id",
+            "CREATE INDEX IF NOT EXISTS ix_unified_deliveries_site_delivered_at ON unified_deliveries (site_id, delivered_at)",
+            "CREATE INDEX IF NOT EXISTS ix_unified_deliveries_supplier_status ON unified_deliveries (supplier, status)",
+            "CREATE INDEX IF NOT EXISTS ix_unified_deliveries_job_score ON unified_deliveries (job_id, (-delivery_score), id)",
+        ),
+    ),
+)
+
+# Arbitrary constant key serialising concurrent migration runs across processes.
+_MIGRATIONS_LOCK_KEY = 7_301_142
+
+
+def run_migrations(engine: Engine) -> None:
+    """Apply pending migrations once per database; a no-op for non-PostgreSQL engines."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        # Rewrites, index builds and waiting on another replica's lock may take longer than DB_STATEMENT_TIMEOUT_MS.
+        connection.execute(text("SET LOCAL statement_timeout = 0"))
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATIONS_LOCK_KEY})
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version VARCHAR(128) PRIMARY KEY, "
+                "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+            ),
+        )
+        applied = set(connection.scalars(text("SELECT version FROM schema_migrations")))
+        for version, statements in _MIGRATIONS:
+            if version in applied:
+                continue
+            logger.info("Applying schema migration %s.", version)
+            for statement in statements:
+                connection.execute(text(statement))
+            connection.execute(text("INSERT INTO schema_migrations (version) VALUES (:version)"), {"version": version})
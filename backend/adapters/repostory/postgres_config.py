@@ -9,6 +9,19 @@ from backend.shared.config.settings import get_settings, Settings
 
 class PostgresConfig(BaseModel):
     postgres_dsn: str
+    insert_batch_size: int = 1000
+    copy_threshold: int | None = None
+    # Rows fetched per round trip from the server-side cursor of an export.
+    export_batch_size: int = 2000
+    pool_size: int = 5
+    max_overflow: int = 10
+    # Seconds after which a pooled connection is replaced; -1 keeps connections forever.
+    pool_recycle: int = 1800
+    pool_timeout: float = 30.0
+    # Connections opened at startup; capped at `pool_size` since overflow connections are not kept.
+    pool_warmup: int = 5
+    # Server-side statement_timeout in milliseconds; 0 disables it. Migrations and COPY stores lift it.
+    statement_timeout_ms: int = 30_000
 
     model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
@@ -20,4 +33,15 @@ def get_postgres_config() -> PostgresConfig:
             f"postgresql+psycopg://{settings.postgres_user}:{settings.postgres_password}"
             f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}"
         )
-    return PostgresConfig(postgres_dsn=database_url)
+    return PostgresConfig(
+        postgres_dsn=database_url,
+        insert_batch_size=settings.db_insert_batch_size,
+        copy_threshold=settings.db_copy_threshold,
+        export_batch_size=settings.db_export_batch_size,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+        pool_warmup=settings.db_pool_size if settings.db_pool_warmup is None else settings.db_pool_warmup,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+    )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import BigInteger, ColumnElement, String, func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.domain.count_mode import CountMode
+
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class TableRowCountModel(Base):
+    """Row count per table, maintained in the same transaction as the inserts it counts."""
+
+    __tablename__ = "table_row_counts"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    row_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+def increment_row_count(session: Session, table_name: str, delta: int) -> None:
+    """Add `delta` to the counter of `table_name` within the caller's transaction."""
+    if not delta:
+        return
+    table = TableRowCountModel.__table__
+    stmt = _UPSERT_INSERTS[session.get_bind().dialect.name](table).values(table_name=table_name, row_count=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.table_name],
+        set_={"row_count": table.c.row_count + stmt.excluded.row_count},
+    )
+    session.execute(stmt)
+
+
+def count_rows(
+    session: Session,
+    model: type[Base],
+    mode: CountMode,
+    where: Sequence[ColumnElement[bool]] = (),
+) -> tuple[int | None, CountMode]:
+    """Count the rows of `model`'s table with `mode` and return the count with the mode actually used.
+
+    Estimates come from the planner statistics in `pg_class` and fall back to an exact count
+    outside PostgreSQL or before the table has been analyzed. Counters and estimates cover the
+    whole table, so a filtered count (`where`) is always exact.
+    """
+    table_name = model.__tablename__
+    if mode is CountMode.NONE:
+        return None, mode
+    if where:
+        return session.scalar(select(func.count()).select_from(model).where(*where)) or 0, CountMode.EXACT
+    if mode is CountMode.COUNTER:
+        row_count = session.scalar(
+            select(TableRowCountModel.row_count).where(TableRowCountModel.table_name == table_name),
+        )
+        return row_count or 0, mode
+    if mode is CountMode.ESTIMATED and session.get_bind().dialect.name == "postgresql":
+        estimate = session.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        )
+        if estimate is not None and estimate >= 0:
+            return estimate, mode
+    return session.scalar(select(func.count()).select_from(model)) or 0, CountMode.EXACT
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable
+
+import pyarrow as pa
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from backend.adapters.repostory.database import get_async_database
+from backend.adapters.repostory.postgres_config import get_postgres_config
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import (
+    delivery_columns,
+    delivery_items,
+    export_statement,
+    get_unified_deliveries_port,
+    list_deliveries_json_page,
+    list_deliveries_page,
+)
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.ports.async_unified_deliveries_port import AsyncUnifiedDeliveriesPort
+from backend.ports.unified_deliveries_port import UnifiedDeliveriesPort
+from backend.shared.config.settings import get_settings
+
+
+class AsyncUnifiedDeliveriesRepository(AsyncUnifiedDeliveriesPort):
+    """List deliveries over the asyncio engine, running the query shared with `UnifiedDeliveriesRepository`."""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], export_batch_size: int = 2000) -> None:
+        self._session_factory = session_factory
+        self._export_batch_size = export_batch_size
+
+    async def list_deliveries(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> Page:
+        async with self._session_factory() as session:
+            return await session.run_sync(
+                list_deliveries_page, limit, offset, cursor, count_mode, delivery_filter
+            )
+
+    async def list_deliveries_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> JsonPage:
+        async with self._session_factory() as session:
+            return await session.run_sync(
+                list_deliveries_json_page, limit, offset, cursor, count_mode, delivery_filter
+            )
+
+    async def export_deliveries(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        async with self._session_factory() as session:
+            result = await session.stream(export_statement(delivery_filter, self._export_batch_size))
+            async for rows in result.partitions():
+                yield delivery_items(rows)
+
+    async def export_delivery_batches(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[pa.RecordBatch]:
+        async with self._session_factory() as session:
+            result = await session.stream(export_statement(delivery_filter, self._export_batch_size))
+            async for rows in result.partitions():
+                yield delivery_columns(rows)
+
+
+class ThreadedUnifiedDeliveriesRepository(AsyncUnifiedDeliveriesPort):
+    """List deliveries with the synchronous repository on the worker thread pool, like a sync handler would."""
+
+    def __init__(self, unified_deliveries_port: UnifiedDeliveriesPort) -> None:
+        self._unified_deliveries_port = unified_deliveries_port
+
+    async def list_deliveries(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> Page:
+        return await run_in_threadpool(
+            self._unified_deliveries_port.list_deliveries, limit, offset, cursor, count_mode, delivery_filter
+        )
+
+    async def list_deliveries_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> JsonPage:
+        return await run_in_threadpool(
+            self._unified_deliveries_port.list_deliveries_json, limit, offset, cursor, count_mode, delivery_filter
+        )
+
+    def export_deliveries(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        return iterate_in_threadpool(self._unified_deliveries_port.export_deliveries(delivery_filter))
+
+    def export_delivery_batches(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[pa.RecordBatch]:
+        return iterate_in_threadpool(self._unified_deliveries_port.export_delivery_batches(delivery_filter))
+
+
+@lru_cache
+def get_async_unified_deliveries_port(
+    unified_deliveries_port: UnifiedDeliveriesPort = Depends(get_unified_deliveries_port),
+) -> AsyncUnifiedDeliveriesPort:
+    if get_settings().db_async_enabled:
+        return AsyncUnifiedDeliveriesRepository(
+            get_async_database().session_factory, export_batch_size=get_postgres_config().export_batch_size
+        )
+    return ThreadedUnifiedDeliveriesRepository(unified_deliveries_port)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Float, Integer, String
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.adapters.repostory.jobs.job_model import Base
@@ -10,14 +12,31 @@ class UnifiedDeliveryModel(Base):
     """SQLAlchemy model representing a stored unified delivery."""
 
     __tablename__ = "unified_deliveries"
+    __table_args__ = (
+        UniqueConstraint("source", "delivery_id", "site_id", name="uq_unified_deliveries_identity"),
+        Index("ix_unified_deliveries_site_delivered_at", "site_id", "delivered_at"),
+        Index("ix_unified_deliveries_supplier_status", "supplier", "status"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    job_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    job_id: Mapped[str] = mapped_column(String(36), nullable=False)
     delivery_id: Mapped[str] = mapped_column(String(128), nullable=False)
     supplier: Mapped[str] = mapped_column(String(128), nullable=False)
-    delivered_at: Mapped[str] = mapped_column(String(64), nullable=False)
+    delivered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     status: Mapped[str] = mapped_column(String(64), nullable=False)
     signed: Mapped[bool] = mapped_column(Boolean, nullable=False)
     site_id: Mapped[str] = mapped_column(String(128), nullable=False)
     source: Mapped[str] = mapped_column(String(64), nullable=False)
     delivery_score: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+# Score ordering for keyset pagination: score descending then id ascending. Negating the score
+# lets a single row comparison walk the index in one direction. The job index carries the same
+# key so a job's deliveries come back in listing order without a sort.
+Index("ix_unified_deliveries_score_keyset", -UnifiedDeliveryModel.delivery_score, UnifiedDeliveryModel.id)
+Index(
+    "ix_unified_deliveries_job_score",
+    UnifiedDeliveryModel.job_id,
+    -UnifiedDeliveryModel.delivery_score,
+    UnifiedDeliveryModel.id,
+)
@@ -1,97 +1,466 @@
 from __future__ import annotations
 
-from datetime import datetime
+import operator
+import time
+from collections import defaultdict
 from functools import lru_cache
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Sequence
 from uuid import UUID
 
+import pyarrow as pa
 from fastapi import Depends
-from sqlalchemy import create_engine, func, select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Boolean, ColumnElement, Select, bindparam, func, literal_column, or_, select, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
 
-from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.database import Database, get_database
+from backend.adapters.repostory.json_pages import (
+    PAGE_LIMIT,
+    fetch_json_page,
+    float_json,
+    json_page_statement,
+    supports_json_pages,
+    utc_timestamp_json,
+)
 from backend.adapters.repostory.postgres_config import (
     PostgresConfig,
     get_postgres_config,
 )
+from backend.adapters.repostory.row_counts import count_rows, increment_row_count
 from backend.adapters.repostory.unified_deliveries.unified_delivery_model import (
     UnifiedDeliveryModel,
 )
-from backend.domain.unified_delivery import UnifiedDelivery, compute_delivery_score
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.domain.store_result import StoreResult
+from backend.domain.unified_delivery import UnifiedDelivery
 from backend.ports.unified_deliveries_port import UnifiedDeliveriesPort
+from backend.shared.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from backend.shared.utils.columnar_export import delivery_record_batch
+from backend.shared.utils.date_utils import to_utc
+from backend.shared.utils.iter_utils import batched
+from backend.shared.utils.json_response import to_json
+from backend.shared.utils.metrics import DB_INSERT_BATCH_SECONDS, DB_ROWS_WRITTEN
+
+_COPY_COLUMNS = (
+    "job_id",
+    "delivery_id",
+    "supplier",
+    "delivered_at",
+    "status",
+    "signed",
+    "site_id",
+    "source",
+    "delivery_score",
+)
+_IDENTITY_COLUMNS = ("source", "delivery_id", "site_id")
+_CONTENT_COLUMNS = ("supplier", "delivered_at", "status", "signed", "delivery_score")
+_STAGING_TABLE = "unified_deliveries_staging"
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_INSERTED_FLAG = literal_column("xmax = 0", Boolean).label("inserted")
+_KEYSET_ORDER = (-UnifiedDeliveryModel.delivery_score, UnifiedDeliveryModel.id)
+_LISTED_COLUMNS = (
+    UnifiedDeliveryModel.id,
+    UnifiedDeliveryModel.delivery_id,
+    UnifiedDeliveryModel.supplier,
+    UnifiedDeliveryModel.delivered_at,
+    UnifiedDeliveryModel.status,
+    UnifiedDeliveryModel.signed,
+    UnifiedDeliveryModel.site_id,
+    UnifiedDeliveryModel.source,
+    UnifiedDeliveryModel.delivery_score,
+)
+# How each `DeliveryFilter` field compares a column with its value.
+_FILTER_COMPARISONS = {
+    "site_id": (UnifiedDeliveryModel.site_id, operator.eq),
+    "supplier": (UnifiedDeliveryModel.supplier, operator.eq),
+    "status": (UnifiedDeliveryModel.status, operator.eq),
+    "job_id": (UnifiedDeliveryModel.job_id, operator.eq),
+    "delivered_from": (UnifiedDeliveryModel.delivered_at, operator.ge),
+    "delivered_to": (UnifiedDeliveryModel.delivered_at, operator.lt),
+}
+# The same conditions on bound parameters named after the fields, for cached statements.
+_FILTER_CONDITIONS = {
+    name: compare(column, bindparam(name)) for name, (column, compare) in _FILTER_COMPARISONS.items()
+}
+_COUNT_EXISTING = (
+    select(func.count())
+    .select_from(UnifiedDeliveryModel)
+    .where(
+        UnifiedDeliveryModel.source == bindparam("source"),
+        UnifiedDeliveryModel.site_id == bindparam("site_id"),
+        UnifiedDeliveryModel.delivery_id.in_(bindparam("delivery_ids", expanding=True)),
+    )
+)
 
 
 class UnifiedDeliveriesRepository(UnifiedDeliveriesPort):
     """Persist unified deliveries in a Postgres-backed table."""
 
-    def __init__(self, session_factory: Callable[[], Session]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 1000,
+        copy_threshold: int | None = None,
+        export_batch_size: int = 2000,
+    ) -> None:
         self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._copy_threshold = copy_threshold
+        self._export_batch_size = export_batch_size
 
     def store(self, job_id: UUID, unified_delivery: UnifiedDelivery) -> None:
+        self.store_many(job_id, [unified_delivery])
+
+    def store_many(self, job_id: UUID, unified_deliveries: Sequence[UnifiedDelivery]) -> StoreResult:
+        """Upsert deliveries on (source, delivery_id, site_id); rows whose content is unchanged are not rewritten."""
+        if not unified_deliveries:
+            return StoreResult()
         with self._session_factory() as session:
-            model = self._to_model(job_id, unified_delivery)
-            session.add(model)
+            if self._should_copy(session, len(unified_deliveries)):
+                started = time.perf_counter()
+                result = self._copy_many(session, job_id, unified_deliveries)
+                DB_INSERT_BATCH_SECONDS.labels("copy").observe(time.perf_counter() - started)
+            else:
+                result = StoreResult()
+                for batch in batched(unified_deliveries, self._batch_size):
+                    rows = _unique_by_identity(self._to_row(job_id, unified_delivery) for unified_delivery in batch)
+                    started = time.perf_counter()
+                    result += self._upsert_batch(session, rows)
+                    DB_INSERT_BATCH_SECONDS.labels("upsert").observe(time.perf_counter() - started)
+            increment_row_count(session, UnifiedDeliveryModel.__tablename__, result.inserted)
             session.commit()
+        DB_ROWS_WRITTEN.labels("inserted").inc(result.inserted)
+        DB_ROWS_WRITTEN.labels("updated").inc(result.updated)
+        return result
+
+    @staticmethod
+    def _upsert_batch(session: Session, rows: list[dict[str, Any]]) -> StoreResult:
+        dialect = session.get_bind().dialect.name
+        table = UnifiedDeliveryModel.__table__
+        stmt = _UPSERT_INSERTS[dialect](table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(_IDENTITY_COLUMNS),
+            set_={name: stmt.excluded[name] for name in ("job_id", *_CONTENT_COLUMNS)},
+            where=or_(*(table.c[name].is_distinct_from(stmt.excluded[name]) for name in _CONTENT_COLUMNS)),
+        )
+        # Only inserted rows and rows actually updated by the conflict clause are returned.
+        if dialect == "postgresql":
+            # xmax is 0 only for freshly inserted tuples, which separates inserts from updates in one round trip.
+            inserted_flags = session.execute(stmt.returning(_INSERTED_FLAG), rows).scalars().all()
+            return _store_result(len(rows), len(rows) - sum(inserted_flags), len(inserted_flags))
+        existing = sum(
+            session.scalar(
+                _COUNT_EXISTING,
+                {"source": source, "site_id": site_id, "delivery_ids": delivery_ids},
+            ) or 0
+            for (source, site_id), delivery_ids in _delivery_ids_by_scope(rows).items()
+        )
+        written = len(session.execute(stmt.returning(table.c.id), rows).all())
+        return _store_result(len(rows), existing, written)
+
+    def _should_copy(self, session: Session, row_count: int) -> bool:
+        return (
+            self._copy_threshold is not None
+            and row_count >= self._copy_threshold
+            and session.get_bind().dialect.name == "postgresql"
+        )
 
-    def list_deliveries(self, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
+    def _copy_many(
+        self,
+        session: Session,
+        job_id: UUID,
+        unified_deliveries: Sequence[UnifiedDelivery],
+    ) -> StoreResult:
+        """Stream rows with COPY FROM STDIN into a transaction-scoped staging table, then upsert them.
+
+        The staging table is dropped on commit and discarded on rollback, so a failed COPY
+        leaves `unified_deliveries` untouched. DB_STATEMENT_TIMEOUT_MS is lifted for the rest of
+        the transaction: it bounds request queries, and a bulk load this size may take longer.
+        """
+        table = UnifiedDeliveryModel.__tablename__
+        session.execute(text("SET LOCAL statement_timeout = 0"))
+        columns = ", ".join(_COPY_COLUMNS)
+        identity = ", ".join(_IDENTITY_COLUMNS)
+        session.execute(
+            text(
+                f"CREATE TEMP TABLE {_STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            ),
+        )
+        session.execute(text(f"ALTER TABLE {_STAGING_TABLE} ADD COLUMN staged_order BIGSERIAL"))
+        dbapi_connection = session.connection().connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN") as copy:
+                for unified_delivery in unified_deliveries:
+                    row = self._to_row(job_id, unified_delivery)
+                    copy.write_row(tuple(row[column] for column in _COPY_COLUMNS))
+        staged, inserted, written = session.execute(
+            text(
+                f"WITH upserted AS ("
+                f"INSERT INTO {table} ({columns}) "
+                f"SELECT DISTINCT ON ({identity}) {columns} FROM {_STAGING_TABLE} "
+                f"ORDER BY {identity}, staged_order DESC "
+                f"ON CONFLICT ({identity}) DO UPDATE SET "
+                + ", ".join(f"{name} = EXCLUDED.{name}" for name in ("job_id", *_CONTENT_COLUMNS))
+                + f" WHERE ({', '.join(f'{table}.{name}' for name in _CONTENT_COLUMNS)}) "
+                f"IS DISTINCT FROM ({', '.join(f'EXCLUDED.{name}' for name in _CONTENT_COLUMNS)}) "
+                f"RETURNING (xmax = 0) AS inserted) "
+                f"SELECT (SELECT count(*) FROM (SELECT DISTINCT {identity} FROM {_STAGING_TABLE}) AS staged_keys), "
+                f"count(*) FILTER (WHERE inserted), count(*) FROM upserted"
+            ),
+        ).one()
+        existing = staged - inserted
+        return _store_result(staged, existing, written)
+
+    def list_deliveries(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> Page:
+        """Return deliveries by score descending then id; a `cursor` resumes after a previous page via the keyset index."""
+        with self._session_factory() as session:
+            return list_deliveries_page(session, limit, offset, cursor, count_mode, delivery_filter)
+
+    def list_deliveries_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> JsonPage:
+        with self._session_factory() as session:
+            return list_deliveries_json_page(session, limit, offset, cursor, count_mode, delivery_filter)
+
+    def export_deliveries(self, delivery_filter: DeliveryFilter | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Yield every matching delivery in id order, `export_batch_size` at a time, from a server-side cursor."""
+        with self._session_factory() as session:
+            result = session.execute(export_statement(delivery_filter, self._export_batch_size))
+            for rows in result.partitions():
+                yield delivery_items(rows)
+
+    def export_delivery_batches(self, delivery_filter: DeliveryFilter | None = None) -> Iterator[pa.RecordBatch]:
+        """Like `export_deliveries`, with each batch transposed into an Arrow record batch."""
         with self._session_factory() as session:
-            total = session.scalar(select(func.count()).select_from(UnifiedDeliveryModel)) or 0
-            stmt = (
-                select(UnifiedDeliveryModel)
-                .order_by(UnifiedDeliveryModel.delivery_score.desc(), UnifiedDeliveryModel.id.asc())
-                .offset(offset)
-                .limit(limit)
-            )
-            deliveries = session.scalars(stmt).all()
-            items: list[dict[str, Any]] = []
-            for delivery in deliveries:
-                items.append(
-                    {
-                        "jobId": delivery.job_id,
-                        "id": delivery.delivery_id,
-                        "supplier": delivery.supplier,
-                        "deliveredAt": delivery.delivered_at,
-                        "status": delivery.status,
-                        "signed": delivery.signed,
-                        "siteId": delivery.site_id,
-                        "source": delivery.source,
-                        "deliveryScore": float(delivery.delivery_score),
-                    },
-                )
-        return items, total
+            result = session.execute(export_statement(delivery_filter, self._export_batch_size))
+            for rows in result.partitions():
+                yield delivery_columns(rows)
 
     @staticmethod
-    def _to_model(job_id: UUID, unified_delivery: UnifiedDelivery) -> UnifiedDeliveryModel:
-        delivered_at = unified_delivery.delivered_at
-        if isinstance(delivered_at, str):
-            normalized = delivered_at.replace("Z", "+00:00")
-            delivered_at_dt = datetime.fromisoformat(normalized)
-        else:
-            delivered_at_dt = delivered_at
-
-        delivery_score = compute_delivery_score(delivered_at_dt, unified_delivery.signed)
-        return UnifiedDeliveryModel(
-            job_id=str(job_id),
-            delivery_id=unified_delivery.id,
-            supplier=unified_delivery.supplier,
-            delivered_at=unified_delivery.delivered_at if isinstance(unified_delivery.delivered_at, str) else unified_delivery.delivered_at.isoformat(),
-            status=unified_delivery.status,
-            signed=unified_delivery.signed,
-            site_id=unified_delivery.siteId,
-            source=unified_delivery.source,
-            delivery_score=delivery_score,
+    def _to_row(job_id: UUID, unified_delivery: UnifiedDelivery) -> dict[str, Any]:
+        return {
+            "job_id": str(job_id),
+            "delivery_id": unified_delivery.id,
+            "supplier": unified_delivery.supplier,
+            "delivered_at": to_utc(unified_delivery.delivered_at),
+            "status": unified_delivery.status,
+            "signed": unified_delivery.signed,
+            "site_id": unified_delivery.siteId,
+            "source": unified_delivery.source,
+            "delivery_score": unified_delivery.delivery_score,
+        }
+
+
+def list_deliveries_page(
+    session: Session,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count_mode: CountMode,
+    delivery_filter: DeliveryFilter | None,
+) -> Page:
+    """Query one page of deliveries in the shape the API returns; shared by the synchronous and asyncio repositories.
+
+    `deliveredAt` is an aware UTC datetime.
+    """
+    where = _filter_clauses(delivery_filter) if delivery_filter is not None else []
+    total, count_mode = count_rows(session, UnifiedDeliveryModel, count_mode, where)
+    rows = session.execute(_page_statement(where, limit, offset, cursor)).all()
+    items = delivery_items(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(-last.delivery_score, last.id)
+    # The items were built here, so validating them would only copy every dict again.
+    return Page.model_construct(items=items, total=total, count_mode=count_mode, next_cursor=next_cursor)
+
+
+def delivery_items(rows: Iterable[Row[Any]]) -> list[dict[str, Any]]:
+    """Turn rows of `_LISTED_COLUMNS` into API items; plain rows go straight into the response shape."""
+    return [
+        {
+            "id": delivery_id,
+            "supplier": supplier,
+            "deliveredAt": to_utc(delivered_at),
+            "status": delivery_status,
+            "signed": signed,
+            "siteId": site_id,
+            "source": source,
+            "deliveryScore": float(delivery_score),
+        }
+        for _, delivery_id, supplier, delivered_at, delivery_status, signed, site_id, source, delivery_score in rows
+    ]
+
+
+def delivery_columns(rows: Sequence[Row[Any]]) -> pa.RecordBatch:
+    """Transpose rows of `_LISTED_COLUMNS` into a `DELIVERY_SCHEMA` record batch without building per-row objects."""
+    # The first column is the internal primary key.
+    return delivery_record_batch(list(zip(*rows))[1:])
+
+
+def export_statement(delivery_filter: DeliveryFilter | None, batch_size: int) -> Select[Any]:
+    """Select every delivery matching `delivery_filter` in id order, streamed `batch_size` rows at a time.
+
+    `yield_per` makes the psycopg dialects fetch through a server-side cursor, so memory stays
+    bounded by one batch. The primary key order is stable and needs no sort.
+    """
+    where = _filter_clauses(delivery_filter) if delivery_filter is not None else []
+    return (
+        select(*_LISTED_COLUMNS)
+        .where(*where)
+        .order_by(UnifiedDeliveryModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def list_deliveries_json_page(
+    session: Session,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count_mode: CountMode,
+    delivery_filter: DeliveryFilter | None,
+) -> JsonPage:
+    """Like `list_deliveries_page`, with Postgres rendering the items; elsewhere they are serialized here."""
+    if not supports_json_pages(session):
+        page = list_deliveries_page(session, limit, offset, cursor, count_mode, delivery_filter)
+        return JsonPage(
+            items_json=to_json(page.items).decode(),
+            total=page.total,
+            count_mode=page.count_mode,
+            next_cursor=page.next_cursor,
         )
+    where = _filter_clauses(delivery_filter) if delivery_filter is not None else []
+    total, count_mode = count_rows(session, UnifiedDeliveryModel, count_mode, where)
+    filters = _filter_parameters(delivery_filter) if delivery_filter is not None else {}
+    parameters: dict[str, Any] = {PAGE_LIMIT.key: limit, **filters}
+    if cursor is not None:
+        parameters["negated_score"], parameters["row_id"] = _decode_keyset(cursor)
+    else:
+        parameters["offset"] = offset
+    statement = _json_page_statement(tuple(sorted(filters)), cursor is not None)
+    items_json, last_key = fetch_json_page(session, statement, parameters)
+    next_cursor = None
+    if last_key is not None:
+        delivery_score, row_id = last_key
+        next_cursor = encode_cursor(-delivery_score, row_id)
+    return JsonPage(items_json=items_json, total=total, count_mode=count_mode, next_cursor=next_cursor)
+
+
+@lru_cache(maxsize=None)
+def _json_page_statement(filters: tuple[str, ...], keyset: bool) -> Select[Any]:
+    """The JSON page query for one combination of filters, with every value left as a bound parameter."""
+    stmt = (
+        select(*_LISTED_COLUMNS)
+        .where(*(_FILTER_CONDITIONS[name] for name in filters))
+        .order_by(*_KEYSET_ORDER)
+        .limit(PAGE_LIMIT + 1)
+    )
+    if keyset:
+        stmt = stmt.where(tuple_(*_KEYSET_ORDER) > tuple_(bindparam("negated_score"), bindparam("row_id")))
+    else:
+        stmt = stmt.offset(bindparam("offset"))
+    page = stmt.subquery()
+    item = func.json_build_object(
+        "id", page.c.delivery_id,
+        "supplier", page.c.supplier,
+        "deliveredAt", utc_timestamp_json(page.c.delivered_at),
+        "status", page.c.status,
+        "signed", page.c.signed,
+        "siteId", page.c.site_id,
+        "source", page.c.source,
+        "deliveryScore", float_json(page.c.delivery_score),
+    )
+    return json_page_statement(
+        page,
+        item,
+        order_by=(-page.c.delivery_score, page.c.id),
+        key=(page.c.delivery_score, page.c.id),
+    )
+
+
+def _page_statement(
+    where: Sequence[ColumnElement[bool]],
+    limit: int,
+    offset: int,
+    cursor: str | None,
+) -> Select[Any]:
+    # One row beyond the page tells whether there is a next one.
+    stmt = select(*_LISTED_COLUMNS).where(*where).order_by(*_KEYSET_ORDER).limit(limit + 1)
+    if cursor is not None:
+        return stmt.where(tuple_(*_KEYSET_ORDER) > tuple(_decode_keyset(cursor)))
+    return stmt.offset(offset)
+
+
+def _unique_by_identity(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep the last row per identity; one upsert statement must not touch the same row twice."""
+    return list({tuple(row[column] for column in _IDENTITY_COLUMNS): row for row in rows}.values())
+
+
+def _delivery_ids_by_scope(rows: list[dict[str, Any]]) -> dict[tuple[str, str], list[str]]:
+    delivery_ids_by_scope: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for row in rows:
+        delivery_ids_by_scope[(row["source"], row["site_id"])].append(row["delivery_id"])
+    return delivery_ids_by_scope
+
+
+def _filter_clauses(delivery_filter: DeliveryFilter) -> list[ColumnElement[bool]]:
+    """`_FILTER_COMPARISONS` for the set fields of `delivery_filter`, against their values."""
+    clauses: list[ColumnElement[bool]] = []
+    for name, value in _filter_parameters(delivery_filter).items():
+        column, compare = _FILTER_COMPARISONS[name]
+        clauses.append(compare(column, value))
+    return clauses
+
+
+def _filter_parameters(delivery_filter: DeliveryFilter) -> dict[str, Any]:
+    """The set fields of `delivery_filter`, as values for `_FILTER_CONDITIONS`."""
+    parameters = delivery_filter.model_dump(exclude_none=True)
+    for name in ("delivered_from", "delivered_to"):
+        if name in parameters:
+            parameters[name] = to_utc(parameters[name])
+    return parameters
+
+
+def _decode_keyset(cursor: str) -> tuple[float, int]:
+    negated_score, row_id = decode_cursor(cursor, size=2)
+    if not isinstance(negated_score, (int, float)) or not isinstance(row_id, int):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return float(negated_score), row_id
 
 
-def _build_session_factory(config: PostgresConfig) -> sessionmaker[Session]:
-    engine = create_engine(config.postgres_dsn, future=True, pool_pre_ping=True)
-    Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+def _store_result(rows: int, existing: int, written: int) -> StoreResult:
+    # `written` counts inserted plus actually updated rows; conflicts filtered out by the WHERE clause are skipped.
+    inserted = rows - existing
+    updated = written - inserted
+    return StoreResult(inserted=inserted, updated=updated, unchanged=existing - updated)
 
 
 @lru_cache
 def get_unified_deliveries_port(
     config: PostgresConfig = Depends(get_postgres_config),
+    database: Database = Depends(get_database),
 ) -> UnifiedDeliveriesPort:
-    session_factory = _build_session_factory(config)
-    return UnifiedDeliveriesRepository(session_factory)
+    return UnifiedDeliveriesRepository(
+        database.session_factory,
+        batch_size=config.insert_batch_size,
+        copy_threshold=config.copy_threshold,
+        export_batch_size=config.export_batch_size,
+    )
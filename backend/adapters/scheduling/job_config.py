@@ -38,5 +38,9 @@ def get_default_job_config() -> JobConfig:
         kwargs={
             "site_id": settings.site_id,
             "partner_sources": settings.partner_sources,
+            "partner_deadline": settings.partner_fetch_deadline,
+            "job_deadline": settings.job_deadline,
+            "streaming": settings.partner_streaming_enabled,
+            "stream_batch_size": settings.stream_batch_size,
         },
     )
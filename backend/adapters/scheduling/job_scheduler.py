@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from functools import lru_cache
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import Depends
@@ -20,10 +24,51 @@ from backend.application.use_cases.store_unified_deliveries import (
 )
 from backend.shared.utils.date_utils import Clock, get_utc_clock
 from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats import Stats
+from backend.domain.store_result import StoreResult
+from backend.domain.unified_delivery import UnifiedDelivery
+from backend.shared.utils.memory_utils import peak_rss_bytes
+from backend.shared.utils.metrics import (
+    MAPPING_RECORDS_PER_SECOND,
+    PARTNER_RECORDS,
+    PIPELINE_STAGE_SECONDS,
+    SCHEDULER_JOB_SECONDS,
+    SCHEDULER_JOBS,
+    SCHEDULER_PARTNER_RUNS,
+)
 
 logger = logging.getLogger("uvicorn.error")
 
+_SUCCEEDED = "succeeded"
+_FAILED = "failed"
+_DEADLINE_EXCEEDED = "deadline_exceeded"
+# Reported by a partner task that stopped at the job deadline; the job thread records it as the deadline.
+_ABANDONED = "Abandoned after the job deadline"
+
+
+class _PartnerAbandonedError(Exception):
+    """Raised inside a partner task once the job has stopped waiting for it."""
+
+
+class _PartnerCancellation:
+    """Tells partner tasks that their job has given up on them, so they stop writing deliveries.
+
+    Running tasks cannot be interrupted, so they check before every store. Reaching the job
+    deadline counts as cancelled even before the job thread has noticed it.
+    """
+
+    def __init__(self, deadline_at: float | None) -> None:
+        self._deadline_at = deadline_at
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled.is_set() or _remaining(self._deadline_at) == 0:
+            raise _PartnerAbandonedError()
+
 
 class Scheduler:
     def __init__(
@@ -52,8 +97,36 @@ class Scheduler:
         logger.info("Scheduler started.")
         return scheduler
 
-    def _run_fetch_job(self, site_id: str, partner_sources: set[str]) -> None:
-        """Invoke the fetch use case as the scheduled job."""
+    def _run_fetch_job(
+        self,
+        site_id: str,
+        partner_sources: set[str],
+        partner_deadline: float | None = None,
+        job_deadline: float | None = None,
+        streaming: bool = False,
+        stream_batch_size: int = 1000,
+    ) -> None:
+        """Invoke the fetch use case as the scheduled job, fanning out to all partners concurrently."""
+        started = time.perf_counter()
+        outcome = _FAILED
+        try:
+            outcome = self._fan_out_fetch_job(
+                site_id, partner_sources, partner_deadline, job_deadline, streaming, stream_batch_size
+            )
+        finally:
+            SCHEDULER_JOB_SECONDS.labels(outcome).observe(time.perf_counter() - started)
+            SCHEDULER_JOBS.labels(outcome).inc()
+
+    def _fan_out_fetch_job(
+        self,
+        site_id: str,
+        partner_sources: set[str],
+        partner_deadline: float | None,
+        job_deadline: float | None,
+        streaming: bool,
+        stream_batch_size: int,
+    ) -> str:
+        """Run one fetch job and return its outcome: whether every partner succeeded in time."""
         utc_now = self._clock.get_utc_now()
         job_id = uuid4()
         input: dict[str, str] = {"site_id": site_id, "date": utc_now.isoformat()}
@@ -65,24 +138,169 @@ class Scheduler:
             sorted(partner_sources),
             utc_now.isoformat(),
         )
-        for source in partner_sources:
-            stats: Stats = Stats.for_partner(source)
-            error: str | None = None
-            try:
-                stats, unified_deliveries = self._fetch_deliveries_use_case.fetch_partner_deliveries(
-                    site_id,
-                    source,
+        job_deadline_at = time.monotonic() + job_deadline if job_deadline is not None else None
+        cancellation = _PartnerCancellation(job_deadline_at)
+        executor = ThreadPoolExecutor(max_workers=max(len(partner_sources), 1), thread_name_prefix="partner-fetch")
+        partner_task = (
+            functools.partial(self._stream_and_store_partner_deliveries, batch_size=stream_batch_size)
+            if streaming
+            else self._fetch_and_store_partner_deliveries
+        )
+        futures: dict[Future[tuple[Stats, str | None]], str] = {
+            executor.submit(
+                partner_task,
+                job_id,
+                site_id,
+                source,
+                _partner_timeout(partner_deadline, job_deadline_at),
+                cancellation,
+            ): source
+            for source in partner_sources
+        }
+        pending = set(futures)
+        outcome = _SUCCEEDED
+        deadline_error = f"Job deadline of {job_deadline}s exceeded"
+        try:
+            for future in as_completed(futures, timeout=_remaining(job_deadline_at)):
+                pending.discard(future)
+                stats, error = future.result()
+                if error == _ABANDONED:
+                    # The task saw the deadline pass just before `as_completed` timed out.
+                    self._record_partner_result(job_id, stats, deadline_error, outcome=_DEADLINE_EXCEEDED)
+                    outcome = _DEADLINE_EXCEEDED
+                    continue
+                self._record_partner_result(job_id, stats, error)
+                if error is not None and outcome == _SUCCEEDED:
+                    outcome = _FAILED
+        except FuturesTimeoutError:
+            outcome = _DEADLINE_EXCEEDED
+            # Tasks already running carry on; they must not store rows for a result written off here.
+            cancellation.cancel()
+            for future in pending:
+                source = futures[future]
+                future.cancel()
+                logger.error("Job deadline of %ss exceeded before source %s finished.", job_deadline, source)
+                self._record_partner_result(
+                    job_id, Stats.for_partner(source), deadline_error, outcome=_DEADLINE_EXCEEDED
                 )
-                logger.info("Stored %d unified deliveries for source %s.", len(unified_deliveries), source)
-                self._store_unified_deliveries_use_case.store(job_id, unified_deliveries)
-            except PartnerDeliveryFetchError as exc:
-                logger.error("Failed to fetch deliveries for source %s: %s", source, exc)
-                error = str(exc)
-
-            updated_at = self._clock.get_utc_now()
-            self._job_repository.update_job_stats(job_id, stats, updated_at, error)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         logger.info("Job %s ended at %s.", job_id, utc_now.isoformat())
+        return outcome
+
+    def _fetch_and_store_partner_deliveries(
+        self,
+        job_id: UUID,
+        site_id: str,
+        source: str,
+        timeout: float | None,
+        cancellation: _PartnerCancellation,
+    ) -> tuple[Stats, str | None]:
+        stats: Stats = Stats.for_partner(source)
+        error: str | None = None
+        started = time.perf_counter()
+        try:
+            stats, unified_deliveries = self._fetch_deliveries_use_case.fetch_partner_deliveries(
+                site_id,
+                source,
+                timeout=timeout,
+            )
+            cancellation.raise_if_cancelled()
+            with stats.timed(PipelineStage.STORE):
+                result = self._store_unified_deliveries_use_case.store(job_id, unified_deliveries)
+            stats.record_store_result(result)
+            stats.record_stored(len(unified_deliveries))
+            logger.info("Stored %d unified deliveries for source %s.", len(unified_deliveries), source)
+        except _PartnerAbandonedError:
+            logger.warning("Discarded deliveries for source %s fetched after the job deadline.", source)
+            error = _ABANDONED
+        except PartnerDeliveryFetchError as exc:
+            logger.error("Failed to fetch deliveries for source %s: %s", source, exc)
+            error = str(exc)
+        except Exception as exc:
+            logger.exception("Unexpected error processing deliveries for source %s.", source)
+            error = str(exc)
+        finally:
+            stats.record_throughput(time.perf_counter() - started, peak_rss_bytes())
+        return stats, error
+
+    def _stream_and_store_partner_deliveries(
+        self,
+        job_id: UUID,
+        site_id: str,
+        source: str,
+        timeout: float | None,
+        cancellation: _PartnerCancellation,
+        batch_size: int,
+    ) -> tuple[Stats, str | None]:
+        stats: Stats = Stats.for_partner(source)
+        error: str | None = None
+
+        def store_batch(batch: list[UnifiedDelivery]) -> StoreResult:
+            cancellation.raise_if_cancelled()
+            return self._store_unified_deliveries_use_case.store(job_id, batch)
+
+        try:
+            self._fetch_deliveries_use_case.stream_partner_deliveries(
+                site_id,
+                source,
+                stats,
+                batch_size,
+                store_batch,
+                timeout=timeout,
+            )
+            logger.info("Stored %d unified deliveries for source %s.", stats.stored, source)
+        except _PartnerAbandonedError:
+            logger.warning("Stopped streaming source %s after the job deadline; %d stored.", source, stats.stored)
+            error = _ABANDONED
+        except PartnerDeliveryFetchError as exc:
+            logger.error("Failed to stream deliveries for source %s: %s", source, exc)
+            error = str(exc)
+        except Exception as exc:
+            logger.exception("Unexpected error processing deliveries for source %s.", source)
+            error = str(exc)
+        return stats, error
+
+    def _record_partner_result(
+        self,
+        job_id: UUID,
+        stats: Stats,
+        error: str | None,
+        outcome: str | None = None,
+    ) -> None:
+        updated_at = self._clock.get_utc_now()
+        self._job_repository.update_job_stats(job_id, stats, updated_at, error)
+        _observe_partner_run(stats, outcome or (_SUCCEEDED if error is None else _FAILED))
+
+
+def _observe_partner_run(stats: Stats, outcome: str) -> None:
+    source = stats.partner
+    SCHEDULER_PARTNER_RUNS.labels(source, outcome).inc()
+    PARTNER_RECORDS.labels(source, "mapped").inc(stats.transformed)
+    PARTNER_RECORDS.labels(source, "rejected").inc(stats.errors)
+    for stage, seconds in stats.stage_seconds.items():
+        PIPELINE_STAGE_SECONDS.labels(source, stage.value).observe(seconds)
+    map_seconds = stats.seconds_in(PipelineStage.MAP)
+    if stats.transformed and map_seconds > 0:
+        MAPPING_RECORDS_PER_SECOND.labels(source).observe(stats.transformed / map_seconds)
+
+
+def _remaining(deadline_at: float | None) -> float | None:
+    if deadline_at is None:
+        return None
+    return max(deadline_at - time.monotonic(), 0.0)
+
+
+def _partner_timeout(partner_deadline: float | None, job_deadline_at: float | None) -> float | None:
+    """Per-partner budget, capped by whatever is left of the job deadline."""
+    job_remaining = _remaining(job_deadline_at)
+    if partner_deadline is None:
+        return job_remaining
+    if job_remaining is None:
+        return partner_deadline
+    return min(partner_deadline, job_remaining)
+
 
 @lru_cache
 def get_job_scheduler(
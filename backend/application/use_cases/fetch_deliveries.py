@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Executor
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 from fastapi import Depends
 
@@ -10,12 +12,18 @@ from backend.application.use_cases.mapper.partner_delivery_mapper import (
     PartnerDeliveryMapper,
     get_partner_delivery_mapper,
 )
+from backend.application.use_cases.mapping_pool import get_mapping_executor
 from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
 from backend.adapters.outbound.partners.fetch_partner_deliveries_http_adapter import get_fetch_partner_deliveries_port
 from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.pipeline_stage import PipelineStage
 from backend.ports.fetch_partner_deliveries_port import FetchPartnerDeliveriesPort
 from backend.domain.stats import Stats
+from backend.domain.store_result import StoreResult
 from backend.domain.unified_delivery import UnifiedDelivery
+from backend.shared.config.settings import get_settings
+from backend.shared.utils.iter_utils import batched
+from backend.shared.utils.memory_utils import peak_rss_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -24,30 +32,92 @@ class FetchPartnerDeliveriesUseCase:
     def __init__(
             self,
             fetch_partner_deliveries_port: FetchPartnerDeliveriesPort,
-            partner_delivery_mapper: PartnerDeliveryMapper
+            partner_delivery_mapper: PartnerDeliveryMapper,
+            columnar_batch_size: int | None = None,
+            mapping_executor: Executor | None = None,
+            pool_chunk_size: int = 50_000,
     ) -> None:
         self._fetch_partner_deliveries_port = fetch_partner_deliveries_port
         self._partner_delivery_mapper = partner_delivery_mapper
-        self._partner_delivery_processor = PartnerDeliveryProcessor(partner_delivery_mapper)
+        self._partner_delivery_processor = PartnerDeliveryProcessor(
+            partner_delivery_mapper,
+            columnar_batch_size=columnar_batch_size,
+            executor=mapping_executor,
+            pool_chunk_size=pool_chunk_size,
+        )
 
     def fetch_partner_deliveries(
         self,
         site_id: str,
         source: str,
+        timeout: float | None = None,
     ) -> Tuple[Stats, List[UnifiedDelivery]]:
         logger.info("Fetching partner deliveries for site %s from source %s", site_id, source)
-        delivery: PartnerDelivery = self._fetch_partner_deliveries_port.fetch(source)
+        started = time.perf_counter()
+        delivery: PartnerDelivery = self._fetch_partner_deliveries_port.fetch(source, timeout=timeout)
+        fetched_at = time.perf_counter()
         unified_deliveries, stats = self._partner_delivery_processor.process(
             delivery=delivery,
             source=source,
             site_id=site_id,
         )
+        stats.record_stage(PipelineStage.MAP, time.perf_counter() - fetched_at)
+        # The adapter decodes the body as part of the fetch and reports that time separately.
+        stats.record_stage(PipelineStage.FETCH, fetched_at - started - delivery.decode_seconds)
         return stats, unified_deliveries
 
+    def stream_partner_deliveries(
+        self,
+        site_id: str,
+        source: str,
+        stats: Stats,
+        batch_size: int,
+        on_batch: Callable[[List[UnifiedDelivery]], StoreResult],
+        timeout: float | None = None,
+    ) -> None:
+        """Stream, map and hand over partner deliveries in batches of at most `batch_size`.
+
+        `stats` is updated in place so progress made before a mid-stream failure is kept. Fetch,
+        decode and map interleave record by record; the port times the first two, and the rest
+        of the time spent producing a batch is counted as mapping.
+        """
+        logger.info("Streaming partner deliveries for site %s from source %s", site_id, source)
+        started = time.perf_counter()
+        try:
+            records = self._fetch_partner_deliveries_port.stream(source, timeout=timeout, stats=stats)
+            unified_deliveries = self._partner_delivery_processor.process_stream(
+                records=records,
+                source=source,
+                site_id=site_id,
+                stats=stats,
+            )
+            batches = batched(unified_deliveries, batch_size)
+            while True:
+                producing_since = time.perf_counter()
+                upstream_seconds = stats.seconds_in(PipelineStage.FETCH, PipelineStage.DECODE)
+                batch = next(batches, None)
+                upstream_seconds = stats.seconds_in(PipelineStage.FETCH, PipelineStage.DECODE) - upstream_seconds
+                stats.record_stage(PipelineStage.MAP, time.perf_counter() - producing_since - upstream_seconds)
+                if batch is None:
+                    break
+                with stats.timed(PipelineStage.STORE):
+                    result = on_batch(batch)
+                stats.record_store_result(result)
+                stats.record_stored(len(batch))
+        finally:
+            stats.record_throughput(time.perf_counter() - started, peak_rss_bytes())
+
 
 @lru_cache
 def get_fetch_partner_deliveries_use_case(
         fetch_partner_deliveries_port: FetchPartnerDeliveriesPort = Depends(get_fetch_partner_deliveries_port),
         partner_delivery_mapper: PartnerDeliveryMapper = Depends(get_partner_delivery_mapper)
 ) -> FetchPartnerDeliveriesUseCase:
-    return FetchPartnerDeliveriesUseCase(fetch_partner_deliveries_port, partner_delivery_mapper)
+    settings = get_settings()
+    return FetchPartnerDeliveriesUseCase(
+        fetch_partner_deliveries_port,
+        partner_delivery_mapper,
+        columnar_batch_size=settings.columnar_batch_size if settings.columnar_mapping_enabled else None,
+        mapping_executor=get_mapping_executor(),
+        pool_chunk_size=settings.process_pool_chunk_size,
+    )
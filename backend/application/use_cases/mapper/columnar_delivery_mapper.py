@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from backend.domain.unified_delivery import UnifiedDelivery
+from backend.shared.utils.date_utils import parse_iso8601_utc
+
+_MISSING = object()
+_MORNING_START = np.timedelta64(5, "h")
+_MORNING_END = np.timedelta64(11, "h")
+
+# `YYYY-MM-DDTHH:MM:SSZ` and `YYYY-MM-DDTHH:MM:SS±HH:MM`, the shapes parsed without Python code per value.
+_ZULU_LENGTH = 20
+_OFFSET_LENGTH = 25
+_DATE_TIME_LENGTH = 19
+_DATE_TIME_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_DATE_TIME_SEPARATORS = {4: "-", 7: "-", 10: "T", 13: ":", 16: ":"}
+_OFFSET_DIGITS = [20, 21, 23, 24]
+# Years outside this range are left to the per-value parser, which owns the edge cases of `datetime`.
+_MIN_YEAR = 1900
+_MAX_YEAR = 9998
+
+# Result of mapping one batch: the valid deliveries in input order and a mask over the input records.
+ColumnarResult = tuple[list[UnifiedDelivery], np.ndarray]
+
+
+def column(records: Sequence[Any], key: str, default: Any = _MISSING) -> list[Any]:
+    """Extract one field of every record; non-dict records and missing keys yield a sentinel that fails validation."""
+    return [record.get(key, default) if isinstance(record, dict) else _MISSING for record in records]
+
+
+def map_columns(
+    *,
+    source: str,
+    site_id: str,
+    ids: list[Any],
+    suppliers: list[Any],
+    timestamps: list[Any],
+    statuses: list[Any],
+    signed: list[bool | None],
+    normalize_status: Callable[[str], str],
+) -> ColumnarResult:
+    """Map a batch of partner records given as columns into unified deliveries.
+
+    Timestamps are parsed and converted to UTC as arrays, the delivery score and the validity
+    mask are computed with array operations, and status normalization runs once per distinct
+    value. A record is invalid wherever the per-record mapper would raise, so valid records map
+    to exactly what `map_partner_delivery_*` returns and invalid ones are skipped. `signed`
+    holds None for records whose signature cannot be derived.
+    """
+    size = len(ids)
+    valid = np.fromiter(
+        (
+            isinstance(delivery_id, str) and isinstance(supplier, str) and is_signed is not None
+            for delivery_id, supplier, is_signed in zip(ids, suppliers, signed)
+        ),
+        dtype=bool,
+        count=size,
+    )
+
+    status_codes, status_inverse = _factorize(statuses)
+    normalized_statuses = np.array(
+        [normalize_status(code) if isinstance(code, str) else None for code in status_codes] + [None],
+        dtype=object,
+    )[:-1]
+    status = normalized_statuses[status_inverse]
+    valid &= status != None  # noqa: E711 - element-wise comparison
+
+    instants = _parse_timestamps(timestamps)
+    valid &= ~np.isnat(instants)
+    # Whole seconds and microseconds are converted separately: float epoch seconds would round the latter.
+    epoch_seconds, microseconds = np.divmod(instants.astype(np.int64), 1_000_000)
+    epoch_seconds, microseconds = epoch_seconds.tolist(), microseconds.tolist()
+
+    time_of_day = instants - instants.astype("datetime64[D]")
+    in_morning_window = (time_of_day >= _MORNING_START) & (time_of_day <= _MORNING_END)
+    signed_mask = np.array([bool(is_signed) for is_signed in signed], dtype=bool)
+    scores = np.round(np.where(signed_mask, 1.0, 0.3) * np.where(in_morning_window, 1.2, 1.0), 2)
+
+    status_values = status.tolist()
+    signed_values = signed_mask.tolist()
+    score_values = scores.tolist()
+    return [
+        UnifiedDelivery(
+            id=ids[index],
+            supplier=suppliers[index],
+            delivered_at=_utc_datetime(epoch_seconds[index], microseconds[index]),
+            status=status_values[index],
+            signed=signed_values[index],
+            siteId=site_id,
+            source=source,
+            delivery_score=score_values[index],
+        )
+        for index in np.flatnonzero(valid).tolist()
+    ], valid
+
+
+def _parse_timestamps(timestamps: list[Any]) -> np.ndarray:
+    """Return the UTC instant of every timestamp as `datetime64[us]`, NaT where it is invalid.
+
+    Values in the two common shapes are validated and converted on their code points; anything
+    else, including values numpy rejects, goes through `parse_iso8601_utc` one by one.
+    """
+    size = len(timestamps)
+    lengths = np.fromiter((len(value) if isinstance(value, str) else 0 for value in timestamps), np.intp, size)
+    text = np.array(
+        [value if isinstance(value, str) and len(value) <= _OFFSET_LENGTH else "" for value in timestamps],
+        dtype=f"U{_OFFSET_LENGTH}",
+    )
+    chars = text.view(np.uint32).reshape(size, _OFFSET_LENGTH)
+    digits = chars - ord("0")
+
+    shaped = np.all(digits[:, _DATE_TIME_DIGITS] <= 9, axis=1)
+    years = digits[:, 0].astype(np.int64) * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    shaped &= (years >= _MIN_YEAR) & (years <= _MAX_YEAR)
+    for position, separator in _DATE_TIME_SEPARATORS.items():
+        shaped &= chars[:, position] == ord(separator)
+    zulu = shaped & (lengths == _ZULU_LENGTH) & (chars[:, 19] == ord("Z"))
+    signs = chars[:, 19]
+    offset_shaped = (
+        shaped
+        & (lengths == _OFFSET_LENGTH)
+        & ((signs == ord("+")) | (signs == ord("-")))
+        & (chars[:, 22] == ord(":"))
+        & np.all(digits[:, _OFFSET_DIGITS] <= 9, axis=1)
+    )
+    offset_hours = digits[:, 20].astype(np.int64) * 10 + digits[:, 21]
+    offset_minutes = digits[:, 23].astype(np.int64) * 10 + digits[:, 24]
+    offset_shaped &= (offset_hours <= 23) & (offset_minutes <= 59)
+    fast = zulu | offset_shaped
+
+    instants = np.full(size, np.datetime64("NaT"), dtype="datetime64[us]")
+    local_text = text[fast].astype(f"U{_DATE_TIME_LENGTH}")
+    try:
+        local = local_text.astype("datetime64[us]")
+    except ValueError:
+        # An out-of-range field somewhere in the batch; only the values numpy rejects leave the fast path.
+        local = np.array([_numpy_datetime(value) for value in local_text.tolist()], dtype="datetime64[us]")
+        rejected = np.isnat(local)
+        fast[np.flatnonzero(fast)[rejected]] = False
+        local = local[~rejected]
+    offsets = np.where(signs == ord("-"), -1, 1) * (offset_hours * 60 + offset_minutes)
+    offsets = np.where(zulu, 0, offsets)[fast]
+    instants[fast] = local - offsets.astype("timedelta64[m]")
+
+    for index in np.flatnonzero(~fast).tolist():
+        moment = _parse_or_none(timestamps[index])
+        if moment is not None:
+            instants[index] = np.datetime64(moment.replace(tzinfo=None), "us")
+    return instants
+
+
+def _factorize(values: list[Any]) -> tuple[list[Any], np.ndarray]:
+    """Return the distinct values in first-seen order and, per input position, the index of its value."""
+    codes: dict[Any, int] = {}
+    inverse = np.fromiter(
+        (codes.setdefault(value if isinstance(value, str) else _MISSING, len(codes)) for value in values),
+        dtype=np.intp,
+        count=len(values),
+    )
+    return list(codes), inverse
+
+
+def _utc_datetime(epoch_seconds: int, microseconds: int) -> datetime:
+    moment = datetime.fromtimestamp(epoch_seconds, timezone.utc)
+    return moment.replace(microsecond=microseconds) if microseconds else moment
+
+
+def _numpy_datetime(value: str) -> np.datetime64:
+    try:
+        return np.datetime64(value, "us")
+    except ValueError:
+        return np.datetime64("NaT")
+
+
+def _parse_or_none(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse_iso8601_utc(value)
+    except (ValueError, OverflowError):
+        return None
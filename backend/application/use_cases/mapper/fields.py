@@ -0,0 +1,9 @@
+from typing import Any
+
+
+def require_str(delivery_data: dict[str, Any], key: str) -> str:
+    """Return a required text field of a partner record, raising like the model validation it replaces."""
+    value = delivery_data[key]
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a string, got {type(value).__name__}")
+    return value
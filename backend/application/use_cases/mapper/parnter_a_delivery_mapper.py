@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Sequence
 
-from backend.domain.unified_delivery import UnifiedDelivery
-from backend.shared.utils.date_utils import to_iso8601_utc
+from backend.application.use_cases.mapper.columnar_delivery_mapper import ColumnarResult, column, map_columns
+from backend.application.use_cases.mapper.fields import require_str
+from backend.domain.unified_delivery import UnifiedDelivery, compute_delivery_score
+from backend.shared.utils.date_utils import parse_iso8601_utc
 
 
 def _normalize_status(status: str) -> str:
@@ -11,12 +13,29 @@ def _normalize_status(status: str) -> str:
 
 def map_partner_delivery_a(source: str, site_id: str, delivery_data: dict[str, Any]) -> UnifiedDelivery:
     """Map Partner A payload into UnifiedDelivery instances using the shared mapper."""
+    delivered_at = parse_iso8601_utc(delivery_data.get("timestamp"))
+    signed = bool(delivery_data.get("signedBy"))
     return UnifiedDelivery(
-        id=delivery_data["deliveryId"],
-        supplier=delivery_data["supplier"],
-        delivered_at=to_iso8601_utc(delivery_data.get("timestamp")),
+        id=require_str(delivery_data, "deliveryId"),
+        supplier=require_str(delivery_data, "supplier"),
+        delivered_at=delivered_at,
         status=_normalize_status(delivery_data.get("status", "")),
-        signed=bool(delivery_data.get("signedBy")),
+        signed=signed,
         siteId=site_id,
         source=source,
+        delivery_score=compute_delivery_score(delivered_at, signed),
+    )
+
+
+def map_partner_deliveries_a(source: str, site_id: str, records: Sequence[Any]) -> ColumnarResult:
+    """Columnar counterpart of `map_partner_delivery_a` for a whole batch of Partner A records."""
+    return map_columns(
+        source=source,
+        site_id=site_id,
+        ids=column(records, "deliveryId"),
+        suppliers=column(records, "supplier"),
+        timestamps=column(records, "timestamp", None),
+        statuses=column(records, "status", ""),
+        signed=[bool(record.get("signedBy")) if isinstance(record, dict) else None for record in records],
+        normalize_status=_normalize_status,
     )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
-from backend.domain.unified_delivery import UnifiedDelivery
-from backend.shared.utils.date_utils import to_iso8601_utc
+from backend.application.use_cases.mapper.columnar_delivery_mapper import ColumnarResult, column, map_columns
+from backend.application.use_cases.mapper.fields import require_str
+from backend.domain.unified_delivery import UnifiedDelivery, compute_delivery_score
+from backend.shared.utils.date_utils import parse_iso8601_utc
 
 
 def _normalize_status(status_code: str) -> str:
@@ -22,12 +24,36 @@ def extract_signed_delivery(delivery_data: dict[str, Any]) -> bool:
 
 def map_partner_delivery_b(source: str, site_id: str, delivery_data: dict[str, Any]) -> UnifiedDelivery:
     """Map Partner B payload into UnifiedDelivery instances using the shared mapper."""
+    delivered_at = parse_iso8601_utc(delivery_data.get("deliveredAt"))
+    signed = extract_signed_delivery(delivery_data)
     return UnifiedDelivery(
-        id=delivery_data["id"],
-        supplier=delivery_data["provider"],
-        delivered_at=to_iso8601_utc(delivery_data.get("deliveredAt")),
+        id=require_str(delivery_data, "id"),
+        supplier=require_str(delivery_data, "provider"),
+        delivered_at=delivered_at,
         status=_normalize_status(delivery_data.get("statusCode", "")),
-        signed=extract_signed_delivery(delivery_data),
+        signed=signed,
         siteId=site_id,
         source=source,
+        delivery_score=compute_delivery_score(delivered_at, signed),
+    )
+
+
+def _signed_or_none(record: Any) -> bool | None:
+    if not isinstance(record, dict):
+        return None
+    receiver = record.get("receiver") or {}
+    return bool(receiver.get("signed")) if isinstance(receiver, dict) else None
+
+
+def map_partner_deliveries_b(source: str, site_id: str, records: Sequence[Any]) -> ColumnarResult:
+    """Columnar counterpart of `map_partner_delivery_b` for a whole batch of Partner B records."""
+    return map_columns(
+        source=source,
+        site_id=site_id,
+        ids=column(records, "id"),
+        suppliers=column(records, "provider"),
+        timestamps=column(records, "deliveredAt", None),
+        statuses=column(records, "statusCode", ""),
+        signed=[_signed_or_none(record) for record in records],
+        normalize_status=_normalize_status,
     )
@@ -1,8 +1,15 @@
 from functools import lru_cache
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
-from backend.application.use_cases.mapper.parnter_a_delivery_mapper import map_partner_delivery_a
-from backend.application.use_cases.mapper.parnter_b_delivery_mapper import map_partner_delivery_b
+from backend.application.use_cases.mapper.columnar_delivery_mapper import ColumnarResult
+from backend.application.use_cases.mapper.parnter_a_delivery_mapper import (
+    map_partner_deliveries_a,
+    map_partner_delivery_a,
+)
+from backend.application.use_cases.mapper.parnter_b_delivery_mapper import (
+    map_partner_deliveries_b,
+    map_partner_delivery_b,
+)
 from backend.shared.config.settings import get_settings, Settings
 from backend.domain.unified_delivery import UnifiedDelivery
 
@@ -13,11 +20,24 @@ class PartnerDeliveryMapper:
             settings.source_a: map_partner_delivery_a,
             settings.source_b: map_partner_delivery_b,
         }
+        self._batch_mapper_by_source: dict[str, Callable[[str, str, Sequence[Any]], ColumnarResult]] = {
+            settings.source_a: map_partner_deliveries_a,
+            settings.source_b: map_partner_deliveries_b,
+        }
 
     def map(self, source: str, site_id: str, delivery_data: dict[str, Any]) -> UnifiedDelivery:
         mapper = self._mapper_by_source.get(source)
+        if mapper is None:
+            raise ValueError(f"No partner delivery mapper for source {source}")
         return mapper(source, site_id, delivery_data)
 
+    def map_batch(self, source: str, site_id: str, records: Sequence[Any]) -> ColumnarResult:
+        """Map a batch column-wise; returns the valid deliveries and a validity mask over `records`."""
+        mapper = self._batch_mapper_by_source.get(source)
+        if mapper is None:
+            raise ValueError(f"No partner delivery mapper for source {source}")
+        return mapper(source, site_id, records)
+
 @lru_cache
 def get_partner_delivery_mapper() -> PartnerDeliveryMapper:
     settings = get_settings()
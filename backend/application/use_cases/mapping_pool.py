@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from backend.shared.config.settings import get_settings
+
+
+@lru_cache
+def get_mapping_executor() -> ProcessPoolExecutor | None:
+    """Process pool for mapping large payloads, or None when `PROCESS_POOL_ENABLED` is off.
+
+    Workers are spawned rather than forked: the parent runs the scheduler and HTTP client threads.
+    """
+    settings = get_settings()
+    if not settings.process_pool_enabled:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=settings.process_pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_mapping_executor() -> None:
+    if get_mapping_executor.cache_info().currsize:
+        executor = get_mapping_executor()
+        if executor is not None:
+            executor.shutdown()
+        get_mapping_executor.cache_clear()
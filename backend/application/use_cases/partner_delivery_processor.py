@@ -1,20 +1,43 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Iterable, List
+from concurrent.futures import Executor
+from dataclasses import fields
+from itertools import repeat, starmap
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, List, Sequence
 
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats import Stats
 from backend.domain.unified_delivery import UnifiedDelivery
 
-from backend.application.use_cases.mapper.partner_delivery_mapper import PartnerDeliveryMapper
+from backend.application.use_cases.mapper.partner_delivery_mapper import (
+    PartnerDeliveryMapper,
+    get_partner_delivery_mapper,
+)
 from backend.domain.partner_delivery import PartnerDelivery
+from backend.shared.utils.iter_utils import batched
 
 logger = logging.getLogger(__name__)
 
 
 class PartnerDeliveryProcessor:
-    def __init__(self, delivery_mapper: PartnerDeliveryMapper) -> None:
+    def __init__(
+        self,
+        delivery_mapper: PartnerDeliveryMapper,
+        columnar_batch_size: int | None = None,
+        executor: Executor | None = None,
+        pool_chunk_size: int = 50_000,
+    ) -> None:
+        """`columnar_batch_size` switches to column-wise mapping of that many records at a time.
+
+        With an `executor`, payloads of more than `pool_chunk_size` records are split into chunks
+        of that size and mapped by the executor's workers.
+        """
         self._delivery_mapper = delivery_mapper
+        self._columnar_batch_size = columnar_batch_size
+        self._executor = executor
+        self._pool_chunk_size = pool_chunk_size
 
     def process(
         self,
@@ -24,19 +47,131 @@ class PartnerDeliveryProcessor:
         site_id: str,
     ) -> tuple[List[UnifiedDelivery], Stats]:
         stats = Stats.for_partner(source)
+        stats.record_bytes_received(delivery.decoded_bytes)
+        stats.record_stage(PipelineStage.DECODE, delivery.decode_seconds)
+        self._record_malformed(delivery, source, stats)
+        records = self._iterate_delivery_data(delivery)
+        if self._executor is not None and len(records) > self._pool_chunk_size:
+            return self._map_in_pool(records, source, site_id, stats), stats
+        return self._map_records(records, source, site_id, stats), stats
+
+    def _map_records(
+        self,
+        records: Sequence[dict[str, Any]],
+        source: str,
+        site_id: str,
+        stats: Stats,
+    ) -> List[UnifiedDelivery]:
         unified_deliveries: List[UnifiedDelivery] = []
-        for data in self._iterate_delivery_data(delivery):
-            stats.record_fetched()
-            try:
-                unified_delivery = self._delivery_mapper.map(source, site_id, data)
+        if self._columnar_batch_size:
+            for mapped in self._map_columnar(records, source, site_id, stats):
+                unified_deliveries.extend(mapped)
+            return unified_deliveries
+        for data in records:
+            unified_delivery = self._map_record(data, source, site_id, stats)
+            if unified_delivery is not None:
                 unified_deliveries.append(unified_delivery)
-                stats.record_transformed()
-            except AttributeError:
-                logger.error("Missing partner delivery mapper for delivery %s", delivery)
-                stats.record_errors()
-            stats.record_stored(len(unified_deliveries))
-        return unified_deliveries, stats
+        return unified_deliveries
+
+    def _map_record(self, data: Any, source: str, site_id: str, stats: Stats) -> UnifiedDelivery | None:
+        """Map one record, or count it as an error and return None if it cannot be mapped.
+
+        Records can pass the payload schema, or skip it when streamed, and still not map (an
+        unparseable timestamp, a non-string id); they are skipped like the columnar mask does.
+        """
+        stats.record_fetched()
+        try:
+            unified_delivery = self._delivery_mapper.map(source, site_id, data)
+        except (AttributeError, TypeError, ValueError) as exc:
+            logger.warning("Skipping delivery from %s that cannot be mapped: %s", source, exc)
+            stats.record_errors()
+            return None
+        stats.record_transformed()
+        return unified_delivery
+
+    def _map_in_pool(
+        self,
+        records: Sequence[dict[str, Any]],
+        source: str,
+        site_id: str,
+        stats: Stats,
+    ) -> List[UnifiedDelivery]:
+        size = self._pool_chunk_size
+        chunks = [records[start:start + size] for start in range(0, len(records), size)]
+        logger.info("Mapping %d deliveries from %s in %d chunks", len(records), source, len(chunks))
+        unified_deliveries: List[UnifiedDelivery] = []
+        for rows, chunk_stats in self._executor.map(
+            _map_chunk, repeat(source), repeat(site_id), chunks, repeat(self._columnar_batch_size)
+        ):
+            unified_deliveries.extend(starmap(UnifiedDelivery, rows))
+            stats.merge(chunk_stats)
+        return unified_deliveries
+
+    def process_stream(
+        self,
+        *,
+        records: Iterable[dict[str, Any]],
+        source: str,
+        site_id: str,
+        stats: Stats,
+    ) -> Iterator[UnifiedDelivery]:
+        """Lazily map partner records one at a time, updating `stats` as they flow through."""
+        if self._columnar_batch_size:
+            for mapped in self._map_columnar(records, source, site_id, stats):
+                yield from mapped
+            return
+        for data in records:
+            unified_delivery = self._map_record(data, source, site_id, stats)
+            if unified_delivery is not None:
+                yield unified_delivery
+
+    def _map_columnar(
+        self,
+        records: Iterable[dict[str, Any]],
+        source: str,
+        site_id: str,
+        stats: Stats,
+    ) -> Iterator[List[UnifiedDelivery]]:
+        """Map records column-wise in chunks; records failing validation are counted as errors and skipped."""
+        for chunk in batched(records, self._columnar_batch_size):
+            stats.record_fetched(len(chunk))
+            try:
+                mapped, valid = self._delivery_mapper.map_batch(source, site_id, chunk)
+            except ValueError:
+                logger.error("Missing partner delivery mapper for source %s", source)
+                stats.record_errors(len(chunk))
+                continue
+            invalid = len(chunk) - int(valid.sum())
+            if invalid:
+                logger.warning("Skipped %d invalid deliveries from %s", invalid, source)
+                stats.record_errors(invalid)
+            stats.record_transformed(len(mapped))
+            yield mapped
+
+    @staticmethod
+    def _record_malformed(delivery: PartnerDelivery, source: str, stats: Stats) -> None:
+        for record in delivery.malformed:
+            logger.warning("Malformed delivery #%d from %s: %s", record.index, source, record.reason)
+        stats.record_fetched(len(delivery.malformed))
+        stats.record_errors(len(delivery.malformed))
 
     @staticmethod
-    def _iterate_delivery_data(delivery: PartnerDelivery) -> Iterable[dict[str, Any]]:
+    def _iterate_delivery_data(delivery: PartnerDelivery) -> Sequence[dict[str, Any]]:
         return delivery.delivery_data
+
+
+# Deliveries cross the process boundary as plain tuples: pickling slotted instances costs several times more.
+_delivery_fields = attrgetter(*(field.name for field in fields(UnifiedDelivery)))
+
+
+def _map_chunk(
+    source: str,
+    site_id: str,
+    records: Sequence[dict[str, Any]],
+    columnar_batch_size: int | None,
+) -> tuple[List[tuple[Any, ...]], Stats]:
+    """Map one chunk of a payload inside a pool worker, with that worker's own mapper."""
+    stats = Stats.for_partner(source)
+    processor = PartnerDeliveryProcessor(get_partner_delivery_mapper(), columnar_batch_size=columnar_batch_size)
+    mapped = processor._map_records(records, source, site_id, stats)
+    return [_delivery_fields(delivery) for delivery in mapped], stats
@@ -9,6 +9,7 @@ from fastapi import Depends
 from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import (
     get_unified_deliveries_port,
 )
+from backend.domain.store_result import StoreResult
 from backend.domain.unified_delivery import UnifiedDelivery
 from backend.ports.unified_deliveries_port import UnifiedDeliveriesPort
 
@@ -17,9 +18,8 @@ class StoreUnifiedDeliveriesUseCase:
     def __init__(self, unified_deliveries_port: UnifiedDeliveriesPort) -> None:
         self._unified_deliveries_port = unified_deliveries_port
 
-    def store(self, job_id: UUID, unified_deliveries: Sequence[UnifiedDelivery]) -> None:
-        for delivery in unified_deliveries:
-            self._unified_deliveries_port.store(job_id, delivery)
+    def store(self, job_id: UUID, unified_deliveries: Sequence[UnifiedDelivery]) -> StoreResult:
+        return self._unified_deliveries_port.store_many(job_id, unified_deliveries)
 
 
 @lru_cache
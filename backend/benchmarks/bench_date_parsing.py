@@ -0,0 +1,45 @@
+"""Compare timestamp normalization throughput: dateutil baseline, strict fast path, and batch API.
+
+Usage: python -m backend.benchmarks.bench_date_parsing [COUNT]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from backend.benchmarks.synthetic import partner_a_records, partner_b_records
+from backend.shared.utils.date_utils import _format_utc, _parse_general, to_iso8601_utc, to_iso8601_utc_many
+
+
+def _baseline(date_strs: list[str]) -> list[str]:
+    # The previous implementation: isoparse, astimezone and string replacement per value.
+    return [_format_utc(_parse_general(date_str)) for date_str in date_strs]
+
+
+def _fast_path(date_strs: list[str]) -> list[str]:
+    return [to_iso8601_utc(date_str) for date_str in date_strs]
+
+
+def _throughput(normalize: Callable[[list[str]], list[str]], date_strs: list[str]) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    normalized = normalize(date_strs)
+    return len(date_strs) / (time.perf_counter() - started), normalized
+
+
+def main(count: int) -> None:
+    half = count // 2
+    date_strs = [record["timestamp"] for record in partner_a_records(half)]
+    date_strs += [record["deliveredAt"] for record in partner_b_records(count - half)]
+    print(f"{count} timestamps, {len(set(date_strs))} distinct")
+
+    baseline, expected = _throughput(_baseline, date_strs)
+    print(f"dateutil baseline:    {baseline:12.0f} values/s")
+    for name, normalize in (("fast path per value:", _fast_path), ("batch API:          ", to_iso8601_utc_many)):
+        rate, normalized = _throughput(normalize, date_strs)
+        assert normalized == expected, f"{name} diverges from the baseline"
+        print(f"{name}  {rate:12.0f} values/s ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
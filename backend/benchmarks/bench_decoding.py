@@ -0,0 +1,46 @@
+"""Compare decode time per MB of partner responses: generic JSON plus list validation vs typed schemas.
+
+Usage: python -m backend.benchmarks.bench_decoding [COUNT]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Any, Callable, List
+
+from pydantic import TypeAdapter
+
+from backend.adapters.outbound.partners.partner_payload_schemas import PARTNER_A_SCHEMA, PARTNER_B_SCHEMA
+from backend.benchmarks.synthetic import partner_a_records, partner_b_records
+
+# The previous path: `response.json()` followed by validating the result as `List[dict]`.
+_GENERIC_LIST = TypeAdapter(List[dict[str, Any]])
+
+
+def _generic(content: bytes) -> Any:
+    return _GENERIC_LIST.validate_python(json.loads(content))
+
+
+def _ms_per_mb(decode: Callable[[bytes], Any], content: bytes) -> float:
+    started = time.perf_counter()
+    decode(content)
+    return (time.perf_counter() - started) * 1000 / (len(content) / 1_000_000)
+
+
+def main(count: int) -> None:
+    for name, generate, schema in (
+        ("Partner A", partner_a_records, PARTNER_A_SCHEMA),
+        ("Partner B", partner_b_records, PARTNER_B_SCHEMA),
+    ):
+        content = json.dumps(list(generate(count))).encode()
+        generic = _ms_per_mb(_generic, content)
+        typed = _ms_per_mb(schema.decode, content)
+        print(
+            f"{name} ({len(content) / 1_000_000:.1f} MB): generic {generic:7.2f} ms/MB, "
+            f"typed schema {typed:7.2f} ms/MB ({generic / typed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,155 @@
+"""Compare the ways a 100-row `/deliveries` page can be turned into a response body.
+
+Usage: BENCHMARK_DATABASE_URL=postgresql+psycopg://... python -m backend.benchmarks.bench_json_pages [ROWS] [PAGES]
+
+Loads ROWS deliveries (default 100,000), then walks the first PAGES pages (default 200) by
+cursor with each read path. It reports pages per second including the query round trips, and
+the CPU time this process spent per page; with Postgres on its own host, that is what the
+service saves:
+
+- ORM entities: `UnifiedDeliveryModel` objects copied into dicts twice and encoded by
+  FastAPI's `jsonable_encoder` and `json.dumps`, as the endpoint used to do;
+- Core rows: `list_deliveries_page` rows encoded by orjson (the default path);
+- Postgres JSON: `list_deliveries_json_page`, forwarded as text (DB_JSON_PAGES_ENABLED).
+
+PostgreSQL only; the tables are dropped and recreated.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, select, tuple_
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.repostory import row_counts  # noqa: F401  (registers table_row_counts)
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.unified_delivery_model import UnifiedDeliveryModel
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import (
+    UnifiedDeliveriesRepository,
+    list_deliveries_json_page,
+    list_deliveries_page,
+)
+from backend.benchmarks.synthetic import unified_deliveries
+from backend.domain.count_mode import CountMode
+from backend.shared.utils.date_utils import to_utc
+from backend.shared.utils.json_response import to_json, to_json_with_items
+
+_PAGE_SIZE = 100
+_KEYSET_ORDER = (-UnifiedDeliveryModel.delivery_score, UnifiedDeliveryModel.id)
+
+# Render one page, returning the response body and the cursor of the next page.
+_ReadPath = Callable[[Session, "str | None"], tuple[bytes, "str | None"]]
+
+
+def _envelope(next_cursor: str | None) -> dict[str, Any]:
+    return {"total": None, "countMode": "none", "limit": _PAGE_SIZE, "offset": 0, "nextCursor": next_cursor}
+
+
+def _orm_entities(session: Session, cursor: str | None) -> tuple[bytes, str | None]:
+    stmt = select(UnifiedDeliveryModel).order_by(*_KEYSET_ORDER).limit(_PAGE_SIZE + 1)
+    if cursor is not None:
+        # A plain JSON key stands in for the opaque cursor; the walk only needs the position.
+        negated_score, row_id = json.loads(cursor)
+        stmt = stmt.where(tuple_(*_KEYSET_ORDER) > (negated_score, row_id))
+    deliveries = session.scalars(stmt).all()
+    rows = [
+        {
+            "jobId": delivery.job_id,
+            "id": delivery.delivery_id,
+            "supplier": delivery.supplier,
+            "deliveredAt": delivery.delivered_at,
+            "status": delivery.status,
+            "signed": delivery.signed,
+            "siteId": delivery.site_id,
+            "source": delivery.source,
+            "deliveryScore": float(delivery.delivery_score),
+        }
+        for delivery in deliveries[:_PAGE_SIZE]
+    ]
+    items = [
+        {
+            "id": row["id"],
+            "supplier": row["supplier"],
+            "deliveredAt": to_utc(row["deliveredAt"]).isoformat().replace("+00:00", "Z"),
+            "status": row["status"],
+            "signed": row["signed"],
+            "siteId": row["siteId"],
+            "source": row["source"],
+            "deliveryScore": row["deliveryScore"],
+        }
+        for row in rows
+    ]
+    next_cursor = None
+    if len(deliveries) > _PAGE_SIZE:
+        last = deliveries[_PAGE_SIZE - 1]
+        next_cursor = json.dumps([-last.delivery_score, last.id])
+    content = jsonable_encoder({"items": items, **_envelope(next_cursor)})
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode(), next_cursor
+
+
+def _core_rows(session: Session, cursor: str | None) -> tuple[bytes, str | None]:
+    page = list_deliveries_page(session, _PAGE_SIZE, 0, cursor, CountMode.NONE, None)
+    return to_json({"items": page.items, **_envelope(page.next_cursor)}), page.next_cursor
+
+
+def _postgres_json(session: Session, cursor: str | None) -> tuple[bytes, str | None]:
+    page = list_deliveries_json_page(session, _PAGE_SIZE, 0, cursor, CountMode.NONE, None)
+    return to_json_with_items(page.items_json, _envelope(page.next_cursor)), page.next_cursor
+
+
+def _walk(session_factory: sessionmaker[Session], read_path: _ReadPath, pages: int) -> tuple[float, float, list[Any]]:
+    """Walk up to `pages` pages; return the wall and the service CPU seconds per page, and the first page's items."""
+    first_items: list[Any] = []
+    started, cpu_started = time.perf_counter(), time.process_time()
+    with session_factory() as session:
+        cursor = None
+        for walked in range(1, pages + 1):
+            body, cursor = read_path(session, cursor)
+            if walked == 1:
+                first_items = json.loads(body)["items"]
+            if cursor is None:
+                break
+    return (time.perf_counter() - started) / walked, (time.process_time() - cpu_started) / walked, first_items
+
+
+def main(rows: int, pages: int) -> None:
+    database_url = os.environ.get("BENCHMARK_DATABASE_URL")
+    if not database_url or not database_url.startswith("postgresql"):
+        sys.exit("BENCHMARK_DATABASE_URL must point to a PostgreSQL database")
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    UnifiedDeliveriesRepository(session_factory, copy_threshold=1).store_many(
+        uuid4(), list(unified_deliveries(rows, source="bench"))
+    )
+
+    read_paths: dict[str, _ReadPath] = {
+        "ORM entities": _orm_entities,
+        "Core rows": _core_rows,
+        "Postgres JSON": _postgres_json,
+    }
+    print(f"{rows} rows, {pages} pages of {_PAGE_SIZE}")
+    reference: list[Any] | None = None
+    for name, read_path in read_paths.items():
+        _walk(session_factory, read_path, min(pages, 10))
+        seconds, cpu_seconds, first_items = _walk(session_factory, read_path, pages)
+        if reference is None:
+            reference = first_items
+        assert first_items == reference, f"{name} renders a different first page"
+        print(f"{name:14} {1 / seconds:8.1f} pages/s  {seconds * 1000:6.2f} ms/page  {cpu_seconds * 1000:6.2f} ms service CPU/page")
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,57 @@
+"""Compare per-record and columnar mapping throughput for both partner payload shapes.
+
+Usage: python -m backend.benchmarks.bench_mapping [COUNT]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable
+
+from backend.application.use_cases.mapper.columnar_delivery_mapper import ColumnarResult
+from backend.application.use_cases.mapper.parnter_a_delivery_mapper import (
+    map_partner_deliveries_a,
+    map_partner_delivery_a,
+)
+from backend.application.use_cases.mapper.parnter_b_delivery_mapper import (
+    map_partner_deliveries_b,
+    map_partner_delivery_b,
+)
+from backend.benchmarks.synthetic import partner_a_records, partner_b_records
+from backend.domain.unified_delivery import UnifiedDelivery
+
+
+def _per_record(
+    mapper: Callable[[str, str, dict[str, Any]], UnifiedDelivery], records: list[dict[str, Any]]
+) -> list[UnifiedDelivery]:
+    return [mapper("bench", "site-1", record) for record in records]
+
+
+def _columnar(
+    mapper: Callable[[str, str, list[dict[str, Any]]], ColumnarResult], records: list[dict[str, Any]]
+) -> list[UnifiedDelivery]:
+    mapped, _ = mapper("bench", "site-1", records)
+    return mapped
+
+
+def _throughput(map_records: Callable[[], list[UnifiedDelivery]], count: int) -> tuple[float, list[UnifiedDelivery]]:
+    started = time.perf_counter()
+    mapped = map_records()
+    return count / (time.perf_counter() - started), mapped
+
+
+def main(count: int) -> None:
+    partners = (
+        ("Partner A", partner_a_records, map_partner_delivery_a, map_partner_deliveries_a),
+        ("Partner B", partner_b_records, map_partner_delivery_b, map_partner_deliveries_b),
+    )
+    for name, generate, single, batch in partners:
+        records = list(generate(count))
+        baseline, expected = _throughput(lambda: _per_record(single, records), count)
+        rate, mapped = _throughput(lambda: _columnar(batch, records), count)
+        assert mapped == expected, f"columnar mapping diverges from per-record mapping for {name}"
+        print(f"{name}: per record {baseline:10.0f} records/s, columnar {rate:10.0f} records/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
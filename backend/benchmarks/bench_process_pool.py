@@ -0,0 +1,71 @@
+"""Measure how mapping a large payload scales with the number of process-pool workers.
+
+Usage: python -m backend.benchmarks.bench_process_pool [COUNT] [MAX_WORKERS]
+
+Maps COUNT synthetic Partner A records (default 1,000,000) inline, then through
+`PartnerDeliveryProcessor` with 1, 2, 4, ... workers up to MAX_WORKERS (default: the CPU
+count). Pools are started and warmed up before timing, so the figures cover chunking,
+pickling and mapping only.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.application.use_cases.mapper.partner_delivery_mapper import get_partner_delivery_mapper
+from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
+from backend.benchmarks.synthetic import BENCHMARK_ENVIRONMENT, partner_a_records, use_benchmark_environment
+from backend.domain.partner_delivery import PartnerDelivery
+
+_SOURCE = BENCHMARK_ENVIRONMENT["SOURCE_A"]
+
+
+def _worker_counts(max_workers: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def _timed(processor: PartnerDeliveryProcessor, delivery: PartnerDelivery) -> float:
+    started = time.perf_counter()
+    mapped, _ = processor.process(delivery=delivery, source=_SOURCE, site_id="site-1")
+    elapsed = time.perf_counter() - started
+    assert len(mapped) == len(delivery.delivery_data)
+    return elapsed
+
+
+def main(count: int, max_workers: int) -> None:
+    # Workers build their mapper from the settings, which they inherit from this environment.
+    use_benchmark_environment()
+    delivery = PartnerDelivery(delivery_data=list(partner_a_records(count)))
+    mapper = get_partner_delivery_mapper()
+    inline = _timed(PartnerDeliveryProcessor(mapper), delivery)
+    print(f"inline:     {inline:7.2f}s {count / inline:10.0f} records/s")
+
+    for workers in _worker_counts(max_workers):
+        chunk_size = -(-count // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            processor = PartnerDeliveryProcessor(mapper, executor=pool, pool_chunk_size=chunk_size)
+            warm_up = PartnerDelivery(delivery_data=delivery.delivery_data[: workers * 2])
+            PartnerDeliveryProcessor(mapper, executor=pool, pool_chunk_size=1).process(
+                delivery=warm_up, source=_SOURCE, site_id="site-1"
+            )
+            elapsed = _timed(processor, delivery)
+        speedup = inline / elapsed
+        print(
+            f"{workers:2d} workers: {elapsed:7.2f}s {count / elapsed:10.0f} records/s "
+            f"{speedup:5.2f}x speedup, {speedup / workers:4.0%} efficiency"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,145 @@
+"""Show how the listing queries on unified_deliveries are planned without and with its indexes.
+
+Usage: BENCHMARK_DATABASE_URL=postgresql+psycopg://... python -m backend.benchmarks.bench_query_plans [ROWS]
+
+Loads ROWS deliveries (default 10,000,000) generated server-side with a fixed seed, runs
+EXPLAIN ANALYZE for each query pattern served by `/deliveries` with only the primary key and
+identity constraint in place, then again after creating the model's secondary indexes.
+PostgreSQL only; the tables are dropped and recreated.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, Select, create_engine, select, text, tuple_
+
+from backend.adapters.repostory import row_counts  # noqa: F401  (registers table_row_counts)
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.unified_delivery_model import UnifiedDeliveryModel
+
+_PAGE_SIZE = 50
+_SEED = 0.42
+
+_LOAD = text(
+    """
+    INSERT INTO unified_deliveries
+        (job_id, delivery_id, supplier, delivered_at, status, signed, site_id, source, delivery_score)
+    SELECT
+        md5((n % 1000)::text)::uuid::text,
+        'DEL-' || n,
+        'Supplier-' || (random() * 499)::int,
+        delivered_at,
+        (ARRAY['delivered', 'pending', 'cancelled', 'unknown'])[1 + (random() * 3)::int],
+        signed,
+        'site-' || (random() * 99)::int,
+        'bench',
+        round(((CASE WHEN signed THEN 1.0 ELSE 0.3 END)
+            * (CASE WHEN delivered_at::time BETWEEN '05:00' AND '11:00' THEN 1.2 ELSE 1.0 END))::numeric, 2)
+    FROM (
+        SELECT n,
+               timestamptz '2024-01-01 00:00+00' + random() * interval '365 days' AS delivered_at,
+               random() < 0.7 AS signed
+        FROM generate_series(1, :rows) AS n
+    ) AS generated
+    """
+)
+
+
+def _queries(rows: int) -> dict[str, Select[Any]]:
+    delivery = UnifiedDeliveryModel
+    by_score = (-delivery.delivery_score, delivery.id)
+    return {
+        "score order, first page": select(delivery).order_by(*by_score).limit(_PAGE_SIZE + 1),
+        "score order, deep cursor": (
+            select(delivery).where(tuple_(*by_score) > (-0.36, rows // 2)).order_by(*by_score).limit(_PAGE_SIZE + 1)
+        ),
+        "site + time range": (
+            select(delivery)
+            .where(
+                delivery.site_id == "site-7",
+                delivery.delivered_at >= datetime(2024, 3, 1, tzinfo=timezone.utc),
+                delivery.delivered_at < datetime(2024, 3, 8, tzinfo=timezone.utc),
+            )
+            .order_by(*by_score)
+            .limit(_PAGE_SIZE + 1)
+        ),
+        "supplier + status": (
+            select(delivery)
+            .where(delivery.supplier == "Supplier-42", delivery.status == "pending")
+            .order_by(*by_score)
+            .limit(_PAGE_SIZE + 1)
+        ),
+        "job + score": (
+            select(delivery)
+            .where(delivery.job_id == "c4ca4238-a0b9-2382-0dcc-509a6f75849b")
+            .order_by(*by_score)
+            .limit(_PAGE_SIZE + 1)
+        ),
+    }
+
+
+def _scans(plan: dict[str, Any]) -> Iterator[str]:
+    node_type = plan["Node Type"]
+    if "Scan" in node_type:
+        yield f"{node_type} on {plan.get('Index Name', plan.get('Relation Name'))}"
+    for child in plan.get("Plans", ()):
+        yield from _scans(child)
+
+
+def _explain(engine: Engine, queries: dict[str, Select[Any]]) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    with engine.connect() as connection:
+        for name, query in queries.items():
+            sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            [explained] = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar_one()
+            results[name] = {
+                "scans": list(_scans(explained["Plan"])),
+                "executionMs": round(explained["Execution Time"], 2),
+            }
+    return results
+
+
+def main(rows: int) -> None:
+    database_url = os.environ.get("BENCHMARK_DATABASE_URL")
+    if not database_url or not database_url.startswith("postgresql"):
+        sys.exit("BENCHMARK_DATABASE_URL must point to a PostgreSQL database")
+    engine = create_engine(database_url, future=True)
+    table = UnifiedDeliveryModel.__table__
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in table.indexes:
+            index.drop(connection)
+        started = time.perf_counter()
+        connection.execute(text("SELECT setseed(:seed)"), {"seed": _SEED})
+        connection.execute(_LOAD, {"rows": rows})
+        print(f"loaded {rows} rows in {time.perf_counter() - started:.1f}s")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE unified_deliveries"))
+
+    queries = _queries(rows)
+    before = _explain(engine, queries)
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        for index in table.indexes:
+            index.create(connection)
+    print(f"created {len(table.indexes)} indexes in {time.perf_counter() - started:.1f}s")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE unified_deliveries"))
+    after = _explain(engine, queries)
+
+    for name in queries:
+        print(f"\n{name}")
+        print(f"  without indexes: {before[name]['executionMs']:>10.2f} ms  {', '.join(before[name]['scans'])}")
+        print(f"  with indexes:    {after[name]['executionMs']:>10.2f} ms  {', '.join(after[name]['scans'])}")
+    print(json.dumps({"rows": rows, "withoutIndexes": before, "withIndexes": after}))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,84 @@
+"""Compare per-record memory and construction time of the pipeline's delivery representations.
+
+Usage: python -m backend.benchmarks.bench_records [COUNT]
+
+"pydantic" is the previous frozen, validated `BaseModel`; "dataclass" is the slotted
+`UnifiedDelivery` used between the mappers and the repository. Wrapping a fetched payload
+is compared the same way for `PartnerDelivery`, where pydantic copies every record while the
+dataclass keeps a reference to the decoded list.
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from pydantic import AwareDatetime, BaseModel
+
+from backend.benchmarks.synthetic import partner_a_records, unified_deliveries
+from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.unified_delivery import UnifiedDelivery
+
+
+class _PydanticUnifiedDelivery(BaseModel):
+    id: str
+    supplier: str
+    delivered_at: AwareDatetime
+    status: str
+    signed: bool
+    siteId: str
+    source: str
+    delivery_score: float
+
+    model_config = {"populate_by_name": True, "frozen": True}
+
+
+class _PydanticPartnerDelivery(BaseModel):
+    delivery_data: List[dict[str, Any]]
+
+
+def _fields(delivery: UnifiedDelivery) -> dict[str, Any]:
+    return {name: getattr(delivery, name) for name in UnifiedDelivery.__slots__}
+
+
+def _measure(build: Callable[[], Any], count: int) -> tuple[float, float]:
+    """Return (microseconds, bytes) per record for building everything `build` returns."""
+    gc.collect()
+    started = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return elapsed / count * 1e6, allocated / count
+
+
+def _report(name: str, before: tuple[float, float], after: tuple[float, float]) -> None:
+    print(
+        f"{name}: pydantic {before[0]:6.2f} µs {before[1]:6.0f} B, "
+        f"dataclass {after[0]:6.2f} µs {after[1]:6.0f} B per record"
+    )
+
+
+def main(count: int) -> None:
+    rows = [_fields(delivery) for delivery in unified_deliveries(count)]
+    _report(
+        "UnifiedDelivery",
+        _measure(lambda: [_PydanticUnifiedDelivery(**row) for row in rows], count),
+        _measure(lambda: [UnifiedDelivery(**row) for row in rows], count),
+    )
+    records = list(partner_a_records(count))
+    _report(
+        "PartnerDelivery",
+        _measure(lambda: _PydanticPartnerDelivery(delivery_data=records), count),
+        _measure(lambda: PartnerDelivery(delivery_data=records), count),
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,63 @@
+"""Compare per-row commits, batched INSERTs and COPY for unified delivery writes.
+
+Usage: python -m backend.benchmarks.bench_store_deliveries [ROWS]
+
+Runs against BENCHMARK_DATABASE_URL (e.g. a local Postgres) or a temporary SQLite file.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from uuid import uuid4
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.benchmarks.synthetic import unified_deliveries
+
+
+def _session_factory(database_url: str) -> sessionmaker[Session]:
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def main(rows: int) -> None:
+    database_url = os.environ.get("BENCHMARK_DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    session_factory = _session_factory(database_url)
+    repository = UnifiedDeliveriesRepository(session_factory)
+    # Distinct sources per phase so every phase inserts new identities instead of hitting the upsert no-op path.
+    per_row_sample = list(unified_deliveries(min(rows, 5000), source="bench-per-row"))
+    started = time.perf_counter()
+    job_id = uuid4()
+    for delivery in per_row_sample:
+        repository.store(job_id, delivery)
+    per_row = len(per_row_sample) / (time.perf_counter() - started)
+
+    deliveries = list(unified_deliveries(rows, source="bench-batched"))
+    started = time.perf_counter()
+    repository.store_many(uuid4(), deliveries)
+    batched = rows / (time.perf_counter() - started)
+
+    copy_repository = UnifiedDeliveriesRepository(session_factory, copy_threshold=1)
+    deliveries = list(unified_deliveries(rows, source="bench-copy"))
+    started = time.perf_counter()
+    copy_repository.store_many(uuid4(), deliveries)
+    copied = rows / (time.perf_counter() - started)
+
+    with session_factory() as session:
+        stored = session.scalar(text("select count(*) from unified_deliveries"))
+    print(f"database: {database_url.split('@')[-1]}")
+    print(f"per-row store:   {per_row:12.0f} rows/s ({len(per_row_sample)} rows)")
+    print(f"store_many:      {batched:12.0f} rows/s ({rows} rows)")
+    print(f"store_many COPY: {copied:12.0f} rows/s ({rows} rows, INSERT fallback outside Postgres)")
+    print(f"speed-up:        {batched / per_row:12.1f}x batched, {copied / per_row:.1f}x COPY ({stored} rows stored)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,221 @@
+"""Load test the listing endpoints: sustained requests per second and latency percentiles.
+
+Usage:
+    python -m backend.benchmarks.load_listing [--url URL] [--path PATH] [--concurrency N] [--duration SECONDS]
+    python -m backend.benchmarks.load_listing --compare [--seed ROWS] [options]
+
+Without `--compare` the load goes to an already running service at `--url`. With `--compare`
+the service is started twice with uvicorn, first with DB_ASYNC_ENABLED=false (sync sessions on
+the worker thread pool) and then with DB_ASYNC_ENABLED=true (asyncio sessions). Both runs get
+the same database settings from the environment (POSTGRES_*, DB_POOL_SIZE, ...), so they use
+the same pool size. `--seed` first stores that many synthetic deliveries if the table has
+fewer rows.
+
+On a local database the service is CPU-bound and both runs perform alike; waiting on a remote
+database is what ties up worker threads. `--db-latency-ms` starts a TCP proxy in front of
+POSTGRES_HOST:POSTGRES_PORT that delays every response from the database by that much, and
+points both runs at it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Sequence
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import func, select
+
+from backend.benchmarks.synthetic import unified_deliveries
+
+
+@dataclass(frozen=True, slots=True)
+class LoadResult:
+    requests: int
+    errors: int
+    seconds: float
+    latencies: list[float]
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] if ordered else float("nan")
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests:7d} requests {self.requests_per_second:8.1f} req/s "
+            f"p50 {self.percentile(0.5) * 1000:7.1f} ms  p99 {self.percentile(0.99) * 1000:7.1f} ms  "
+            f"max {max(self.latencies, default=0) * 1000:7.1f} ms  {self.errors} errors"
+        )
+
+
+async def run_load(url: str, path: str, concurrency: int, duration: float, warm_up: float = 2.0) -> LoadResult:
+    """Keep `concurrency` requests in flight for `duration` seconds after a warm-up and time each one."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        latencies: list[float] = []
+        errors = 0
+        measuring_from = time.perf_counter() + warm_up
+        deadline = measuring_from + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while (started := time.perf_counter()) < deadline:
+                try:
+                    response = await client.get(path)
+                    failed = response.status_code != 200
+                except httpx.HTTPError:
+                    failed = True
+                if started >= measuring_from:
+                    latencies.append(time.perf_counter() - started)
+                    errors += failed
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return LoadResult(requests=len(latencies), errors=errors, seconds=duration, latencies=latencies)
+
+
+def _seed(rows: int) -> None:
+    from backend.adapters.repostory.database import get_database
+    from backend.adapters.repostory.unified_deliveries.unified_delivery_model import UnifiedDeliveryModel
+    from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import (
+        UnifiedDeliveriesRepository,
+    )
+
+    database = get_database()
+    database.create_schema()
+    with database.session_factory() as session:
+        existing = session.scalar(select(func.count()).select_from(UnifiedDeliveryModel)) or 0
+    if existing < rows:
+        UnifiedDeliveriesRepository(database.session_factory).store_many(
+            uuid4(), list(unified_deliveries(rows - existing, source="load-test", seed=existing))
+        )
+    database.dispose()
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def _delayed_proxy(listen_port: int, upstream_host: str, upstream_port: int, delay: float) -> None:
+    async def forward(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delayed: bool) -> None:
+        # Chunks are released in order once their delay has passed, like a link with that latency.
+        queue: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue()
+
+        async def release() -> None:
+            while True:
+                due, chunk = await queue.get()
+                await asyncio.sleep(max(due - time.monotonic(), 0))
+                if not chunk:
+                    writer.close()
+                    return
+                writer.write(chunk)
+                await writer.drain()
+
+        releasing = asyncio.create_task(release())
+        while True:
+            chunk = await reader.read(65536)
+            queue.put_nowait((time.monotonic() + (delay if delayed else 0), chunk))
+            if not chunk:
+                break
+        await releasing
+
+    async def connect(client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection(upstream_host, upstream_port)
+        await asyncio.gather(
+            forward(client_reader, upstream_writer, delayed=False),
+            forward(upstream_reader, client_writer, delayed=True),
+            return_exceptions=True,
+        )
+
+    server = await asyncio.start_server(connect, "127.0.0.1", listen_port)
+    async with server:
+        await server.serve_forever()
+
+
+def _run_delayed_proxy(listen_port: int, upstream_host: str, upstream_port: int, delay: float) -> None:
+    asyncio.run(_delayed_proxy(listen_port, upstream_host, upstream_port, delay))
+
+
+def _serve_and_load(async_enabled: bool, args: argparse.Namespace) -> LoadResult:
+    port = _free_port()
+    environment = {**os.environ, "DB_ASYNC_ENABLED": str(async_enabled).lower()}
+    if args.database_port is not None:
+        environment.update({"POSTGRES_HOST": "127.0.0.1", "POSTGRES_PORT": str(args.database_port)})
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--no-access-log",
+         "--log-level", "warning"],
+        env=environment,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{url}/", timeout=1.0)
+                break
+            except httpx.HTTPError:
+                time.sleep(0.2)
+        else:
+            raise RuntimeError("The service did not start.")
+        return asyncio.run(run_load(url, args.path, args.concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.load_listing")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/backend")
+    parser.add_argument("--path", default="/deliveries?limit=50")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--compare", action="store_true", help="Start the service threaded, then async.")
+    parser.add_argument("--seed", type=int, default=10_000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Simulated database round-trip latency.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if not args.compare:
+        print(asyncio.run(run_load(args.url, args.path, args.concurrency, args.duration)).summary())
+        return
+    _seed(args.seed)
+    args.database_port = None
+    proxy = None
+    if args.db_latency_ms:
+        from backend.shared.config.settings import get_settings
+
+        settings = get_settings()
+        args.database_port = _free_port()
+        proxy = multiprocessing.Process(
+            target=_run_delayed_proxy,
+            args=(args.database_port, settings.postgres_host, settings.postgres_port, args.db_latency_ms / 1000),
+            daemon=True,
+        )
+        proxy.start()
+    print(
+        f"GET {args.path} with {args.concurrency} concurrent clients for {args.duration:.0f}s, "
+        f"{args.db_latency_ms:.0f} ms database latency"
+    )
+    try:
+        for name, async_enabled in (("threaded", False), ("async", True)):
+            print(f"{name:9} {_serve_and_load(async_enabled, args).summary()}")
+    finally:
+        if proxy is not None:
+            proxy.terminate()
+
+
+if __name__ == "__main__":
+    main()
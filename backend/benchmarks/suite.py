@@ -0,0 +1,329 @@
+"""Benchmark suite for the fetch → decode → map → store pipeline, with results to compare between commits.
+
+Usage:
+    python -m backend.benchmarks.suite run [--sizes 1k,100k,1m] [--repeat 3] [--output FILE]
+    python -m backend.benchmarks.suite compare BASELINE CURRENT [--threshold 0.1]
+
+`run` generates synthetic Partner A and Partner B payloads of each size and times every stage
+on its own, then the whole pipeline through `FetchPartnerDeliveriesUseCase` and
+`StoreUnifiedDeliveriesUseCase`, buffered (`end_to_end`) and streamed in STREAM_BATCH_SIZE
+batches (`end_to_end_stream`). Only partner I/O is replaced, by a port that decodes the
+generated payload in memory. Each stage reports the best of `--repeat` runs, and the results
+are written as JSON to `--output` or stdout.
+
+Writes go to BENCHMARK_DATABASE_URL (e.g. a local Postgres) or a temporary SQLite file. The
+tables are dropped and recreated before every timed write, so point it at a scratch database.
+
+`compare` matches the benchmarks of two result files and exits with status 1 when any of them
+got slower than the baseline by more than `--threshold` (a fraction, 0.1 = 10%).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, Sequence
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.outbound.partners.partner_payload_schemas import PartnerPayloadSchema, partner_payload_schemas
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.application.use_cases.fetch_deliveries import FetchPartnerDeliveriesUseCase
+from backend.application.use_cases.mapper.partner_delivery_mapper import get_partner_delivery_mapper
+from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
+from backend.application.use_cases.store_unified_deliveries import StoreUnifiedDeliveriesUseCase
+from backend.benchmarks.synthetic import partner_a_records, partner_b_records, use_benchmark_environment
+from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
+from backend.ports.fetch_partner_deliveries_port import FetchPartnerDeliveriesPort
+from backend.shared.config.settings import get_settings
+from backend.shared.utils.date_utils import to_iso8601_utc
+from backend.shared.utils.json_stream import iter_json_array
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.1
+_SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+_SITE_ID = "site-1"
+# Streamed payloads are handed over in chunks of this size, like a response body read from the network.
+_STREAM_CHUNK_BYTES = 64 * 1024
+_END = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _Partner:
+    key: str
+    generate: Callable[[int], Iterator[dict[str, Any]]]
+    timestamp_field: str
+
+
+_PARTNERS = (
+    _Partner("partner_a", partner_a_records, "timestamp"),
+    _Partner("partner_b", partner_b_records, "deliveredAt"),
+)
+
+
+class _PayloadPort(FetchPartnerDeliveriesPort):
+    """Serve a generated payload as the partner response, decoding it like the HTTP adapter does."""
+
+    def __init__(self, schema: PartnerPayloadSchema, content: bytes) -> None:
+        self._schema = schema
+        self._content = content
+
+    def fetch(self, source: str, timeout: float | None = None) -> PartnerDelivery:
+        started = time.perf_counter()
+        records, malformed = self._schema.decode(self._content)
+        return PartnerDelivery(
+            delivery_data=records,
+            malformed=malformed,
+            decoded_bytes=len(self._content),
+            decode_seconds=time.perf_counter() - started,
+        )
+
+    def stream(
+        self,
+        source: str,
+        timeout: float | None = None,
+        stats: Stats | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        chunks = (
+            self._content[offset:offset + _STREAM_CHUNK_BYTES]
+            for offset in range(0, len(self._content), _STREAM_CHUNK_BYTES)
+        )
+        records = iter_json_array(chunks)
+        if stats is None:
+            yield from records
+            return
+        stats.record_bytes_received(len(self._content))
+        while True:
+            started = time.perf_counter()
+            record = next(records, _END)
+            stats.record_stage(PipelineStage.DECODE, time.perf_counter() - started)
+            if record is _END:
+                return
+            yield record
+
+
+def parse_size(value: str) -> int:
+    """Parse a record count such as `1000`, `100k` or `1m`."""
+    value = value.strip().lower()
+    multiplier = _SIZE_SUFFIXES.get(value[-1:], 1)
+    digits = value[:-1] if value[-1:] in _SIZE_SUFFIXES else value
+    if not digits.isdigit() or int(digits) == 0:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value!r}")
+    return int(digits) * multiplier
+
+
+def _best_of(repeat: int, run: Callable[[], Any], reset: Callable[[], None] | None = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _recreate_schema(engine: Engine) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _stats_updates(source: str, count: int) -> None:
+    stats = Stats.for_partner(source)
+    for _ in range(count):
+        stats.record_fetched()
+        stats.record_transformed()
+
+
+def _benchmark_partner(
+    partner: _Partner,
+    source: str,
+    count: int,
+    repeat: int,
+    engine: Engine,
+) -> dict[str, float]:
+    """Return the best time in seconds of each stage for `count` records of one partner."""
+    settings = get_settings()
+    schema = partner_payload_schemas(settings)[source]
+    content = json.dumps(list(partner.generate(count))).encode()
+    records, _ = schema.decode(content)
+    timestamps = [record[partner.timestamp_field] for record in records]
+    delivery = PartnerDelivery(delivery_data=records)
+    processor = PartnerDeliveryProcessor(get_partner_delivery_mapper())
+    unified_deliveries, _ = processor.process(delivery=delivery, source=source, site_id=_SITE_ID)
+    repository = UnifiedDeliveriesRepository(
+        sessionmaker(bind=engine, expire_on_commit=False),
+        batch_size=settings.db_insert_batch_size,
+        copy_threshold=settings.db_copy_threshold,
+    )
+    fetch_use_case = FetchPartnerDeliveriesUseCase(_PayloadPort(schema, content), get_partner_delivery_mapper())
+    store_use_case = StoreUnifiedDeliveriesUseCase(repository)
+
+    def end_to_end() -> None:
+        _, mapped = fetch_use_case.fetch_partner_deliveries(_SITE_ID, source)
+        store_use_case.store(uuid4(), mapped)
+
+    def end_to_end_stream() -> None:
+        job_id = uuid4()
+        fetch_use_case.stream_partner_deliveries(
+            _SITE_ID,
+            source,
+            Stats.for_partner(source),
+            settings.stream_batch_size,
+            lambda batch: store_use_case.store(job_id, batch),
+        )
+
+    def reset() -> None:
+        _recreate_schema(engine)
+
+    return {
+        "decode": _best_of(repeat, lambda: schema.decode(content)),
+        "parse_dates": _best_of(repeat, lambda: [to_iso8601_utc(value) for value in timestamps]),
+        "map": _best_of(repeat, lambda: processor.process(delivery=delivery, source=source, site_id=_SITE_ID)),
+        "stats": _best_of(repeat, lambda: _stats_updates(source, count)),
+        "store": _best_of(repeat, lambda: repository.store_many(uuid4(), unified_deliveries), reset),
+        "end_to_end": _best_of(repeat, end_to_end, reset),
+        "end_to_end_stream": _best_of(repeat, end_to_end_stream, reset),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run(sizes: Sequence[int], repeat: int, database_url: str | None = None) -> dict[str, Any]:
+    """Run every benchmark and return the results document."""
+    use_benchmark_environment()
+    settings = get_settings()
+    sources = {"partner_a": settings.source_a, "partner_b": settings.source_b}
+    database_url = database_url or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    engine = create_engine(database_url, future=True)
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for count in sizes:
+            for partner in _PARTNERS:
+                timings = _benchmark_partner(partner, sources[partner.key], count, repeat, engine)
+                for stage, seconds in timings.items():
+                    results[f"{partner.key}/{stage}/{count}"] = {
+                        "partner": partner.key,
+                        "stage": stage,
+                        "records": count,
+                        "seconds": seconds,
+                        "recordsPerSecond": count / seconds if seconds else None,
+                    }
+                    print(
+                        f"{partner.key:9} {stage:17} {count:>9} records {seconds:9.4f}s",
+                        file=sys.stderr,
+                    )
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+    return {
+        "version": RESULTS_VERSION,
+        "environment": {
+            "commit": _git_commit(),
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "database": engine.dialect.name,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[tuple[str, float]]:
+    """Return the benchmarks present in both documents that slowed down by more than `threshold`, with their ratio."""
+    regressions: list[tuple[str, float]] = []
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None or not previous["seconds"]:
+            continue
+        ratio = result["seconds"] / previous["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    if document.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path}: unsupported results version {document.get('version')!r}")
+    return document
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.suite", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write the results as JSON.")
+    run_parser.add_argument(
+        "--sizes",
+        type=lambda value: [parse_size(size) for size in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated record counts, e.g. 1k,100k,1m (default).",
+    )
+    run_parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the best one is reported.")
+    run_parser.add_argument("--output", help="Results file; defaults to stdout.")
+    compare_parser = commands.add_parser("compare", help="Fail when CURRENT regressed against BASELINE.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction of the baseline time (default 0.1).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.command == "run":
+        document = run(args.sizes, max(args.repeat, 1), os.environ.get("BENCHMARK_DATABASE_URL"))
+        output = json.dumps(document, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(output + "\n")
+        else:
+            print(output)
+        return 0
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    for setting in ("database", "cpus"):
+        if baseline["environment"].get(setting) != current["environment"].get(setting):
+            print(f"warning: the results were measured with a different {setting}.", file=sys.stderr)
+    regressions = compare(baseline, current, args.threshold)
+    for name, ratio in regressions:
+        print(f"REGRESSION {name}: {ratio:.2f}x the baseline time")
+    compared = len(current["results"].keys() & baseline["results"].keys())
+    print(f"{compared} benchmarks compared, {len(regressions)} slower than {1 + args.threshold:.2f}x the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Deterministic synthetic partner payloads and unified deliveries for benchmarks."""
+from __future__ import annotations
+
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
+
+from backend.domain.unified_delivery import UnifiedDelivery, compute_delivery_score
+
+_EPOCH = datetime(2025, 8, 1, tzinfo=timezone.utc)
+_SUPPLIERS = ("SupplierX", "SupplierY", "Innotech", "SupplierB1", "SupplierB4")
+_OFFSETS = ("Z", "+00:00", "+02:00", "-05:30")
+# Settings the mappers and repositories need; benchmarks supply them unless they are already set.
+BENCHMARK_ENVIRONMENT = {
+    "SCHEDULER_CRON": "0 * * * *",
+    "POSTGRES_USER": "bench",
+    "POSTGRES_PASSWORD": "bench",
+    "POSTGRES_DB": "bench",
+    "LOGISTICS_A_URL": "http://partner-a",
+    "LOGISTICS_B_URL": "http://partner-b",
+    "SOURCE_A": "Partner A",
+    "SOURCE_B": "Partner B",
+    "SITE_ID": "site-1",
+}
+
+
+def use_benchmark_environment() -> None:
+    for name, value in BENCHMARK_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+
+
+def _timestamp(rng: random.Random) -> str:
+    delivered_at = _EPOCH + timedelta(minutes=rng.randrange(60 * 24 * 30))
+    offset = rng.choice(_OFFSETS)
+    if offset == "Z":
+        return delivered_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return delivered_at.strftime("%Y-%m-%dT%H:%M:%S") + offset
+
+
+def partner_a_records(count: int, seed: int = 1) -> Iterator[dict[str, Any]]:
+    rng = random.Random(seed)
+    for index in range(count):
+        yield {
+            "deliveryId": f"DEL-{index:07d}-A",
+            "supplier": rng.choice(_SUPPLIERS),
+            "timestamp": _timestamp(rng),
+            "status": rng.choice(("delivered", "Delivered ", "cancelled", "pending", "unknown")),
+            "signedBy": rng.choice(("Martin Schulz", "Sophie Wagner", "")),
+        }
+
+
+def partner_b_records(count: int, seed: int = 2) -> Iterator[dict[str, Any]]:
+    rng = random.Random(seed)
+    for index in range(count):
+        yield {
+            "id": f"b-{index:07d}",
+            "provider": rng.choice(_SUPPLIERS),
+            "deliveredAt": _timestamp(rng),
+            "statusCode": rng.choice(("OK", "FAILED", "PENDING")),
+            "receiver": {"name": "Anna Becker", "signed": rng.random() < 0.5},
+        }
+
+
+def unified_deliveries(count: int, source: str = "source-a", site_id: str = "site-1", seed: int = 3) -> Iterator[UnifiedDelivery]:
+    rng = random.Random(seed)
+    for index in range(count):
+        delivered_at = _EPOCH + timedelta(minutes=rng.randrange(60 * 24 * 30))
+        supplier = rng.choice(_SUPPLIERS)
+        status = rng.choice(("delivered", "cancelled", "pending"))
+        signed = rng.random() < 0.5
+        yield UnifiedDelivery(
+            id=f"DEL-{index:07d}",
+            supplier=supplier,
+            delivered_at=delivered_at,
+            status=status,
+            signed=signed,
+            siteId=site_id,
+            source=source,
+            delivery_score=compute_delivery_score(delivered_at, signed),
+        )
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ColumnarFormat(str, Enum):
+    """File format of a columnar delivery export; the value is also the file extension."""
+
+    ARROW = "arrow"
+    PARQUET = "parquet"
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class CountMode(str, Enum):
+    """How the `total` of a listing page is obtained."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    COUNTER = "counter"
+    NONE = "none"
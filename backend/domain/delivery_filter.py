@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class DeliveryFilter(BaseModel):
+    """Optional criteria narrowing a listing of unified deliveries; unset fields do not filter.
+
+    `delivered_from` is inclusive and `delivered_to` exclusive.
+    """
+
+    site_id: str | None = None
+    supplier: str | None = None
+    status: str | None = None
+    job_id: str | None = None
+    delivered_from: datetime | None = None
+    delivered_to: datetime | None = None
+
+    model_config = {"frozen": True}
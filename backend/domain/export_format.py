@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """How `/deliveries/export` writes the deliveries it streams."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
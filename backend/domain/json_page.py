@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from backend.domain.count_mode import CountMode
+
+
+class JsonPage(BaseModel):
+    """A `Page` whose items arrive already serialized as a JSON array, to be forwarded without decoding."""
+
+    items_json: str
+    total: int | None
+    count_mode: CountMode = CountMode.EXACT
+    next_cursor: str | None = None
+
+    model_config = {"frozen": True}
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class MalformedRecord:
+    """A record of a partner payload that does not match the partner's schema."""
+
+    index: int
+    reason: str
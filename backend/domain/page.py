@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from backend.domain.count_mode import CountMode
+
+
+class Page(BaseModel):
+    """One page of a listing plus the cursor of the page after it, if any.
+
+    `total` is None when counting was skipped; `count_mode` is the strategy that produced it.
+    """
+
+    items: list[dict[str, Any]]
+    total: int | None
+    count_mode: CountMode = CountMode.EXACT
+    next_cursor: str | None = None
+
+    model_config = {"frozen": True}
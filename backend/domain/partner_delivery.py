@@ -1,9 +1,18 @@
+from dataclasses import dataclass, field
 from typing import Any, List
 
-from pydantic import BaseModel
+from backend.domain.malformed_record import MalformedRecord
 
 
-class PartnerDelivery(BaseModel):
-    """Raw delivery data fetched from a specific partner source."""
+@dataclass(slots=True)
+class PartnerDelivery:
+    """Raw delivery data fetched from a specific partner source.
+
+    `malformed` lists the records left out of `delivery_data` because they did not match the
+    partner's schema; `decoded_bytes` and `decode_seconds` describe decoding the response body.
+    """
 
     delivery_data: List[dict[str, Any]]
+    malformed: List[MalformedRecord] = field(default_factory=list)
+    decoded_bytes: int = 0
+    decode_seconds: float = 0.0
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class PipelineStage(str, Enum):
+    FETCH = "fetch"
+    DECODE = "decode"
+    MAP = "map"
+    STORE = "store"
@@ -1,50 +1,136 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
 
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats_fields import StatsFields
+from backend.domain.store_result import StoreResult
 
 
-class Stats(BaseModel):
-    """Statistics collected while processing deliveries for a single partner."""
+@dataclass(slots=True)
+class Stats:
+    """Statistics collected while processing deliveries for a single partner.
+
+    A plain accumulator: the record methods run once per delivery on the hot path, so they only
+    add to counters. `stage_seconds` holds the wall time spent in each pipeline stage.
+    """
 
     partner: str
-    stats: dict[StatsFields, int] = Field(
-        default_factory=lambda: {
-            StatsFields.FETCHED: 0,
-            StatsFields.TRANSFORMED: 0,
-            StatsFields.ERRORS: 0,
-        },
-    )
+    fetched: int = 0
+    transformed: int = 0
+    errors: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
     stored: int = 0
-
-    model_config = {"validate_assignment": True}
+    bytes_received: int = 0
+    stage_seconds: dict[PipelineStage, float] = field(default_factory=dict)
+    duration_seconds: float | None = None
+    peak_rss_bytes: int | None = None
 
     @classmethod
     def for_partner(cls, partner: str) -> Stats:
         """Factory that initialises stats for a specific partner."""
         return cls(partner=partner)
 
-    def _increment(self, field: StatsFields, amount: int) -> None:
-        self.stats[field] += amount
+    @property
+    def stats(self) -> dict[StatsFields, int]:
+        return {
+            StatsFields.FETCHED: self.fetched,
+            StatsFields.TRANSFORMED: self.transformed,
+            StatsFields.ERRORS: self.errors,
+            StatsFields.INSERTED: self.inserted,
+            StatsFields.UPDATED: self.updated,
+            StatsFields.UNCHANGED: self.unchanged,
+        }
 
     def record_fetched(self, count: int = 1) -> None:
-        self._increment(StatsFields.FETCHED, count)
+        self.fetched += count
 
     def record_transformed(self, count: int = 1) -> None:
-        self._increment(StatsFields.TRANSFORMED, count)
+        self.transformed += count
 
     def record_errors(self, count: int = 1) -> None:
-        self._increment(StatsFields.ERRORS, count)
+        self.errors += count
 
     def record_stored(self, count: int = 1) -> None:
         self.stored += count
 
+    def record_store_result(self, result: StoreResult) -> None:
+        self.inserted += result.inserted
+        self.updated += result.updated
+        self.unchanged += result.unchanged
+
+    def record_bytes_received(self, count: int) -> None:
+        self.bytes_received += count
+
+    def record_stage(self, stage: PipelineStage, seconds: float) -> None:
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def timed(self, stage: PipelineStage) -> Iterator[None]:
+        """Add the wall time of the enclosed block to `stage`, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - started)
+
+    def seconds_in(self, *stages: PipelineStage) -> float:
+        return sum(self.stage_seconds.get(stage, 0.0) for stage in stages)
+
+    def record_throughput(self, duration_seconds: float, peak_rss_bytes: int) -> None:
+        self.duration_seconds = duration_seconds
+        self.peak_rss_bytes = peak_rss_bytes
+
+    def merge(self, other: Stats) -> None:
+        """Add the counts and timings collected for another part of the same partner's payload."""
+        self.fetched += other.fetched
+        self.transformed += other.transformed
+        self.errors += other.errors
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.stored += other.stored
+        self.bytes_received += other.bytes_received
+        for stage, seconds in other.stage_seconds.items():
+            self.record_stage(stage, seconds)
+
+    @property
+    def decode_ms_per_mb(self) -> float | None:
+        if not self.bytes_received or PipelineStage.DECODE not in self.stage_seconds:
+            return None
+        return self.stage_seconds[PipelineStage.DECODE] * 1000 / (self.bytes_received / 1_000_000)
+
+    @property
+    def records_per_second(self) -> float | None:
+        if not self.duration_seconds:
+            return None
+        return self.fetched / self.duration_seconds
+
     def as_dict(self) -> dict[str, object]:
         """Return a serialisable representation aligned with the assignment contract."""
-        partner_stats = {
-            StatsFields.FETCHED.value: self.stats[StatsFields.FETCHED],
-            StatsFields.TRANSFORMED.value: self.stats[StatsFields.TRANSFORMED],
-            StatsFields.ERRORS.value: self.stats[StatsFields.ERRORS],
+        partner_stats: dict[str, object] = {
+            StatsFields.FETCHED.value: self.fetched,
+            StatsFields.TRANSFORMED.value: self.transformed,
+            StatsFields.ERRORS.value: self.errors,
+            StatsFields.INSERTED.value: self.inserted,
+            StatsFields.UPDATED.value: self.updated,
+            StatsFields.UNCHANGED.value: self.unchanged,
         }
+        if self.duration_seconds is not None:
+            partner_stats["durationSeconds"] = round(self.duration_seconds, 3)
+            partner_stats["recordsPerSecond"] = round(self.records_per_second or 0.0, 1)
+            partner_stats["peakRssBytes"] = self.peak_rss_bytes
+        if self.bytes_received:
+            partner_stats["bytesReceived"] = self.bytes_received
+        if self.decode_ms_per_mb is not None:
+            partner_stats["decodeMsPerMb"] = round(self.decode_ms_per_mb, 2)
+        if self.stage_seconds:
+            partner_stats["stageSeconds"] = {
+                stage.value: round(self.stage_seconds[stage], 3) for stage in PipelineStage if stage in self.stage_seconds
+            }
         return {self.partner: partner_stats, StatsFields.STORED.value: self.stored}
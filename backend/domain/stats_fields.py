@@ -5,4 +5,7 @@ class StatsFields(str, Enum):
     FETCHED = "fetched"
     TRANSFORMED = "transformed"
     ERRORS = "errors"
-    STORED = "stored"
\ No newline at end of file
+    STORED = "stored"
+    INSERTED = "inserted"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
\ No newline at end of file
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class StoreResult(BaseModel):
+    """Outcome of an idempotent write of unified deliveries."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    model_config = {"frozen": True}
+
+    def __add__(self, other: StoreResult) -> StoreResult:
+        return StoreResult(
+            inserted=self.inserted + other.inserted,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
+        )
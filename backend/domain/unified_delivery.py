@@ -1,24 +1,25 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, time
 
-from pydantic import BaseModel
 
+@dataclass(slots=True)
+class UnifiedDelivery:
+    """A delivery in the unified schema, as passed from the mappers to the repository.
+
+    The mappers check partner payloads before building one, so construction does no validation;
+    `delivered_at` is always a timezone-aware UTC datetime.
+    """
 
-class UnifiedDelivery(BaseModel):
     id: str
     supplier: str
-    delivered_at: str
+    delivered_at: datetime
     status: str
     signed: bool
     siteId: str
     source: str
-
-    model_config = {"populate_by_name": True, "frozen": True}
-
-    @property
-    def delivery_score(self) -> float:
-        return compute_delivery_score(self.delivered_at, self.signed)
+    delivery_score: float
 
 
 def compute_delivery_score(delivered_at: datetime, signed: bool) -> float:
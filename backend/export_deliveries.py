@@ -0,0 +1,73 @@
+"""Export unified deliveries to an Arrow IPC or Parquet file.
+
+Usage:
+    python -m backend.export_deliveries OUTPUT [--format arrow|parquet] [--job-id ID] [--site-id ID]
+        [--supplier NAME] [--status STATUS] [--delivered-from ISO8601] [--delivered-to ISO8601]
+
+Reads the database configured by the environment (POSTGRES_*), like the service. The format
+defaults to the extension of OUTPUT, or Parquet. ``--job-id`` selects the deliveries that job
+last wrote, not every delivery it fetched.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Sequence
+
+from backend.adapters.repostory.database import get_database
+from backend.adapters.repostory.postgres_config import get_postgres_config
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import get_unified_deliveries_port
+from backend.domain.columnar_format import ColumnarFormat
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.shared.utils.columnar_export import ColumnarFileWriter
+from backend.shared.utils.date_utils import parse_iso8601_utc
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m backend.export_deliveries")
+    parser.add_argument("output")
+    parser.add_argument("--format", type=ColumnarFormat, choices=list(ColumnarFormat), default=None)
+    parser.add_argument(
+        "--job-id",
+        help="Deliveries this job last wrote; an unchanged delivery keeps the job that wrote it before.",
+    )
+    parser.add_argument("--site-id")
+    parser.add_argument("--supplier")
+    parser.add_argument("--status")
+    parser.add_argument("--delivered-from", type=parse_iso8601_utc, help="Inclusive lower bound.")
+    parser.add_argument("--delivered-to", type=parse_iso8601_utc, help="Exclusive upper bound.")
+    return parser.parse_args(argv)
+
+
+def _output_format(args: argparse.Namespace) -> ColumnarFormat:
+    if args.format is not None:
+        return args.format
+    extension = os.path.splitext(args.output)[1].lstrip(".")
+    return ColumnarFormat(extension) if extension in {member.value for member in ColumnarFormat} else ColumnarFormat.PARQUET
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Write the matching deliveries to the output file; return the number of rows written."""
+    args = _parse_args(argv)
+    delivery_filter = DeliveryFilter(
+        job_id=args.job_id,
+        site_id=args.site_id,
+        supplier=args.supplier,
+        status=args.status,
+        delivered_from=args.delivered_from,
+        delivered_to=args.delivered_to,
+    )
+    database = get_database()
+    try:
+        deliveries_port = get_unified_deliveries_port(get_postgres_config(), database)
+        with ColumnarFileWriter(args.output, _output_format(args)) as writer:
+            for batch in deliveries_port.export_delivery_batches(delivery_filter):
+                writer.write(batch)
+    finally:
+        database.dispose()
+    print(f"Wrote {writer.rows} deliveries to {args.output}")
+    return writer.rows
+
+
+if __name__ == "__main__":
+    main()
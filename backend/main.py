@@ -1,19 +1,40 @@
 import logging
-from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import Any
-
-from fastapi import Depends, FastAPI, Query
+import os
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette import status
+from starlette.background import BackgroundTask
 
-from backend.adapters.repostory.jobs.job_repository import get_jobs_port
-from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import (
-    get_unified_deliveries_port,
+from backend.adapters.outbound.partners.partner_http_client import (
+    PartnerHttpClient,
+    get_partner_http_client,
+)
+from backend.adapters.repostory.database import get_async_database, get_database
+from backend.adapters.repostory.jobs.async_job_repository import get_async_jobs_port
+from backend.adapters.repostory.unified_deliveries.async_unified_delivery_repository import (
+    get_async_unified_deliveries_port,
 )
 from backend.adapters.scheduling.job_scheduler import Scheduler, get_job_scheduler
-from backend.adapters.scheduling.job_status import JobStatus
-from backend.ports.jobs_port import JobsPort
-from backend.ports.unified_deliveries_port import UnifiedDeliveriesPort
+from backend.application.use_cases.mapping_pool import shutdown_mapping_executor
+from backend.ports.async_jobs_port import AsyncJobsPort
+from backend.domain.columnar_format import ColumnarFormat
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.export_format import ExportFormat
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.ports.async_unified_deliveries_port import AsyncUnifiedDeliveriesPort
+from backend.shared.config.settings import get_settings
+from backend.shared.utils import columnar_export
+from backend.shared.utils.cursor import InvalidCursorError
+from backend.shared.utils.export_encoding import MEDIA_TYPES, encode_export
+from backend.shared.utils.json_response import FastJSONResponse, to_json_with_items
+from backend.shared.utils.metrics import RequestMetricsMiddleware, observe_pool
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -22,11 +43,27 @@ MAX_PAGE_SIZE = 100
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    database = get_database()
+    database.create_schema()
+    database.warm_up()
+    observe_pool("sync", database.engine)
+    async_database = get_async_database() if get_settings().db_async_enabled else None
+    if async_database is not None:
+        await async_database.warm_up()
+        observe_pool("async", async_database.engine.sync_engine)
+    partner_http_client = get_partner_http_client()
+    partner_http_client.open()
     logger.info("Application started.")
     yield
+    partner_http_client.close()
+    shutdown_mapping_executor()
+    if async_database is not None:
+        await async_database.dispose()
+    database.dispose()
     logger.info("Application shutdown complete.")
 
 app = FastAPI(title="VESTIGAS Backend Challenge", lifespan=lifespan, root_path="/backend")
+app.add_middleware(RequestMetricsMiddleware)
 
 @app.get("/")
 def root():
@@ -39,76 +76,145 @@ def start_scheduled_jobs(scheduler: Scheduler = Depends(get_job_scheduler)):
     scheduler.start_fetch_partner_deliveries_scheduled_job()
 
 
-def _isoformat(dt: datetime | None) -> str | None:
-    if dt is None:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
-    return dt.isoformat().replace("+00:00", "Z")
+@app.get("/admin/http-pool")
+def partner_http_pool_metrics(partner_http_client: PartnerHttpClient = Depends(get_partner_http_client)):
+    return partner_http_client.pool_metrics()
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+async def _fetch_page(
+    list_page: Callable[..., Awaitable[Page | JsonPage]],
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count: CountMode | None,
+    **criteria: Any,
+) -> Page | JsonPage:
+    if cursor is not None and offset:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Use either cursor or offset, not both.")
+    # Follow-up cursor pages skip counting unless a mode is requested explicitly.
+    if count is None:
+        count = CountMode.NONE if cursor is not None else CountMode.EXACT
+    try:
+        return await list_page(limit=limit, offset=offset, cursor=cursor, count_mode=count, **criteria)
+    except InvalidCursorError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(exc)) from exc
+
+
+def delivery_filter_params(
+    site_id: str | None = Query(None, alias="siteId"),
+    supplier: str | None = Query(None),
+    delivery_status: str | None = Query(None, alias="status"),
+    job_id: str | None = Query(
+        None, alias="jobId", description="The job that last wrote the row; unchanged rows keep their earlier job."
+    ),
+    delivered_from: datetime | None = Query(None, alias="deliveredFrom", description="Inclusive lower bound."),
+    delivered_to: datetime | None = Query(None, alias="deliveredTo", description="Exclusive upper bound."),
+) -> DeliveryFilter:
+    return DeliveryFilter(
+        site_id=site_id,
+        supplier=supplier,
+        status=delivery_status,
+        job_id=job_id,
+        delivered_from=delivered_from,
+        delivered_to=delivered_to,
+    )
+
+
+def _page_response(page: Page | JsonPage, limit: int, offset: int) -> Response:
+    content = {
+        "total": page.total,
+        "countMode": page.count_mode.value,
+        "limit": limit,
+        "offset": offset,
+        "nextCursor": page.next_cursor,
+    }
+    if isinstance(page, JsonPage):
+        # The items were rendered by the database and are forwarded without being decoded.
+        return Response(to_json_with_items(page.items_json, content), media_type="application/json")
+    # The repositories return items in the response shape; the response class encodes them as they are.
+    return FastJSONResponse({"items": page.items, **content})
 
 
-@app.get("/deliveries/jobs")
-def list_jobs(
+@app.get("/deliveries/jobs", response_class=FastJSONResponse)
+async def list_jobs(
     limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
-    jobs_port: JobsPort = Depends(get_jobs_port),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous page's nextCursor."),
+    count: CountMode | None = Query(None, description="How to compute total; defaults to exact, or none with a cursor."),
+    jobs_port: AsyncJobsPort = Depends(get_async_jobs_port),
 ):
-    items, total = jobs_port.list_jobs(limit=limit, offset=offset)
-    formatted = []
-    for item in items:
-        status_raw = item.get("status")
-        if isinstance(status_raw, JobStatus):
-            status_value = status_raw.value.lower()
-        elif isinstance(status_raw, str):
-            status_value = status_raw.lower()
-        else:
-            status_value = None
-
-        formatted.append(
-            {
-                "jobId": item.get("jobId"),
-                "status": status_value,
-                "createdAt": _isoformat(item.get("createdAt")),
-                "updatedAt": _isoformat(item.get("updatedAt")),
-                "input": item.get("input", {}),
-                "stats": item.get("stats") or {},
-                "error": item.get("error"),
-            },
-        )
-    return {
-        "items": formatted,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    list_page = jobs_port.list_jobs_json if get_settings().db_json_pages_enabled else jobs_port.list_jobs
+    page = await _fetch_page(list_page, limit, offset, cursor, count)
+    return _page_response(page, limit, offset)
 
 
-@app.get("/deliveries")
-def list_deliveries(
+@app.get("/deliveries", response_class=FastJSONResponse)
+async def list_deliveries(
     limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
-    deliveries_port: UnifiedDeliveriesPort = Depends(get_unified_deliveries_port),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous page's nextCursor."),
+    count: CountMode | None = Query(None, description="How to compute total; defaults to exact, or none with a cursor."),
+    delivery_filter: DeliveryFilter = Depends(delivery_filter_params),
+    deliveries_port: AsyncUnifiedDeliveriesPort = Depends(get_async_unified_deliveries_port),
 ):
-    items, total = deliveries_port.list_deliveries(limit=limit, offset=offset)
-    formatted: list[dict[str, Any]] = []
-    for item in items:
-        formatted.append(
-            {
-                "id": item.get("id"),
-                "supplier": item.get("supplier"),
-                "deliveredAt": item.get("deliveredAt"),
-                "status": item.get("status"),
-                "signed": item.get("signed"),
-                "siteId": item.get("siteId"),
-                "source": item.get("source"),
-                "deliveryScore": item.get("deliveryScore"),
-            },
+    if get_settings().db_json_pages_enabled:
+        list_page = deliveries_port.list_deliveries_json
+    else:
+        list_page = deliveries_port.list_deliveries
+    page = await _fetch_page(list_page, limit, offset, cursor, count, delivery_filter=delivery_filter)
+    return _page_response(page, limit, offset)
+
+
+@app.get("/deliveries/export")
+async def export_deliveries(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    compress: bool = Query(False, alias="gzip", description="Send the body gzip-encoded."),
+    delivery_filter: DeliveryFilter = Depends(delivery_filter_params),
+    deliveries_port: AsyncUnifiedDeliveriesPort = Depends(get_async_unified_deliveries_port),
+) -> StreamingResponse:
+    """Stream every delivery matching the listing filters, in id order, one batch of rows at a time."""
+    headers = {"Content-Disposition": f'attachment; filename="deliveries.{export_format.value}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        encode_export(deliveries_port.export_deliveries(delivery_filter), export_format, compress),
+        media_type=MEDIA_TYPES[export_format],
+        headers=headers,
+    )
+
+
+@app.get("/deliveries/export/columnar")
+async def export_deliveries_columnar(
+    columnar_format: ColumnarFormat = Query(ColumnarFormat.PARQUET, alias="format"),
+    delivery_filter: DeliveryFilter = Depends(delivery_filter_params),
+    deliveries_port: AsyncUnifiedDeliveriesPort = Depends(get_async_unified_deliveries_port),
+) -> FileResponse:
+    """Export the matching deliveries, e.g. one job's with `jobId`, as an Arrow IPC or Parquet file.
+
+    `jobId` selects the rows that job last wrote. The store leaves an unchanged delivery with the
+    job that first wrote it, so a job that re-fetched it does not export it.
+
+    The file is written to EXPORT_DIR (or the temporary directory) batch by batch, served from
+    disk and removed once it has been sent.
+    """
+    path = columnar_export.new_export_path(columnar_format, get_settings().export_dir)
+    try:
+        await columnar_export.write_columnar_file(
+            deliveries_port.export_delivery_batches(delivery_filter), path, columnar_format
         )
-    return {
-        "items": formatted,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    except BaseException:
+        # Normally already removed by the writer; not when opening the file failed.
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+        raise
+    return FileResponse(
+        path,
+        media_type=columnar_export.MEDIA_TYPES[columnar_format],
+        filename=f"deliveries.{columnar_format.value}",
+        background=BackgroundTask(os.unlink, path),
+    )
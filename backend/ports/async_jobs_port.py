@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from backend.domain.count_mode import CountMode
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+
+
+class AsyncJobsPort(ABC):
+    """Read side of `JobsPort` for async request handlers; jobs are still written by the scheduler threads."""
+
+    @abstractmethod
+    async def list_jobs(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page:
+        """Return a page of persisted jobs, newest first, and the overall total; see `JobsPort.list_jobs`."""
+        pass
+
+    @abstractmethod
+    async def list_jobs_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> JsonPage:
+        """Return a page of jobs with its items serialized as JSON; see `JobsPort.list_jobs_json`."""
+        pass
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
+
+import pyarrow as pa
+
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+
+
+class AsyncUnifiedDeliveriesPort(ABC):
+    """Read side of `UnifiedDeliveriesPort` for async request handlers; deliveries are still stored synchronously."""
+
+    @abstractmethod
+    async def list_deliveries(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> Page:
+        """Return a page of stored unified deliveries and their total; see `UnifiedDeliveriesPort.list_deliveries`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_deliveries_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> JsonPage:
+        """Return a page of deliveries with its items serialized as JSON; see `UnifiedDeliveriesPort.list_deliveries_json`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_deliveries(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield every matching delivery in batches; see `UnifiedDeliveriesPort.export_deliveries`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_delivery_batches(self, delivery_filter: DeliveryFilter | None = None) -> AsyncIterator[pa.RecordBatch]:
+        """Yield every matching delivery in record batches; see `UnifiedDeliveriesPort.export_delivery_batches`."""
+        raise NotImplementedError
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Iterator
 
 from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.stats import Stats
 
 
 class FetchPartnerDeliveriesPort(ABC):
 
     @abstractmethod
-    def fetch(self, source: str) -> PartnerDelivery:
-        """Retrieve raw partner deliveries for the given partner source."""
+    def fetch(self, source: str, timeout: float | None = None) -> PartnerDelivery:
+        """Retrieve raw partner deliveries for the given partner source within an optional deadline in seconds."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        source: str,
+        timeout: float | None = None,
+        stats: Stats | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw partner delivery records one by one as the partner response arrives.
+
+        When given, `stats` receives the bytes received and the fetch and decode times.
+        """
         pass
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any
 from uuid import UUID
 
 from backend.adapters.scheduling.job_status import JobStatus
+from backend.domain.count_mode import CountMode
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
 from backend.domain.stats import Stats
 
 
@@ -19,10 +21,32 @@ class JobsPort(ABC):
 
     @abstractmethod
     def update_job_stats(self, job_id: UUID, stats: Stats, updated_at: datetime, error: str | None = None) -> None:
-        """Update stats, error message, and timestamp for a persisted job."""
+        """Record one partner's stats and error, keeping the other partners' entries, and the job's timestamp."""
         pass
 
     @abstractmethod
-    def list_jobs(self, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
-        """Return a paginated collection of persisted jobs and the overall total."""
+    def list_jobs(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page:
+        """Return a page of persisted jobs, newest first, and the overall total.
+
+        When `cursor` is given, the page starts after the row it encodes and `offset` is ignored.
+        `count_mode` selects how the total is obtained; the page reports the mode actually used.
+        Items are in the shape the API returns, with aware UTC datetimes.
+        """
+        pass
+
+    @abstractmethod
+    def list_jobs_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> JsonPage:
+        """Return the page `list_jobs` would, with its items already serialized as a JSON array."""
         pass
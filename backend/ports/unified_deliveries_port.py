@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, Sequence
 from uuid import UUID
 
+import pyarrow as pa
+
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.domain.store_result import StoreResult
 from backend.domain.unified_delivery import UnifiedDelivery
 
 
@@ -16,6 +23,48 @@ class UnifiedDeliveriesPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_deliveries(self, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
-        """Return a paginated list of stored unified deliveries and the overall total."""
+    def store_many(self, job_id: UUID, unified_deliveries: Sequence[UnifiedDelivery]) -> StoreResult:
+        """Idempotently persist all unified deliveries of the given job in a single transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_deliveries(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> Page:
+        """Return a page of stored unified deliveries matching `delivery_filter` and their total.
+
+        When `cursor` is given, the page starts after the row it encodes and `offset` is ignored.
+        `count_mode` selects how the total is obtained; the page reports the mode actually used.
+        Items are in the shape the API returns, with `deliveredAt` as an aware UTC datetime.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_deliveries_json(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        delivery_filter: DeliveryFilter | None = None,
+    ) -> JsonPage:
+        """Return the page `list_deliveries` would, with its items already serialized as a JSON array."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_deliveries(self, delivery_filter: DeliveryFilter | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Yield every delivery matching `delivery_filter` in batches, in the shape `list_deliveries` returns.
+
+        The deliveries are read as the batches are consumed, so memory stays bounded by one batch.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_delivery_batches(self, delivery_filter: DeliveryFilter | None = None) -> Iterator[pa.RecordBatch]:
+        """Yield the batches `export_deliveries` would as Arrow record batches of `DELIVERY_SCHEMA`."""
         raise NotImplementedError
@@ -1,7 +1,7 @@
 import logging
 from functools import lru_cache
 from types import MappingProxyType
-from typing import Mapping
+from typing import Any, Mapping
 from urllib.parse import quote_plus
 
 from apscheduler.triggers.cron import CronTrigger
@@ -23,7 +23,33 @@ class Settings(BaseSettings):
     source_a: str = Field(validation_alias="SOURCE_A")
     source_b: str = Field(validation_alias="SOURCE_B")
     site_id: str = Field(validation_alias="SITE_ID")
+    db_insert_batch_size: int = Field(default=1000, gt=0, validation_alias="DB_INSERT_BATCH_SIZE")
+    db_copy_threshold: int = Field(default=50_000, gt=0, validation_alias="DB_COPY_THRESHOLD")
+    db_export_batch_size: int = Field(default=2000, gt=0, validation_alias="DB_EXPORT_BATCH_SIZE")
+    export_dir: str | None = Field(default=None, validation_alias="EXPORT_DIR")
+    db_pool_size: int = Field(default=5, gt=0, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, ge=0, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+    db_pool_timeout: float = Field(default=30.0, gt=0, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_warmup: int | None = Field(default=None, ge=0, validation_alias="DB_POOL_WARMUP")
+    db_statement_timeout_ms: int = Field(default=30_000, ge=0, validation_alias="DB_STATEMENT_TIMEOUT_MS")
+    db_async_enabled: bool = Field(default=True, validation_alias="DB_ASYNC_ENABLED")
+    db_json_pages_enabled: bool = Field(default=False, validation_alias="DB_JSON_PAGES_ENABLED")
     http_timeout: float = Field(default=5.0, validation_alias="HTTP_TIMEOUT")
+    http2_enabled: bool = Field(default=False, validation_alias="HTTP2_ENABLED")
+    http_max_connections: int = Field(default=10, validation_alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=5, validation_alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=30.0, validation_alias="HTTP_KEEPALIVE_EXPIRY")
+    http_partner_limits: dict[str, dict[str, Any]] = Field(default_factory=dict, validation_alias="HTTP_PARTNER_LIMITS")
+    partner_fetch_deadline: float = Field(default=10.0, validation_alias="PARTNER_FETCH_DEADLINE")
+    job_deadline: float = Field(default=60.0, validation_alias="JOB_DEADLINE")
+    partner_streaming_enabled: bool = Field(default=False, validation_alias="PARTNER_STREAMING_ENABLED")
+    stream_batch_size: int = Field(default=1000, gt=0, validation_alias="STREAM_BATCH_SIZE")
+    columnar_mapping_enabled: bool = Field(default=False, validation_alias="COLUMNAR_MAPPING_ENABLED")
+    columnar_batch_size: int = Field(default=10_000, gt=0, validation_alias="COLUMNAR_BATCH_SIZE")
+    process_pool_enabled: bool = Field(default=False, validation_alias="PROCESS_POOL_ENABLED")
+    process_pool_size: int | None = Field(default=None, gt=0, validation_alias="PROCESS_POOL_SIZE")
+    process_pool_chunk_size: int = Field(default=50_000, gt=0, validation_alias="PROCESS_POOL_CHUNK_SIZE")
 
     model_config = SettingsConfigDict(extra="ignore", env_prefix="", case_sensitive=False)
 
@@ -0,0 +1,124 @@
+"""Write unified deliveries to Arrow IPC or Parquet files, one record batch at a time."""
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from typing import Any, AsyncIterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from starlette.concurrency import run_in_threadpool
+
+from backend.domain.columnar_format import ColumnarFormat
+
+# One column per `UnifiedDelivery` field, under the same name.
+DELIVERY_SCHEMA = pa.schema([
+    pa.field("id", pa.string(), nullable=False),
+    pa.field("supplier", pa.string(), nullable=False),
+    pa.field("delivered_at", pa.timestamp("us", tz="UTC"), nullable=False),
+    pa.field("status", pa.string(), nullable=False),
+    pa.field("signed", pa.bool_(), nullable=False),
+    pa.field("siteId", pa.string(), nullable=False),
+    pa.field("source", pa.string(), nullable=False),
+    pa.field("delivery_score", pa.float64(), nullable=False),
+])
+
+MEDIA_TYPES = {
+    ColumnarFormat.ARROW: "application/vnd.apache.arrow.file",
+    ColumnarFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+# Batches are gathered to this many rows before being written, so Parquet row groups are not
+# as small as the database fetches.
+_ROWS_PER_WRITE = 64 * 1024
+
+
+def delivery_record_batch(columns: list[tuple[Any, ...]]) -> pa.RecordBatch:
+    """Build a record batch of `DELIVERY_SCHEMA` from one sequence of values per column, in schema order.
+
+    Naive datetimes are taken to be UTC already.
+    """
+    arrays = [pa.array(values, type=field.type) for values, field in zip(columns, DELIVERY_SCHEMA)]
+    return pa.RecordBatch.from_arrays(arrays, schema=DELIVERY_SCHEMA)
+
+
+class ColumnarFileWriter:
+    """Write record batches of `DELIVERY_SCHEMA` to `path`; memory stays bounded by `_ROWS_PER_WRITE` rows.
+
+    Used as a context manager, the file is completed on success and removed if an exception escapes,
+    so a failed export never leaves a readable but truncated file behind.
+    """
+
+    def __init__(self, path: str, columnar_format: ColumnarFormat) -> None:
+        self.path = path
+        if columnar_format is ColumnarFormat.PARQUET:
+            self._writer = pq.ParquetWriter(path, DELIVERY_SCHEMA)
+        else:
+            self._writer = pa.ipc.new_file(path, DELIVERY_SCHEMA)
+        self._pending: list[pa.RecordBatch] = []
+        self._pending_rows = 0
+        self.rows = 0
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        self.rows += batch.num_rows
+        if self._pending_rows >= _ROWS_PER_WRITE:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def abort(self) -> None:
+        """Drop the pending rows and remove the file instead of completing it."""
+        self._pending = []
+        self._pending_rows = 0
+        try:
+            self._writer.close()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._writer.write_table(pa.Table.from_batches(self._pending, schema=DELIVERY_SCHEMA))
+        self._pending = []
+        self._pending_rows = 0
+
+    def __enter__(self) -> ColumnarFileWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def new_export_path(columnar_format: ColumnarFormat, directory: str | None = None) -> str:
+    """Create an empty file for an export in `directory`, or the system temporary directory."""
+    descriptor, path = tempfile.mkstemp(prefix="deliveries-", suffix=f".{columnar_format.value}", dir=directory)
+    os.close(descriptor)
+    return path
+
+
+async def write_columnar_file(
+    batches: AsyncIterable[pa.RecordBatch],
+    path: str,
+    columnar_format: ColumnarFormat,
+) -> int:
+    """Write `batches` to `path` as they arrive, encoding on the worker thread pool; return the row count.
+
+    `path` is removed if writing fails.
+    """
+    writer = await run_in_threadpool(ColumnarFileWriter, path, columnar_format)
+    try:
+        async for batch in batches:
+            await run_in_threadpool(writer.write, batch)
+    except BaseException:
+        await run_in_threadpool(writer.abort)
+        raise
+    await run_in_threadpool(writer.close)
+    return writer.rows
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque, URL-safe cursor."""
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor produced by `encode_cursor` holding exactly `size` values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Malformed pagination cursor")
+    return values
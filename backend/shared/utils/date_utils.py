@@ -1,8 +1,16 @@
-from datetime import datetime, timezone
+import re
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
+from typing import Iterable
 
 from dateutil.parser import isoparse
 
+# The shapes partners actually send: seconds precision or up to microseconds, with `Z` or `±HH:MM`.
+_STRICT_ISO8601 = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]{1,6})?(Z|[+-][0-9]{2}:[0-9]{2})\Z",
+)
+_UTC_DESIGNATORS = frozenset({"Z", "+00:00", "-00:00"})
+
 
 class Clock:
     def get_utc_now(self) -> datetime:
@@ -14,11 +22,84 @@ def get_utc_clock() -> Clock:
     """Return the shared UtcMidnightToday singleton."""
     return Clock()
 
+def to_utc(value: datetime) -> datetime:
+    """Return `value` as an aware UTC datetime; naive values are taken to be UTC already."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_iso8601_utc(value: datetime) -> str:
+    """Format `value` as ISO 8601 in UTC ending with 'Z'; naive values are taken to be UTC already."""
+    return _format_utc(to_utc(value))
+
+
 def to_iso8601_utc(date_str: str) -> str:
     """
     Parse an ISO 8601 datetime string and return it normalized to UTC (ending with 'Z').
     Only accepts strings that explicitly include timezone information.
     """
+    match = _STRICT_ISO8601.match(date_str) if isinstance(date_str, str) else None
+    if match is not None:
+        fraction, designator = match.groups()
+        try:
+            if fraction is None and designator in _UTC_DESIGNATORS:
+                # Already in normalized form once the fields are known to be valid.
+                datetime.fromisoformat(date_str[:19])
+                return date_str[:19] + "Z"
+            return _parse_strict(date_str, match).isoformat() + "Z"
+        except (ValueError, OverflowError):
+            pass
+    return _format_utc(_parse_general(date_str))
+
+
+def parse_iso8601_utc(date_str: str) -> datetime:
+    """Parse a timezone-aware ISO 8601 string into an aware UTC datetime; see `to_iso8601_utc`."""
+    match = _STRICT_ISO8601.match(date_str) if isinstance(date_str, str) else None
+    if match is not None:
+        try:
+            return _parse_strict(date_str, match).replace(tzinfo=timezone.utc)
+        except (ValueError, OverflowError):
+            pass
+    return _parse_general(date_str).astimezone(timezone.utc)
+
+
+def to_iso8601_utc_many(date_strs: Iterable[str]) -> list[str]:
+    """Normalize a column of timestamps; repeated values, common in large payloads, are converted once.
+
+    Raises `ValueError` for the first invalid value, like `to_iso8601_utc`.
+    """
+    normalized: dict[str, str] = {}
+    result: list[str] = []
+    for date_str in date_strs:
+        try:
+            value = normalized[date_str]
+        except KeyError:
+            value = normalized[date_str] = to_iso8601_utc(date_str)
+        except TypeError:
+            value = to_iso8601_utc(date_str)
+        result.append(value)
+    return result
+
+
+def _parse_strict(date_str: str, match: re.Match[str]) -> datetime:
+    """Return the naive UTC datetime of a string matched by `_STRICT_ISO8601`; raises ValueError on invalid fields."""
+    return datetime.fromisoformat(date_str[:match.start(2)]) - _utc_offset(match.group(2))
+
+
+@lru_cache(maxsize=None)
+def _utc_offset(designator: str) -> timedelta:
+    if designator == "Z":
+        return timedelta(0)
+    hours, minutes = int(designator[1:3]), int(designator[4:6])
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"Invalid UTC offset: {designator!r}")
+    offset = timedelta(hours=hours, minutes=minutes)
+    return -offset if designator[0] == "-" else offset
+
+
+def _parse_general(date_str: str) -> datetime:
+    """Parse any ISO 8601 form dateutil understands; used for input outside the strict fast path."""
     try:
         dt = isoparse(date_str)
     except (ValueError, TypeError):
@@ -27,9 +108,8 @@ def to_iso8601_utc(date_str: str) -> str:
     # Reject if no timezone info
     if dt.tzinfo is None or dt.utcoffset() is None:
         raise ValueError(f"Datetime string must include timezone info: {date_str!r}")
+    return dt
 
-    # Convert to UTC
-    dt_utc = dt.astimezone(timezone.utc)
 
-    # Format as ISO 8601 string ending with 'Z'
-    return dt_utc.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
\ No newline at end of file
+def _format_utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
@@ -0,0 +1,69 @@
+"""Encode batches of API items for the streaming export, one chunk per batch."""
+from __future__ import annotations
+
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Sequence
+
+from backend.domain.export_format import ExportFormat
+from backend.shared.utils.date_utils import format_iso8601_utc
+from backend.shared.utils.json_response import to_json
+
+CSV_COLUMNS = ("id", "supplier", "deliveredAt", "status", "signed", "siteId", "source", "deliveryScore")
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+_GZIP_LEVEL = 6
+# A window of 16 + 15 bits makes zlib write a gzip header and trailer.
+_GZIP_WINDOW_BITS = 16 + zlib.MAX_WBITS
+
+
+def ndjson_lines(items: Sequence[dict[str, Any]]) -> bytes:
+    """Serialize each item on a line of its own, like the listing endpoint renders it."""
+    return b"".join(to_json(item) + b"\n" for item in items)
+
+
+def csv_rows(items: Sequence[dict[str, Any]]) -> bytes:
+    """Write `items` as CSV rows in `CSV_COLUMNS` order, with the same values as the JSON export."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_csv_value(item[column]) for column in CSV_COLUMNS] for item in items)
+    return buffer.getvalue().encode()
+
+
+def csv_header() -> bytes:
+    return (",".join(CSV_COLUMNS) + "\n").encode()
+
+
+async def encode_export(
+    batches: AsyncIterable[Sequence[dict[str, Any]]],
+    export_format: ExportFormat,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode `batches` as they arrive, optionally as one gzip member; empty chunks are skipped."""
+    compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WINDOW_BITS) if compress else None
+
+    def emit(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor is not None else chunk
+
+    if export_format is ExportFormat.CSV and (header := emit(csv_header())):
+        yield header
+    encode = csv_rows if export_format is ExportFormat.CSV else ndjson_lines
+    async for batch in batches:
+        if chunk := emit(encode(batch)):
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return format_iso8601_utc(value)
+    return value
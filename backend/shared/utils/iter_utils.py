@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive lists of up to `size` items, consuming `items` lazily."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Naive datetimes are UTC throughout the service, and UTC offsets render as `Z` like `_format_utc`.
+_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def to_json(content: Any) -> bytes:
+    """Serialize `content` the way the API responses are rendered."""
+    return orjson.dumps(content, option=_OPTIONS)
+
+
+def to_json_with_items(items_json: str, content: dict[str, Any]) -> bytes:
+    """Serialize `content` with an `items` member spliced in verbatim from already serialized JSON."""
+    return b'{"items":' + items_json.encode() + b"," + to_json(content)[1:]
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSON response rendered by orjson, which serializes datetimes natively.
+
+    Return it from an endpoint (rather than a dict) so FastAPI skips `jsonable_encoder` and
+    the content is encoded exactly once. Aware datetimes must already be in UTC.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
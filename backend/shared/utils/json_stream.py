@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_MAX_PENDING_CHARS = 16 * 1024 * 1024
+
+_EXPECT_ARRAY = 0
+_EXPECT_FIRST_VALUE = 1
+_EXPECT_VALUE = 2
+_EXPECT_SEPARATOR = 3
+_DONE = 4
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Only the element currently being received is buffered, so memory is bounded by the
+    largest element instead of the whole payload. Raises `ValueError` on malformed input.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    state = _EXPECT_ARRAY
+    for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        position, state = yield from _drain(decoder, buffer, state, final=False)
+        buffer = buffer[position:]
+        if len(buffer) > _MAX_PENDING_CHARS:
+            raise ValueError("JSON array element exceeds the streaming buffer limit")
+    buffer += utf8.decode(b"", final=True)
+    position, state = yield from _drain(decoder, buffer, state, final=True)
+    if state != _DONE:
+        raise ValueError("Truncated JSON array")
+
+
+def _drain(decoder: json.JSONDecoder, buffer: str, state: int, final: bool) -> Iterator[Any]:
+    position = 0
+    end_of_buffer = len(buffer)
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position >= end_of_buffer:
+            return position, state
+        char = buffer[position]
+        if state == _EXPECT_ARRAY:
+            if char != "[":
+                raise ValueError("Expected a JSON array")
+            position += 1
+            state = _EXPECT_FIRST_VALUE
+        elif state == _EXPECT_SEPARATOR or (state == _EXPECT_FIRST_VALUE and char == "]"):
+            if char == "]":
+                state = _DONE
+            elif char == ",":
+                state = _EXPECT_VALUE
+            else:
+                raise ValueError(f"Unexpected character {char!r} in JSON array")
+            position += 1
+        elif state in (_EXPECT_FIRST_VALUE, _EXPECT_VALUE):
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise ValueError(f"Malformed JSON array element: {exc}") from exc
+                return position, state
+            # A scalar touching the end of the buffer may continue in the next chunk.
+            if end == end_of_buffer and not final and not isinstance(value, (dict, list, str)):
+                return position, state
+            yield value
+            position = end
+            state = _EXPECT_SEPARATOR
+        else:
+            raise ValueError("Unexpected data after JSON array")
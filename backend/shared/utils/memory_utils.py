@@ -0,0 +1,9 @@
+import resource
+import sys
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the current process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
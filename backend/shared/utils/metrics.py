@@ -0,0 +1,149 @@
+"""Prometheus metrics for the delivery pipeline and the HTTP API, exposed on `/metrics`.
+
+Everything is recorded per request, per partner run or per database batch, never per
+record, so the instrumentation can stay enabled under load.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, Iterator, MutableMapping
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import Engine
+
+_Scope = MutableMapping[str, Any]
+_Message = MutableMapping[str, Any]
+_Receive = Callable[[], Awaitable[_Message]]
+_Send = Callable[[_Message], Awaitable[None]]
+_ASGIApp = Callable[[_Scope, _Receive, _Send], Awaitable[None]]
+
+_UNMATCHED_ROUTE = "unmatched"
+
+PARTNER_FETCH_SECONDS = Histogram(
+    "partner_fetch_seconds",
+    "Time to receive a partner's response; streamed fetches cover the whole body.",
+    ["source", "mode"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+PARTNER_RECORDS = Counter(
+    "partner_records",
+    "Partner records taken through mapping, by whether they became unified deliveries.",
+    ["source", "result"],
+)
+MAPPING_RECORDS_PER_SECOND = Histogram(
+    "mapping_records_per_second",
+    "Mapping throughput of one partner run.",
+    ["source"],
+    buckets=(1e3, 5e3, 1e4, 2.5e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6),
+)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Time one partner run spent in each pipeline stage.",
+    ["source", "stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+DB_INSERT_BATCH_SECONDS = Histogram(
+    "db_insert_batch_seconds",
+    "Latency of one unified deliveries write batch.",
+    ["method"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_ROWS_WRITTEN = Counter(
+    "db_rows_written",
+    "Unified delivery rows written by committed transactions.",
+    ["result"],
+)
+SCHEDULER_JOB_SECONDS = Histogram(
+    "scheduler_job_seconds",
+    "Duration of scheduled fetch jobs.",
+    ["outcome"],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+SCHEDULER_JOBS = Counter(
+    "scheduler_jobs",
+    "Scheduled fetch jobs by outcome.",
+    ["outcome"],
+)
+SCHEDULER_PARTNER_RUNS = Counter(
+    "scheduler_partner_runs",
+    "Per-partner runs of scheduled fetch jobs by outcome.",
+    ["source", "outcome"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_seconds",
+    "Latency of API requests by route template.",
+    ["method", "route"],
+)
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "API requests by route template and response status.",
+    ["method", "route", "status"],
+)
+
+
+class _PoolCollector(Collector):
+    """Read the SQLAlchemy pool's occupancy at scrape time instead of tracking every checkout."""
+
+    def __init__(self) -> None:
+        self._engines: dict[str, Engine] = {}
+
+    def observe(self, name: str, engine: Engine) -> None:
+        self._engines[name] = engine
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        for name, documentation, method in (
+            ("db_pool_size", "Connections the pool keeps open.", "size"),
+            ("db_pool_checked_out", "Connections currently checked out of the pool.", "checkedout"),
+            ("db_pool_overflow", "Connections open beyond the pool size; negative while below it.", "overflow"),
+        ):
+            family = GaugeMetricFamily(name, documentation, labels=["engine"])
+            for engine_name, engine in self._engines.items():
+                # `engine.pool` is replaced when the engine is disposed, so it is looked up on every scrape.
+                read = getattr(engine.pool, method, None)
+                if read is not None:
+                    family.add_metric([engine_name], read())
+            yield family
+
+
+_POOL_COLLECTOR = _PoolCollector()
+REGISTRY.register(_POOL_COLLECTOR)
+
+
+def observe_pool(name: str, engine: Engine) -> None:
+    """Report `engine`'s connection pool in the `db_pool_*` gauges, labelled `engine=name`."""
+    _POOL_COLLECTOR.observe(name, engine)
+
+
+class RequestMetricsMiddleware:
+    """Plain ASGI middleware timing each HTTP request under the template of the route it matched.
+
+    Route templates keep the label set bounded; requests that match no route share one label.
+    """
+
+    def __init__(self, app: _ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: _Scope, receive: _Receive, send: _Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def send_with_status(message: _Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = scope.get("route")
+            template = getattr(route, "path", _UNMATCHED_ROUTE)
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.labels(method, template).observe(elapsed)
+            HTTP_REQUESTS.labels(method, template, str(status_code)).inc()
@@ -1,6 +1,8 @@
 import os
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 
 def pytest_sessionstart(session):
@@ -16,3 +18,19 @@ def pytest_sessionstart(session):
         "SOURCE_A": "source-a",
         "SOURCE_B": "source-b",
     })
+
+
+@pytest.fixture
+def postgres_session_factory():
+    """Session factory on a real Postgres from TEST_DATABASE_URL; skips the test when it is not set."""
+    from backend.adapters.repostory.jobs.job_model import Base
+
+    database_url = os.environ.get("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    Base.metadata.drop_all(engine)
+    engine.dispose()
@@ -0,0 +1,124 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.repostory.jobs.async_job_repository import AsyncJobsRepository, ThreadedJobsRepository
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.jobs.job_repository import JobsRepository
+from backend.adapters.repostory.unified_deliveries.async_unified_delivery_repository import (
+    AsyncUnifiedDeliveriesRepository,
+    ThreadedUnifiedDeliveriesRepository,
+)
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.adapters.scheduling.job_status import JobStatus
+from backend.benchmarks.synthetic import unified_deliveries
+from backend.domain.count_mode import CountMode
+from backend.domain.delivery_filter import DeliveryFilter
+
+
+def _seed(session_factory) -> None:
+    jobs = JobsRepository(session_factory)
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for index in range(5):
+        at = created_at + timedelta(minutes=index)
+        jobs.create_job(uuid4(), JobStatus.PROCESSING, at, at, {"site_id": "site-1"})
+    UnifiedDeliveriesRepository(session_factory).store_many(uuid4(), list(unified_deliveries(7)))
+
+
+async def _list_pages(jobs_port, deliveries_port):
+    first = await deliveries_port.list_deliveries(limit=3, count_mode=CountMode.EXACT)
+    second = await deliveries_port.list_deliveries(limit=3, cursor=first.next_cursor, count_mode=CountMode.NONE)
+    filtered = await deliveries_port.list_deliveries(limit=10, delivery_filter=DeliveryFilter(status="pending"))
+    jobs = await jobs_port.list_jobs(limit=2, offset=1)
+    return first, second, filtered, jobs
+
+
+def _sync_pages(session_factory):
+    jobs_port = JobsRepository(session_factory)
+    deliveries_port = UnifiedDeliveriesRepository(session_factory)
+    first = deliveries_port.list_deliveries(limit=3, count_mode=CountMode.EXACT)
+    return (
+        first,
+        deliveries_port.list_deliveries(limit=3, cursor=first.next_cursor, count_mode=CountMode.NONE),
+        deliveries_port.list_deliveries(limit=10, delivery_filter=DeliveryFilter(status="pending")),
+        jobs_port.list_jobs(limit=2, offset=1),
+    )
+
+
+def test_threaded_repositories_return_the_synchronous_pages(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'listing.db'}", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    _seed(session_factory)
+
+    pages = asyncio.run(
+        _list_pages(
+            ThreadedJobsRepository(JobsRepository(session_factory)),
+            ThreadedUnifiedDeliveriesRepository(UnifiedDeliveriesRepository(session_factory)),
+        ),
+    )
+
+    assert pages == _sync_pages(session_factory)
+
+
+def test_async_repositories_return_the_synchronous_pages_on_postgres(postgres_session_factory):
+    _seed(postgres_session_factory)
+
+    async def list_pages():
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            return await _list_pages(
+                AsyncJobsRepository(session_factory),
+                AsyncUnifiedDeliveriesRepository(session_factory),
+            )
+        finally:
+            await engine.dispose()
+
+    first, second, filtered, jobs = asyncio.run(list_pages())
+
+    assert (first, second, filtered, jobs) == _sync_pages(postgres_session_factory)
+    assert len(first.items) == len(second.items) == 3
+    assert first.total == 7
+    assert len(jobs.items) == 2
+
+
+async def _export(deliveries_port, delivery_filter: DeliveryFilter | None = None) -> list[list[dict]]:
+    return [batch async for batch in deliveries_port.export_deliveries(delivery_filter)]
+
+
+def test_threaded_repository_exports_the_synchronous_batches(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    _seed(session_factory)
+    repository = UnifiedDeliveriesRepository(session_factory, export_batch_size=3)
+
+    batches = asyncio.run(_export(ThreadedUnifiedDeliveriesRepository(repository)))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert batches == list(repository.export_deliveries())
+
+
+def test_async_repository_streams_the_export_on_postgres(postgres_session_factory):
+    _seed(postgres_session_factory)
+    delivery_filter = DeliveryFilter(status="pending")
+
+    async def export():
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            return await _export(AsyncUnifiedDeliveriesRepository(session_factory, export_batch_size=2), delivery_filter)
+        finally:
+            await engine.dispose()
+
+    batches = asyncio.run(export())
+
+    expected = list(UnifiedDeliveriesRepository(postgres_session_factory, export_batch_size=2).export_deliveries(delivery_filter))
+    assert batches == expected
+    assert all(len(batch) <= 2 for batch in batches)
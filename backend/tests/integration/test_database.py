@@ -0,0 +1,132 @@
+import os
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError
+
+from backend.adapters.repostory.database import Database, _engine_options
+from backend.adapters.repostory.jobs.job_repository import JobsRepository
+from backend.adapters.repostory import migrations
+from backend.adapters.repostory.postgres_config import PostgresConfig
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.benchmarks.synthetic import unified_deliveries
+
+
+def _sqlite_config(tmp_path, **overrides) -> PostgresConfig:
+    return PostgresConfig(postgres_dsn=f"sqlite:///{tmp_path / 'database.db'}", **overrides)
+
+
+def test_create_schema_creates_every_table(tmp_path):
+    database = Database(_sqlite_config(tmp_path))
+
+    database.create_schema()
+
+    assert {"jobs", "unified_deliveries"} <= set(inspect(database.engine).get_table_names())
+    database.dispose()
+
+
+def test_warm_up_fills_the_pool_up_to_its_size(tmp_path):
+    database = Database(_sqlite_config(tmp_path, pool_size=3, pool_warmup=10))
+
+    warmed = database.warm_up()
+
+    assert warmed == 3
+    assert database.engine.pool.checkedin() == 3
+    database.dispose()
+
+
+def test_repositories_share_the_database_pool(tmp_path):
+    database = Database(_sqlite_config(tmp_path))
+    database.create_schema()
+
+    repository = JobsRepository(database.session_factory)
+    repository.list_jobs(limit=1, offset=0)
+
+    assert database.session_factory.kw["bind"] is database.engine
+    database.dispose()
+
+
+def test_engine_options_apply_pool_settings_and_statement_timeout():
+    config = PostgresConfig(
+        postgres_dsn="postgresql+psycopg://user:password@db:5432/deliveries",
+        pool_size=8,
+        max_overflow=4,
+        pool_recycle=600,
+        pool_timeout=2.5,
+        statement_timeout_ms=1500,
+    )
+
+    options = _engine_options(config)
+
+    assert options["pool_size"] == 8
+    assert options["max_overflow"] == 4
+    assert options["pool_recycle"] == 600
+    assert options["pool_timeout"] == 2.5
+    assert options["connect_args"] == {"options": "-c statement_timeout=1500"}
+
+
+def test_engine_options_skip_statement_timeout_when_disabled():
+    config = PostgresConfig(postgres_dsn="postgresql+psycopg://user:password@db:5432/deliveries", statement_timeout_ms=0)
+
+    assert "connect_args" not in _engine_options(config)
+
+
+def test_statement_timeout_is_set_on_postgres_sessions():
+    database_url = os.environ.get("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    database = Database(PostgresConfig(postgres_dsn=database_url, statement_timeout_ms=1234, pool_warmup=1))
+
+    database.warm_up()
+    with database.session_factory() as session:
+        statement_timeout = session.scalar(text("SHOW statement_timeout"))
+
+    assert statement_timeout == "1234ms"
+    database.dispose()
+
+
+def test_migrations_are_not_bound_by_the_statement_timeout(postgres_session_factory, monkeypatch):
+    slow_migration = ("9999_test_slow_migration", ("SELECT pg_sleep(0.2)",))
+    monkeypatch.setattr(migrations, "_MIGRATIONS", (*migrations._MIGRATIONS, slow_migration))
+    database = Database(
+        PostgresConfig(postgres_dsn=os.environ["TEST_DATABASE_URL"], statement_timeout_ms=50, pool_warmup=1)
+    )
+    try:
+        database.create_schema()
+        with database.engine.begin() as connection:
+            applied = connection.scalar(
+                text("DELETE FROM schema_migrations WHERE version = :version RETURNING version"),
+                {"version": slow_migration[0]},
+            )
+    finally:
+        database.dispose()
+
+    assert applied == slow_migration[0]
+
+
+def test_copy_stores_are_not_bound_by_the_statement_timeout(postgres_session_factory):
+    with postgres_session_factory.begin() as session:
+        session.execute(text(
+            "CREATE FUNCTION slow_insert() RETURNS trigger "
+            "AS 'BEGIN PERFORM pg_sleep(0.2); RETURN NULL; END' LANGUAGE plpgsql"
+        ))
+        # A statement-level trigger: every INSERT statement takes at least 200 ms.
+        session.execute(text(
+            "CREATE TRIGGER slow_insert BEFORE INSERT ON unified_deliveries EXECUTE FUNCTION slow_insert()"
+        ))
+    database = Database(
+        PostgresConfig(postgres_dsn=os.environ["TEST_DATABASE_URL"], statement_timeout_ms=50, pool_warmup=1)
+    )
+    deliveries = list(unified_deliveries(10))
+    try:
+        with pytest.raises(OperationalError, match="statement timeout"):
+            UnifiedDeliveriesRepository(database.session_factory).store_many(uuid4(), deliveries)
+        result = UnifiedDeliveriesRepository(database.session_factory, copy_threshold=1).store_many(uuid4(), deliveries)
+    finally:
+        database.dispose()
+        with postgres_session_factory.begin() as session:
+            session.execute(text("DROP FUNCTION slow_insert() CASCADE"))
+
+    assert result.inserted == 10
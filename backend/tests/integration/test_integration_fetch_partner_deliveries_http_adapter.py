@@ -8,16 +8,32 @@ from backend.adapters.outbound.partners.fetch_partner_deliveries_http_adapter im
     PartnerDeliveriesHttpAdapter,
 )
 from backend.adapters.outbound.partners.http_config import HttpConfig
+from backend.adapters.outbound.partners.partner_http_client import PartnerHttpClient
+from backend.adapters.outbound.partners.partner_payload_schemas import PARTNER_A_SCHEMA, PARTNER_B_SCHEMA
 from backend.domain.partner_delivery import PartnerDelivery
 from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
 
 
-def test_fetch_partner_deliveries_http_adapter_integration_success():
-    http_config = HttpConfig(
+@pytest.fixture
+def http_config() -> HttpConfig:
+    return HttpConfig(
         timeout=1.0,
-        endpoints={"Partner A": "https://partner-a.test"},
+        endpoints={"Partner A": "https://partner-a.test", "Partner B": "https://partner-b.test"},
     )
-    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config)
+
+
+@pytest.fixture
+def http_client(http_config):
+    client = PartnerHttpClient(http_config)
+    client.open()
+    yield client
+    client.close()
+
+
+def test_fetch_partner_deliveries_http_adapter_integration_success(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
 
     payload = [{
         "deliveryId": "DEL-001-A",
@@ -35,12 +51,8 @@ def test_fetch_partner_deliveries_http_adapter_integration_success():
     assert deliveries.delivery_data == payload
 
 
-def test_fetch_partner_deliveries_http_adapter_integration_http_error():
-    http_config = HttpConfig(
-        timeout=1.0,
-        endpoints={"Partner B": "https://partner-b.test"},
-    )
-    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config)
+def test_fetch_partner_deliveries_http_adapter_integration_http_error(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
 
     with respx.mock(assert_all_called=True) as respx_mock:
         respx_mock.post("https://partner-b.test").mock(return_value=Response(503))
@@ -49,3 +61,102 @@ def test_fetch_partner_deliveries_http_adapter_integration_http_error():
             adapter.fetch("Partner B")
 
     assert "Failed to fetch deliveries from Partner B" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("content", [b'{"deliveryId": "DEL-001-A"}', b'[{"deliveryId": "DEL-001-A"'])
+def test_fetch_partner_deliveries_http_adapter_rejects_payloads_that_are_not_delivery_arrays(
+    http_config, http_client, content
+):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-a.test").mock(return_value=Response(200, content=content))
+
+        with pytest.raises(PartnerDeliveryFetchError) as exc_info:
+            adapter.fetch("Partner A")
+
+    assert "Expected a JSON array of delivery objects" in str(exc_info.value)
+
+
+def test_fetch_partner_deliveries_http_adapter_reports_malformed_records_individually(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(
+        http_config=http_config,
+        http_client=http_client,
+        payload_schemas={"Partner A": PARTNER_A_SCHEMA, "Partner B": PARTNER_B_SCHEMA},
+    )
+    valid = {
+        "deliveryId": "DEL-001-A",
+        "supplier": "SupplierX",
+        "timestamp": "2025-08-01T11:54:00+02:00",
+        "status": "delivered",
+        "signedBy": "Martin Schulz",
+    }
+    payload = [valid, {"deliveryId": "DEL-002-A", "supplier": 7, "timestamp": "2025-08-01T11:54:00Z"}, "DEL-003-A"]
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-a.test").mock(return_value=Response(200, json=payload))
+        deliveries = adapter.fetch("Partner A")
+
+    assert deliveries.delivery_data == [valid]
+    assert [record.index for record in deliveries.malformed] == [1, 2]
+    assert deliveries.malformed[0].reason == "supplier: Input should be a valid string"
+    assert deliveries.decoded_bytes > 0
+    assert deliveries.decode_seconds > 0
+
+
+def test_stream_partner_deliveries_http_adapter_integration_success(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
+    payload = [{"deliveryId": f"DEL-{index:03d}-A", "supplier": "SupplierX"} for index in range(50)]
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-a.test").mock(return_value=Response(200, json=payload))
+        records = list(adapter.stream("Partner A", timeout=1.0))
+
+    assert records == payload
+
+
+def test_stream_partner_deliveries_http_adapter_records_bytes_and_stage_times(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
+    payload = [{"deliveryId": f"DEL-{index:03d}-A", "supplier": "SupplierX"} for index in range(50)]
+    response = Response(200, json=payload)
+    stats = Stats.for_partner("Partner A")
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-a.test").mock(return_value=response)
+        records = list(adapter.stream("Partner A", timeout=1.0, stats=stats))
+
+    assert records == payload
+    assert stats.bytes_received == len(response.content)
+    assert set(stats.stage_seconds) == {PipelineStage.FETCH, PipelineStage.DECODE}
+
+
+def test_stream_partner_deliveries_http_adapter_integration_http_error(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-b.test").mock(return_value=Response(503))
+
+        with pytest.raises(PartnerDeliveryFetchError) as exc_info:
+            list(adapter.stream("Partner B"))
+
+    assert exc_info.value.source == "Partner B"
+
+
+def test_partner_http_client_is_shared_across_fetches(http_config, http_client):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        respx_mock.post("https://partner-a.test").mock(return_value=Response(200, json=[]))
+        adapter.fetch("Partner A")
+        adapter.fetch("Partner A")
+
+    metrics = http_client.pool_metrics()
+    assert metrics["Partner A"]["requests"] == 2
+    assert metrics["Partner B"]["requests"] == 0
+
+
+def test_partner_http_client_rejects_requests_when_closed(http_config):
+    adapter = PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=PartnerHttpClient(http_config))
+
+    with pytest.raises(RuntimeError):
+        adapter.fetch("Partner A")
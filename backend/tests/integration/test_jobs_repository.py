@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+import json
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from sqlalchemy import create_engine
@@ -7,7 +8,9 @@ from sqlalchemy.orm import sessionmaker
 from backend.adapters.repostory.jobs.job_model import Base, JobModel
 from backend.adapters.repostory.jobs.job_repository import JobsRepository
 from backend.adapters.scheduling.job_status import JobStatus
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats import Stats
+from backend.shared.utils.json_response import to_json
 
 
 def test_create_job_persists_record(tmp_path):
@@ -63,6 +66,103 @@ def test_update_job_stats_sets_stats_payload(tmp_path):
         persisted_job = session.get(JobModel, str(job_id))
 
     assert persisted_job is not None
-    assert persisted_job.stats == stats.as_dict()
+    assert persisted_job.stats == {
+        "test_partner": {**stats.as_dict()["test_partner"], "error": "something went wrong"},
+        "stored": 0,
+    }
     assert persisted_job.updated_at == updated_at.replace(tzinfo=None)
-    assert persisted_job.error == "something went wrong"
+    assert persisted_job.error == "test_partner: something went wrong"
+
+
+def test_update_job_stats_keeps_every_partner_entry(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs_repository.db'}", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    repository = JobsRepository(session_factory)
+    job_id = uuid4()
+    at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    repository.create_job(job_id=job_id, status=JobStatus.PROCESSING, created_at=at, updated_at=at, input={})
+    stats_a = Stats.for_partner("Partner A")
+    stats_a.record_stored(3)
+    stats_a.record_stage(PipelineStage.STORE, 0.25)
+    stats_b = Stats.for_partner("Partner B")
+    stats_b.record_stored(2)
+
+    repository.update_job_stats(job_id, stats_a, at)
+    repository.update_job_stats(job_id, stats_b, at)
+
+    with session_factory() as session:
+        persisted_stats = session.get(JobModel, str(job_id)).stats
+
+    assert persisted_stats["stored"] == 5
+    assert persisted_stats["Partner A"] == stats_a.as_dict()["Partner A"]
+    assert persisted_stats["Partner A"]["stageSeconds"] == {"store": 0.25}
+    assert persisted_stats["Partner B"] == stats_b.as_dict()["Partner B"]
+
+
+def test_update_job_stats_keeps_a_failed_partners_error_after_another_succeeds(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs_repository.db'}", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    repository = JobsRepository(session_factory)
+    job_id = uuid4()
+    at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    repository.create_job(job_id=job_id, status=JobStatus.PROCESSING, created_at=at, updated_at=at, input={})
+
+    repository.update_job_stats(job_id, Stats.for_partner("Partner A"), at, "timed out")
+    repository.update_job_stats(job_id, Stats.for_partner("Partner B"), at)
+    repository.update_job_stats(job_id, Stats.for_partner("Partner C"), at, "HTTP 500")
+
+    with session_factory() as session:
+        persisted_job = session.get(JobModel, str(job_id))
+
+    assert persisted_job.error == "Partner A: timed out; Partner C: HTTP 500"
+    assert persisted_job.stats["Partner A"]["error"] == "timed out"
+    assert "error" not in persisted_job.stats["Partner B"]
+    assert persisted_job.stats["Partner C"]["error"] == "HTTP 500"
+
+
+def test_list_jobs_cursor_pages_newest_first(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs_repository.db'}", future=True)
+    Base.metadata.create_all(engine)
+    repository = JobsRepository(sessionmaker(bind=engine, expire_on_commit=False))
+    created = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    # Two jobs share a creation time so the id tie-break is exercised.
+    for minute in (0, 1, 1, 2, 3):
+        at = created.replace(minute=minute)
+        repository.create_job(job_id=uuid4(), status=JobStatus.PROCESSING, created_at=at, updated_at=at, input={})
+
+    first = repository.list_jobs(limit=2)
+    second = repository.list_jobs(limit=2, cursor=first.next_cursor)
+    third = repository.list_jobs(limit=2, cursor=second.next_cursor)
+
+    paged = [item["jobId"] for page in (first, second, third) for item in page.items]
+    assert paged == [item["jobId"] for item in repository.list_jobs(limit=10).items]
+    assert [item["createdAt"].minute for item in first.items + second.items + third.items] == [3, 2, 1, 1, 0]
+    assert third.next_cursor is None
+    assert first.total == 5
+
+
+def test_list_jobs_json_is_rendered_like_the_listing_on_postgres(postgres_session_factory):
+    repository = JobsRepository(postgres_session_factory)
+    created = datetime(2024, 1, 1, 12, 0, 0, 250, tzinfo=timezone.utc)
+    job_ids = [uuid4() for _ in range(3)]
+    for index, job_id in enumerate(job_ids):
+        at = created + timedelta(minutes=index)
+        repository.create_job(job_id=job_id, status=JobStatus.PROCESSING, created_at=at, updated_at=at, input={"site_id": "s"})
+    stats = Stats.for_partner("Partner A")
+    stats.record_fetched(2)
+    repository.update_job_stats(job_ids[0], stats, updated_at=created.replace(microsecond=0), error="partial")
+
+    first = repository.list_jobs_json(limit=2)
+    second = repository.list_jobs_json(limit=2, cursor=first.next_cursor)
+
+    for json_page, page in ((first, repository.list_jobs(limit=2)), (second, repository.list_jobs(limit=2, cursor=first.next_cursor))):
+        assert json.loads(json_page.items_json) == json.loads(to_json(page.items))
+        assert (json_page.total, json_page.next_cursor) == (page.total, page.next_cursor)
+    assert second.next_cursor is None
+    (oldest,) = json.loads(second.items_json)
+    assert oldest["status"] == "processing"
+    assert oldest["createdAt"] == "2024-01-01T12:00:00.000250Z"
+    assert oldest["updatedAt"] == "2024-01-01T12:00:00Z"
+    assert json.loads(first.items_json)[0]["stats"] == {}
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.jobs.job_repository import JobsRepository
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.adapters.scheduling.job_status import JobStatus
+from backend.domain.count_mode import CountMode
+from backend.domain.unified_delivery import UnifiedDelivery
+
+
+def _build_session_factory(tmp_path) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{tmp_path / 'row_counts.db'}", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _build_delivery(index: int) -> UnifiedDelivery:
+    return UnifiedDelivery(
+        id=f"DEL-{index:03d}",
+        supplier="SupplierX",
+        delivered_at=datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc),
+        status="delivered",
+        signed=True,
+        siteId="site-123",
+        source="source-a",
+        delivery_score=1.2,
+    )
+
+
+def test_counter_tracks_inserted_deliveries_only(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(3)])
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(5)])
+
+    page = repository.list_deliveries(limit=1, count_mode=CountMode.COUNTER)
+
+    assert page.total == 5
+    assert page.count_mode is CountMode.COUNTER
+
+
+def test_counter_tracks_created_jobs(tmp_path):
+    repository = JobsRepository(_build_session_factory(tmp_path))
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for _ in range(2):
+        repository.create_job(job_id=uuid4(), status=JobStatus.CREATED, created_at=now, updated_at=now, input={})
+
+    assert repository.list_jobs(limit=1, count_mode=CountMode.COUNTER).total == 2
+
+
+def test_estimated_count_falls_back_to_exact_outside_postgres(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(2)])
+
+    page = repository.list_deliveries(limit=1, count_mode=CountMode.ESTIMATED)
+
+    assert (page.total, page.count_mode) == (2, CountMode.EXACT)
+
+
+def test_count_mode_none_skips_the_total(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+
+    page = repository.list_deliveries(limit=1, count_mode=CountMode.NONE)
+
+    assert page.total is None
+    assert page.count_mode is CountMode.NONE
+
+
+def test_estimated_count_uses_planner_statistics_on_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory)
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(4)])
+    with postgres_session_factory() as session:
+        session.execute(text("ANALYZE unified_deliveries"))
+        session.commit()
+
+    page = repository.list_deliveries(limit=1, count_mode=CountMode.ESTIMATED)
+
+    assert (page.total, page.count_mode) == (4, CountMode.ESTIMATED)
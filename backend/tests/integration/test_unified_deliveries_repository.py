@@ -0,0 +1,329 @@
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pyarrow as pa
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.unified_delivery_model import UnifiedDeliveryModel
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.store_result import StoreResult
+from backend.domain.unified_delivery import UnifiedDelivery, compute_delivery_score
+from backend.shared.utils.cursor import InvalidCursorError
+from backend.shared.utils.json_response import to_json
+
+
+def _build_session_factory(tmp_path) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{tmp_path / 'unified_deliveries.db'}", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _build_delivery(
+    index: int,
+    supplier: str = "SupplierX",
+    delivered_at: datetime = datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc),
+) -> UnifiedDelivery:
+    signed = index % 2 == 0
+    return UnifiedDelivery(
+        id=f"DEL-{index:03d}-A",
+        supplier=supplier,
+        delivered_at=delivered_at,
+        status="delivered",
+        signed=signed,
+        siteId="site-123",
+        source="source-a",
+        delivery_score=compute_delivery_score(delivered_at, signed),
+    )
+
+
+def test_store_many_persists_all_deliveries_in_batches(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory, batch_size=2)
+    job_id = uuid4()
+
+    result = repository.store_many(job_id, [_build_delivery(index) for index in range(5)])
+
+    assert result == StoreResult(inserted=5)
+    with session_factory() as session:
+        persisted = session.scalars(select(UnifiedDeliveryModel).order_by(UnifiedDeliveryModel.delivery_id)).all()
+
+    assert [model.delivery_id for model in persisted] == [f"DEL-{index:03d}-A" for index in range(5)]
+    assert {model.job_id for model in persisted} == {str(job_id)}
+    assert [model.delivery_score for model in persisted] == [1.2, 0.36, 1.2, 0.36, 1.2]
+
+
+def test_store_many_without_deliveries_is_a_no_op(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory)
+
+    repository.store_many(uuid4(), [])
+
+    assert repository.list_deliveries(limit=10, offset=0).total == 0
+
+
+def test_store_many_upserts_on_delivery_identity(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory, batch_size=2)
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(3)])
+    second_job_id = uuid4()
+
+    result = repository.store_many(
+        second_job_id,
+        [_build_delivery(0), _build_delivery(1, supplier="SupplierY"), _build_delivery(3), _build_delivery(3)],
+    )
+
+    assert result == StoreResult(inserted=1, updated=1, unchanged=1)
+    page = repository.list_deliveries(limit=10, offset=0)
+    items = page.items
+    assert page.total == 4
+    by_id = {item["id"]: item for item in items}
+    assert by_id["DEL-001-A"]["supplier"] == "SupplierY"
+    rewritten = repository.list_deliveries(limit=10, delivery_filter=DeliveryFilter(job_id=str(second_job_id)))
+    assert sorted(item["id"] for item in rewritten.items) == ["DEL-001-A", "DEL-003-A"]
+
+
+def test_store_many_above_copy_threshold_falls_back_to_inserts_outside_postgres(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory, copy_threshold=1)
+
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(3)])
+
+    assert repository.list_deliveries(limit=10, offset=0).total == 3
+
+
+def test_store_many_above_copy_threshold_copies_rows_into_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory, copy_threshold=3)
+    job_id = uuid4()
+
+    result = repository.store_many(job_id, [_build_delivery(index) for index in range(5)])
+
+    assert result == StoreResult(inserted=5)
+    page = repository.list_deliveries(limit=10, offset=0)
+    items = page.items
+    assert page.total == 5
+    assert repository.list_deliveries(limit=10, delivery_filter=DeliveryFilter(job_id=str(job_id))).total == 5
+    assert sorted(item["deliveryScore"] for item in items) == [0.36, 0.36, 1.2, 1.2, 1.2]
+
+
+def test_store_many_failed_copy_leaves_table_untouched(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory, copy_threshold=1)
+    repository.store_many(uuid4(), [_build_delivery(0)])
+    invalid = replace(_build_delivery(1), supplier="S" * 500)
+
+    with pytest.raises(Exception):
+        repository.store_many(uuid4(), [_build_delivery(2), invalid])
+
+    with postgres_session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(UnifiedDeliveryModel)) == 1
+
+
+def test_store_many_copy_upserts_on_delivery_identity(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory, copy_threshold=1)
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(3)])
+
+    result = repository.store_many(
+        uuid4(),
+        [_build_delivery(0), _build_delivery(1, supplier="SupplierZ"), _build_delivery(1, supplier="SupplierY"), _build_delivery(3)],
+    )
+
+    assert result == StoreResult(inserted=1, updated=1, unchanged=1)
+    page = repository.list_deliveries(limit=10, offset=0)
+    items = page.items
+    assert page.total == 4
+    assert {item["id"]: item["supplier"] for item in items}["DEL-001-A"] == "SupplierY"
+
+
+def test_list_deliveries_cursor_walks_every_row_once_in_score_order(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory)
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(7)])
+    offset_order = [item["id"] for item in repository.list_deliveries(limit=10, offset=0).items]
+
+    seen: list[str] = []
+    page = repository.list_deliveries(limit=3)
+    seen.extend(item["id"] for item in page.items)
+    while page.next_cursor is not None:
+        page = repository.list_deliveries(limit=3, cursor=page.next_cursor)
+        seen.extend(item["id"] for item in page.items)
+
+    assert seen == offset_order
+    assert [item["deliveryScore"] for item in repository.list_deliveries(limit=10).items] == sorted(
+        (1.2 if index % 2 == 0 else 0.36 for index in range(7)), reverse=True,
+    )
+
+
+def test_list_deliveries_returns_items_in_the_api_shape(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+    repository.store_many(uuid4(), [_build_delivery(0)])
+
+    (item,) = repository.list_deliveries(limit=10).items
+
+    assert item == {
+        "id": "DEL-000-A",
+        "supplier": "SupplierX",
+        "deliveredAt": datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc),
+        "status": "delivered",
+        "signed": True,
+        "siteId": "site-123",
+        "source": "source-a",
+        "deliveryScore": 1.2,
+    }
+
+
+def test_list_deliveries_last_page_has_no_cursor(tmp_path):
+    session_factory = _build_session_factory(tmp_path)
+    repository = UnifiedDeliveriesRepository(session_factory)
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(2)])
+
+    assert repository.list_deliveries(limit=2).next_cursor is None
+    assert repository.list_deliveries(limit=1).next_cursor is not None
+
+
+def test_list_deliveries_rejects_malformed_cursor(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+
+    with pytest.raises(InvalidCursorError):
+        repository.list_deliveries(limit=10, cursor="not-a-cursor")
+
+
+def _store_filterable_deliveries(repository: UnifiedDeliveriesRepository) -> None:
+    repository.store_many(uuid4(), [
+        _build_delivery(0, delivered_at=datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc)),
+        replace(
+            _build_delivery(1, delivered_at=datetime(2025, 8, 2, 9, 41, tzinfo=timezone(timedelta(hours=2)))),
+            status="pending",
+        ),
+        replace(_build_delivery(2, delivered_at=datetime(2025, 8, 3, 9, 41, tzinfo=timezone.utc)), siteId="site-999"),
+    ])
+
+
+def _assert_filters_narrow_the_listing(repository: UnifiedDeliveriesRepository) -> None:
+    def ids(**criteria) -> list[str]:
+        page = repository.list_deliveries(limit=10, delivery_filter=DeliveryFilter(**criteria))
+        assert page.total == len(page.items)
+        return sorted(item["id"] for item in page.items)
+
+    assert ids(site_id="site-123") == ["DEL-000-A", "DEL-001-A"]
+    assert ids(status="pending") == ["DEL-001-A"]
+    assert ids(supplier="SupplierX", status="delivered") == ["DEL-000-A", "DEL-002-A"]
+    assert ids(
+        delivered_from=datetime(2025, 8, 2, 7, 41, tzinfo=timezone.utc),
+        delivered_to=datetime(2025, 8, 3, 9, 41, tzinfo=timezone.utc),
+    ) == ["DEL-001-A"]
+
+
+def test_list_deliveries_applies_filters(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+    _store_filterable_deliveries(repository)
+
+    _assert_filters_narrow_the_listing(repository)
+
+
+def test_list_deliveries_applies_filters_on_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory)
+    _store_filterable_deliveries(repository)
+
+    _assert_filters_narrow_the_listing(repository)
+    delivered_at = repository.list_deliveries(limit=1, delivery_filter=DeliveryFilter(status="pending")).items[0]["deliveredAt"]
+    assert delivered_at == datetime(2025, 8, 2, 7, 41, tzinfo=timezone.utc)
+
+
+def _assert_json_pages_match_the_listing(repository: UnifiedDeliveriesRepository) -> None:
+    cursor = None
+    for _ in range(3):
+        page = repository.list_deliveries(limit=2, cursor=cursor)
+        json_page = repository.list_deliveries_json(limit=2, cursor=cursor)
+
+        assert json.loads(json_page.items_json) == json.loads(to_json(page.items))
+        assert all(isinstance(item["deliveryScore"], float) for item in json.loads(json_page.items_json))
+        assert (json_page.total, json_page.next_cursor) == (page.total, page.next_cursor)
+        cursor = page.next_cursor
+    assert cursor is None
+
+
+def test_list_deliveries_json_serializes_the_listing_outside_postgres(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path))
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(5)])
+
+    _assert_json_pages_match_the_listing(repository)
+
+
+def test_list_deliveries_json_is_rendered_like_the_listing_on_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory)
+    afternoon = datetime(2025, 8, 1, 15, 41, 5, 120, tzinfo=timezone(timedelta(hours=2)))
+    # Signed afternoon deliveries score exactly 1.0, which Postgres alone would write as `1`.
+    repository.store_many(
+        uuid4(),
+        [_build_delivery(index) for index in range(3)] + [_build_delivery(index, delivered_at=afternoon) for index in (4, 6)],
+    )
+
+    _assert_json_pages_match_the_listing(repository)
+    items_json = repository.list_deliveries_json(limit=10).items_json
+    assert '"deliveryScore" : 1.0}' in items_json
+    assert '"deliveredAt" : "2025-08-01T13:41:05.000120Z"' in items_json
+
+
+def _assert_export_streams_every_match_in_batches(repository: UnifiedDeliveriesRepository) -> None:
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(5)])
+    repository.store_many(uuid4(), [replace(_build_delivery(5), siteId="site-999")])
+
+    batches = list(repository.export_deliveries(DeliveryFilter(site_id="site-123")))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    exported = [item for batch in batches for item in batch]
+    assert [item["id"] for item in exported] == [f"DEL-{index:03d}-A" for index in range(5)]
+    listed = {item["id"]: item for item in repository.list_deliveries(limit=10).items}
+    assert exported == [listed[item["id"]] for item in exported]
+
+
+def test_export_deliveries_streams_every_match_in_batches(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path), export_batch_size=2)
+
+    _assert_export_streams_every_match_in_batches(repository)
+
+
+def test_export_deliveries_streams_from_a_server_side_cursor_on_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory, export_batch_size=2)
+
+    _assert_export_streams_every_match_in_batches(repository)
+
+
+def _assert_record_batches_hold_the_exported_values(repository: UnifiedDeliveriesRepository) -> None:
+    repository.store_many(uuid4(), [_build_delivery(index) for index in range(5)])
+
+    batches = list(repository.export_delivery_batches(DeliveryFilter(supplier="SupplierX")))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    rows = pa.Table.from_batches(batches).to_pylist()
+    items = [item for batch in repository.export_deliveries() for item in batch]
+    assert rows == [
+        {
+            "id": item["id"],
+            "supplier": item["supplier"],
+            "delivered_at": item["deliveredAt"],
+            "status": item["status"],
+            "signed": item["signed"],
+            "siteId": item["siteId"],
+            "source": item["source"],
+            "delivery_score": item["deliveryScore"],
+        }
+        for item in items
+    ]
+
+
+def test_export_delivery_batches_transposes_rows_into_record_batches(tmp_path):
+    repository = UnifiedDeliveriesRepository(_build_session_factory(tmp_path), export_batch_size=2)
+
+    _assert_record_batches_hold_the_exported_values(repository)
+
+
+def test_export_delivery_batches_on_postgres(postgres_session_factory):
+    repository = UnifiedDeliveriesRepository(postgres_session_factory, export_batch_size=2)
+
+    _assert_record_batches_hold_the_exported_values(repository)
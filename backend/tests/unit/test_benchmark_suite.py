@@ -0,0 +1,66 @@
+import argparse
+import json
+
+import pytest
+
+from backend.benchmarks import suite
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1000", 1_000), ("100k", 100_000), ("1M", 1_000_000)])
+def test_parse_size_accepts_plain_and_suffixed_counts(value, expected):
+    assert suite.parse_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "k", "0", "1.5k", "10g"])
+def test_parse_size_rejects_invalid_counts(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        suite.parse_size(value)
+
+
+def test_run_times_every_stage_of_both_partners(tmp_path):
+    document = suite.run([20], repeat=1, database_url=f"sqlite:///{tmp_path / 'bench.db'}")
+
+    assert document["version"] == suite.RESULTS_VERSION
+    assert document["environment"]["database"] == "sqlite"
+    assert sorted(document["results"]) == sorted(
+        f"{partner}/{stage}/20"
+        for partner in ("partner_a", "partner_b")
+        for stage in ("decode", "parse_dates", "map", "stats", "store", "end_to_end", "end_to_end_stream")
+    )
+    assert all(result["seconds"] > 0 for result in document["results"].values())
+
+
+def test_payload_port_streams_the_records_it_fetches(monkeypatch):
+    monkeypatch.setattr(suite, "_STREAM_CHUNK_BYTES", 7)
+    schema = suite.partner_payload_schemas(suite.get_settings())["source-a"]
+    content = json.dumps(list(suite.partner_a_records(5))).encode()
+    port = suite._PayloadPort(schema, content)
+    stats = Stats.for_partner("source-a")
+
+    streamed = list(port.stream("source-a", stats=stats))
+
+    assert streamed == port.fetch("source-a").delivery_data
+    assert stats.bytes_received == len(content)
+    assert PipelineStage.DECODE in stats.stage_seconds
+
+
+def test_compare_reports_only_benchmarks_slower_than_the_threshold():
+    def document(**seconds):
+        return {"results": {name: {"seconds": value} for name, value in seconds.items()}}
+
+    baseline = document(decode=1.0, map=1.0, store=1.0, removed=1.0)
+    current = document(decode=1.05, map=1.5, store=0.5, added=9.0)
+
+    assert suite.compare(baseline, current, threshold=0.1) == [("map", 1.5)]
+
+
+def test_compare_command_exits_non_zero_on_a_regression(tmp_path):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    environment = '"environment": {"database": "sqlite", "cpus": 1}'
+    baseline.write_text('{"version": 1, ' + environment + ', "results": {"map": {"seconds": 1.0}}}')
+    current.write_text('{"version": 1, ' + environment + ', "results": {"map": {"seconds": 1.2}}}')
+
+    assert suite.main(["compare", str(baseline), str(current)]) == 1
+    assert suite.main(["compare", str(baseline), str(current), "--threshold", "0.25"]) == 0
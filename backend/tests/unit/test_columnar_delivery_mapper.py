@@ -0,0 +1,177 @@
+import json
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from backend.application.use_cases.mapper.parnter_a_delivery_mapper import (
+    map_partner_deliveries_a,
+    map_partner_delivery_a,
+)
+from backend.application.use_cases.mapper.parnter_b_delivery_mapper import (
+    map_partner_deliveries_b,
+    map_partner_delivery_b,
+)
+from backend.application.use_cases.mapper.partner_delivery_mapper import PartnerDeliveryMapper
+from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
+from backend.benchmarks.synthetic import partner_a_records, partner_b_records
+from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.stats import Stats
+from backend.shared.config.settings import get_settings
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_TIMESTAMPS = [
+    "2025-08-01T09:41:00Z",
+    "2025-08-01T09:41:00+02:00",
+    "2025-08-01T03:41:00-05:30",
+    "2025-08-01T09:41:00.123456Z",
+    "2025-08-01T09:41:00.5+01:00",
+    "2025-08-01T05:00:00Z",
+    "2025-08-01T11:00:00Z",
+    "2025-08-01T11:00:00.000001Z",
+    "2025-08-01T24:00:00Z",
+    "2025-02-29T10:00:00Z",
+    "0000-01-01T00:00:00Z",
+    "9999-12-31T23:00:00-02:00",
+    "2025-08-01 09:41:00Z",
+    "2025-08-01T09:41:00+24:00",
+    "2025-08-01T09:41:00",
+    "garbage",
+    "",
+    None,
+    5,
+]
+
+
+@pytest.fixture
+def settings():
+    return get_settings()
+
+
+def _map_each(mapper, records):
+    mapped, valid = [], []
+    for record in records:
+        try:
+            mapped.append(mapper("source", "site-1", record))
+            valid.append(True)
+        except Exception:
+            valid.append(False)
+    return mapped, valid
+
+
+def _assert_parity(single, batch, records):
+    expected, expected_valid = _map_each(single, records)
+    mapped, valid = batch("source", "site-1", records)
+    assert valid.tolist() == expected_valid
+    assert mapped == expected
+
+
+def test_columnar_mapping_matches_per_record_mapping_on_partner_fixtures():
+    partner_a = json.loads((_REPO_ROOT / "mock_logistics_a" / "data.json").read_text())
+    partner_b = json.loads((_REPO_ROOT / "mock_logistics_b" / "data.json").read_text())
+
+    _assert_parity(map_partner_delivery_a, map_partner_deliveries_a, partner_a)
+    _assert_parity(map_partner_delivery_b, map_partner_deliveries_b, partner_b)
+
+
+def test_columnar_mapping_matches_per_record_mapping_on_synthetic_payloads():
+    _assert_parity(map_partner_delivery_a, map_partner_deliveries_a, list(partner_a_records(2_000)))
+    _assert_parity(map_partner_delivery_b, map_partner_deliveries_b, list(partner_b_records(2_000)))
+
+
+def test_columnar_mapping_masks_the_records_per_record_mapping_rejects():
+    partner_a = [
+        {"deliveryId": f"DEL-{index}", "supplier": "S", "timestamp": timestamp, "status": status, "signedBy": signer}
+        for index, timestamp in enumerate(_TIMESTAMPS)
+        for status, signer in (("Delivered ", "Martin"), (None, None))
+    ] + [
+        {"supplier": "S", "timestamp": _TIMESTAMPS[0]},
+        {"deliveryId": 1, "supplier": "S", "timestamp": _TIMESTAMPS[0]},
+        {"deliveryId": "DEL-x", "supplier": None, "timestamp": _TIMESTAMPS[0]},
+        "not a record",
+        None,
+    ]
+    partner_b = [
+        {"id": f"b-{index}", "provider": "S", "deliveredAt": timestamp, "statusCode": status, "receiver": receiver}
+        for index, timestamp in enumerate(_TIMESTAMPS)
+        for status, receiver in (("OK", {"signed": True}), ("failed", None), (3, "not a receiver"), ("x", {}))
+    ]
+
+    _assert_parity(map_partner_delivery_a, map_partner_deliveries_a, partner_a)
+    _assert_parity(map_partner_delivery_b, map_partner_deliveries_b, partner_b)
+
+
+def test_columnar_mapping_keeps_exact_microseconds_at_extreme_years():
+    timestamps = [
+        "9998-12-27T23:00:59.123456-00:00",
+        "9998-12-31T23:59:59.999999Z",
+        "9999-12-31T23:59:59.999999Z",
+        "0001-01-01T00:00:00.000001Z",
+        "1900-01-01T00:00:00.999999+14:00",
+        "1969-12-31T23:59:59.999999Z",
+        "2262-04-11T23:47:16.854776Z",
+        "5000-06-15T12:30:45.000001-03:30",
+    ]
+    partner_a = [
+        {"deliveryId": f"DEL-{index}", "supplier": "S", "timestamp": timestamp, "status": "delivered", "signedBy": "M"}
+        for index, timestamp in enumerate(timestamps)
+    ]
+
+    _assert_parity(map_partner_delivery_a, map_partner_deliveries_a, partner_a)
+    mapped, _ = map_partner_deliveries_a("source", "site-1", partner_a)
+    assert mapped[0].delivered_at.microsecond == 123456
+    assert mapped[1].delivered_at.second == 59
+
+
+def test_columnar_mapping_parses_the_rest_of_a_batch_when_numpy_rejects_one_value(monkeypatch):
+    from backend.application.use_cases.mapper import columnar_delivery_mapper
+
+    parsed_one_by_one = []
+    parse_or_none = columnar_delivery_mapper._parse_or_none
+
+    def tracking_parse_or_none(value):
+        parsed_one_by_one.append(value)
+        return parse_or_none(value)
+
+    monkeypatch.setattr(columnar_delivery_mapper, "_parse_or_none", tracking_parse_or_none)
+    timestamps = ["2025-08-01T09:41:00Z", "2025-02-30T10:00:00Z", "2025-08-01T09:41:00+02:00", "2025-13-01T10:00:00Z"]
+    partner_a = [
+        {"deliveryId": f"DEL-{index}", "supplier": "S", "timestamp": timestamp, "status": "delivered", "signedBy": "M"}
+        for index, timestamp in enumerate(timestamps)
+    ]
+
+    _assert_parity(map_partner_delivery_a, map_partner_deliveries_a, partner_a)
+    assert parsed_one_by_one == ["2025-02-30T10:00:00Z", "2025-13-01T10:00:00Z"]
+
+
+def test_columnar_processor_counts_invalid_records_as_errors(settings):
+    records = list(partner_a_records(5)) + [{"deliveryId": "DEL-bad", "supplier": "S", "timestamp": "garbage"}]
+    processor = PartnerDeliveryProcessor(PartnerDeliveryMapper(settings), columnar_batch_size=4)
+
+    unified_deliveries, stats = processor.process(
+        delivery=PartnerDelivery(delivery_data=records),
+        source=settings.source_a,
+        site_id="site-1",
+    )
+
+    assert [delivery.id for delivery in unified_deliveries] == [record["deliveryId"] for record in records[:5]]
+    partner_stats = stats.as_dict()[settings.source_a]
+    assert partner_stats["fetched"] == 6
+    assert partner_stats["transformed"] == 5
+    assert partner_stats["errors"] == 1
+    assert stats.stored == 0
+
+
+def test_columnar_processor_streams_in_record_order(settings):
+    records = list(partner_b_records(7))
+    processor = PartnerDeliveryProcessor(PartnerDeliveryMapper(settings), columnar_batch_size=3)
+    stats = Stats.for_partner(settings.source_b)
+
+    stream = processor.process_stream(records=iter(records), source=settings.source_b, site_id="site-1", stats=stats)
+    first = list(islice(stream, 2))
+
+    assert stats.as_dict()[settings.source_b]["fetched"] == 3
+    assert first + list(stream) == [map_partner_delivery_b(settings.source_b, "site-1", record) for record in records]
+    assert stats.as_dict()[settings.source_b]["transformed"] == 7
+
@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from backend.domain.columnar_format import ColumnarFormat
+from backend.shared.utils import columnar_export
+from backend.shared.utils.columnar_export import (
+    DELIVERY_SCHEMA,
+    ColumnarFileWriter,
+    delivery_record_batch,
+    write_columnar_file,
+)
+
+
+def _batch(start: int, rows: int) -> pa.RecordBatch:
+    indices = range(start, start + rows)
+    return delivery_record_batch([
+        tuple(f"DEL-{index}" for index in indices),
+        ("SupplierX",) * rows,
+        tuple(datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc) + timedelta(minutes=index) for index in indices),
+        ("delivered",) * rows,
+        tuple(index % 2 == 0 for index in indices),
+        ("site-1",) * rows,
+        ("source-a",) * rows,
+        (0.5,) * rows,
+    ])
+
+
+def _read(path: str, columnar_format: ColumnarFormat) -> pa.Table:
+    if columnar_format is ColumnarFormat.PARQUET:
+        return pq.read_table(path)
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def test_delivery_record_batch_converts_datetimes_to_utc():
+    batch = delivery_record_batch([
+        ("DEL-1", "DEL-2"),
+        ("SupplierX", "SupplierX"),
+        (datetime(2025, 8, 1, 11, 41, tzinfo=timezone(timedelta(hours=2))), datetime(2025, 8, 1, 9, 41)),
+        ("delivered", "pending"),
+        (True, False),
+        ("site-1", "site-1"),
+        ("source-a", "source-b"),
+        (1.0, 0.3),
+    ])
+
+    assert batch.schema == DELIVERY_SCHEMA
+    assert batch.column("delivered_at").to_pylist() == [datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc)] * 2
+
+
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+def test_writer_gathers_batches_into_larger_writes(tmp_path, monkeypatch, columnar_format):
+    monkeypatch.setattr(columnar_export, "_ROWS_PER_WRITE", 4)
+    path = str(tmp_path / f"deliveries.{columnar_format.value}")
+
+    with ColumnarFileWriter(path, columnar_format) as writer:
+        for start in range(0, 9, 3):
+            writer.write(_batch(start, 3))
+
+    table = _read(path, columnar_format)
+    assert writer.rows == table.num_rows == 9
+    assert table.schema == DELIVERY_SCHEMA
+    assert table.column("id").to_pylist() == [f"DEL-{index}" for index in range(9)]
+    if columnar_format is ColumnarFormat.PARQUET:
+        assert [pq.ParquetFile(path).metadata.row_group(group).num_rows for group in range(2)] == [6, 3]
+
+
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+def test_write_columnar_file_without_batches_writes_an_empty_table(tmp_path, columnar_format):
+    async def no_batches():
+        return
+        yield
+
+    path = columnar_export.new_export_path(columnar_format, str(tmp_path))
+
+    rows = asyncio.run(write_columnar_file(no_batches(), path, columnar_format))
+
+    assert path.endswith(f".{columnar_format.value}")
+    assert rows == 0
+    assert _read(path, columnar_format).schema == DELIVERY_SCHEMA
+
+
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+def test_writer_removes_the_file_when_an_exception_escapes(tmp_path, monkeypatch, columnar_format):
+    monkeypatch.setattr(columnar_export, "_ROWS_PER_WRITE", 4)
+    path = tmp_path / f"deliveries.{columnar_format.value}"
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        with ColumnarFileWriter(str(path), columnar_format) as writer:
+            writer.write(_batch(0, 6))
+            raise RuntimeError("database went away")
+
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+def test_write_columnar_file_removes_the_file_when_the_batches_fail(tmp_path, monkeypatch, columnar_format):
+    monkeypatch.setattr(columnar_export, "_ROWS_PER_WRITE", 4)
+
+    async def failing_batches():
+        yield _batch(0, 6)
+        raise RuntimeError("database went away")
+
+    path = columnar_export.new_export_path(columnar_format, str(tmp_path))
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        asyncio.run(write_columnar_file(failing_batches(), path, columnar_format))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,16 @@
+import pytest
+
+from backend.shared.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_values():
+    cursor = encode_cursor(-1.2, 42)
+
+    assert decode_cursor(cursor, size=2) == [-1.2, 42]
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", encode_cursor(1), "eyJhIjogMX0"])
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, size=2)
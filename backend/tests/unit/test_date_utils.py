@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from backend.shared.utils.date_utils import (
+    _format_utc,
+    _parse_general,
+    parse_iso8601_utc,
+    to_iso8601_utc,
+    to_iso8601_utc_many,
+)
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _fixture_timestamps() -> list[str]:
+    partner_a = json.loads((_REPO_ROOT / "mock_logistics_a" / "data.json").read_text())
+    partner_b = json.loads((_REPO_ROOT / "mock_logistics_b" / "data.json").read_text())
+    return [record["timestamp"] for record in partner_a] + [record["deliveredAt"] for record in partner_b]
+
+
+def _general(date_str: str) -> str:
+    return _format_utc(_parse_general(date_str))
+
+
+@pytest.mark.parametrize("date_str", _fixture_timestamps())
+def test_fast_path_matches_general_parser_on_partner_fixtures(date_str):
+    assert to_iso8601_utc(date_str) == _general(date_str)
+    assert parse_iso8601_utc(date_str) == _parse_general(date_str)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2025-08-01T05:39:00+02:00",
+        "2025-08-01T01:15:00-05:30",
+        "2025-12-31T23:30:00-01:00",
+        "2025-08-01T09:41:00.5Z",
+        "2025-08-01T09:41:00.123456+01:00",
+        "2025-08-01T09:41:00-00:00",
+        "2025-08-01T24:00:00Z",
+        "20250801T094100Z",
+        "2025-08-01T09:41Z",
+    ],
+)
+def test_fast_path_matches_general_parser_on_edge_cases(date_str):
+    assert to_iso8601_utc(date_str) == _general(date_str)
+    assert parse_iso8601_utc(date_str) == _parse_general(date_str)
+
+
+@pytest.mark.parametrize("date_str", ["2025-13-01T09:41:00Z", "2025-08-01T09:41:00+24:00", "not a date", None])
+def test_invalid_timestamps_are_rejected(date_str):
+    with pytest.raises(ValueError, match="Invalid ISO 8601 date string"):
+        to_iso8601_utc(date_str)
+
+
+def test_timestamps_without_timezone_are_rejected():
+    with pytest.raises(ValueError, match="must include timezone info"):
+        to_iso8601_utc("2025-08-01T09:41:00")
+
+
+def test_parse_returns_aware_utc_datetime():
+    assert parse_iso8601_utc("2025-08-01T11:41:00+02:00") == datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc)
+    assert parse_iso8601_utc("2025-08-01T11:41:00+02:00").tzinfo is timezone.utc
+
+
+def test_batch_normalization_matches_single_values():
+    timestamps = _fixture_timestamps() * 3
+
+    assert to_iso8601_utc_many(timestamps) == [to_iso8601_utc(date_str) for date_str in timestamps]
+
+
+def test_batch_normalization_raises_on_invalid_value():
+    with pytest.raises(ValueError):
+        to_iso8601_utc_many(["2025-08-01T09:41:00Z", "garbage"])
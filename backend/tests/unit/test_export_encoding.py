@@ -0,0 +1,64 @@
+import asyncio
+import gzip
+from datetime import datetime, timedelta, timezone
+
+from backend.domain.export_format import ExportFormat
+from backend.shared.utils.export_encoding import csv_rows, encode_export, ndjson_lines
+
+
+def _item(index: int, **overrides) -> dict:
+    return {
+        "id": f"DEL-{index}",
+        "supplier": "Supplier, Inc.",
+        "deliveredAt": datetime(2025, 8, 1, 9, 41, 5, 120, tzinfo=timezone.utc),
+        "status": "delivered",
+        "signed": False,
+        "siteId": "site-1",
+        "source": "source-a",
+        "deliveryScore": 0.5,
+        **overrides,
+    }
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def _encode(batches, export_format: ExportFormat, compress: bool = False) -> list[bytes]:
+    async def collect():
+        return [chunk async for chunk in encode_export(_batches(*batches), export_format, compress)]
+
+    return asyncio.run(collect())
+
+
+def test_ndjson_lines_writes_one_document_per_line():
+    lines = ndjson_lines([_item(1), _item(2, signed=True)]).decode().splitlines()
+
+    assert len(lines) == 2
+    assert lines[0].startswith('{"id":"DEL-1",')
+    assert '"deliveredAt":"2025-08-01T09:41:05.000120Z"' in lines[0]
+    assert '"signed":true' in lines[1]
+
+
+def test_csv_rows_quote_separators_and_format_values_like_json():
+    offset = _item(1, deliveredAt=datetime(2025, 8, 1, 11, 41, tzinfo=timezone(timedelta(hours=2))), deliveryScore=1.0)
+
+    assert csv_rows([offset]).decode() == (
+        'DEL-1,"Supplier, Inc.",2025-08-01T09:41:00Z,delivered,false,site-1,source-a,1.0\n'
+    )
+
+
+def test_encode_export_yields_one_chunk_per_batch_after_the_csv_header():
+    chunks = _encode([[_item(1), _item(2)], [], [_item(3)]], ExportFormat.CSV)
+
+    assert chunks[0] == b"id,supplier,deliveredAt,status,signed,siteId,source,deliveryScore\n"
+    assert [chunk.count(b"\n") for chunk in chunks[1:]] == [2, 1]
+
+
+def test_encode_export_compresses_the_stream_as_one_gzip_member():
+    batches = [[_item(index) for index in range(start, start + 100)] for start in range(0, 500, 100)]
+
+    compressed = b"".join(_encode(batches, ExportFormat.NDJSON, compress=True))
+
+    assert gzip.decompress(compressed) == b"".join(_encode(batches, ExportFormat.NDJSON))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -14,44 +15,43 @@ from backend.domain.partner_delivery import PartnerDelivery
 from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
 
 
-def _build_adapter(*endpoints: SimpleNamespace) -> PartnerDeliveriesHttpAdapter:
+def _build_adapter(http_client: MagicMock, *endpoints: SimpleNamespace) -> PartnerDeliveriesHttpAdapter:
     http_config = HttpConfig(
         timeout=5.0,
         endpoints={endpoint.name: endpoint.url for endpoint in endpoints},
     )
-    return PartnerDeliveriesHttpAdapter(http_config=http_config)
+    return PartnerDeliveriesHttpAdapter(http_config=http_config, http_client=http_client)
 
 
-def _patch_async_client(mock_client) -> patch:
-    context_manager = MagicMock()
-    context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-    context_manager.__aexit__ = AsyncMock(return_value=None)
-    return patch("httpx.AsyncClient", return_value=context_manager)
+def _build_http_client() -> MagicMock:
+    http_client = MagicMock()
+    http_client.run.side_effect = asyncio.run
+    return http_client
 
 
 def test_fetch_partner_deliveries_successful_response():
     endpoint = SimpleNamespace(name="Partner A", url="https://partner-a.test")
-    adapter = _build_adapter(endpoint)
+    client = _build_http_client()
+    adapter = _build_adapter(client, endpoint)
 
     response = MagicMock()
     response.raise_for_status.return_value = None
-    response.json.return_value = [{"delivery_id": "123"}]
+    response.content = b'[{"delivery_id": "123"}]'
 
-    client = MagicMock()
     client.post = AsyncMock(return_value=response)
 
-    with _patch_async_client(client) as async_client_cls:
-        deliveries = adapter.fetch("Partner A")
+    deliveries = adapter.fetch("Partner A")
 
-    async_client_cls.assert_called_once_with(timeout=5.0)
-    client.post.assert_awaited_once_with("https://partner-a.test")
+    client.run.assert_called_once()
+    client.post.assert_awaited_once_with("Partner A", "https://partner-a.test")
     assert isinstance(deliveries, PartnerDelivery)
     assert deliveries.delivery_data == [{"delivery_id": "123"}]
 
 
 def test_fetch_partner_deliveries_http_status_error():
     endpoint = SimpleNamespace(name="Partner B", url="https://partner-b.test")
-    adapter = _build_adapter(endpoint)
+    client = _build_http_client()
+    adapter = _build_adapter(client, endpoint)
 
     request = httpx.Request("POST", endpoint.url)
     http_error = httpx.HTTPStatusError(
@@ -63,14 +63,12 @@ def test_fetch_partner_deliveries_http_status_error():
     response = MagicMock()
     response.raise_for_status.side_effect = http_error
 
-    client = MagicMock()
     client.post = AsyncMock(return_value=response)
 
-    with _patch_async_client(client):
-        with pytest.raises(PartnerDeliveryFetchError) as exc_info:
-            adapter.fetch("Partner B")
+    with pytest.raises(PartnerDeliveryFetchError) as exc_info:
+        adapter.fetch("Partner B")
 
-    client.post.assert_awaited_once_with("https://partner-b.test")
+    client.post.assert_awaited_once_with("Partner B", "https://partner-b.test")
     assert exc_info.type is PartnerDeliveryFetchError
     assert str(exc_info.value) == f"Failed to fetch deliveries from {endpoint.name}: bad response"
     assert exc_info.value.detail == "bad response"
@@ -79,21 +77,20 @@ def test_fetch_partner_deliveries_http_status_error():
 
 def test_fetch_partner_deliveries_request_error():
     endpoint = SimpleNamespace(name="Partner C", url="https://partner-c.test")
-    adapter = _build_adapter(endpoint)
+    client = _build_http_client()
+    adapter = _build_adapter(client, endpoint)
 
     request_error = httpx.RequestError(
         message="connection lost",
         request=httpx.Request("POST", endpoint.url),
     )
 
-    client = MagicMock()
     client.post = AsyncMock(side_effect=request_error)
 
-    with _patch_async_client(client):
-        with pytest.raises(PartnerDeliveryFetchError) as exc_info:
-            adapter.fetch("Partner C")
+    with pytest.raises(PartnerDeliveryFetchError) as exc_info:
+        adapter.fetch("Partner C")
 
-    client.post.assert_awaited_once_with("https://partner-c.test")
+    client.post.assert_awaited_once_with("Partner C", "https://partner-c.test")
     assert exc_info.type is PartnerDeliveryFetchError
     assert str(exc_info.value) == f"Failed to fetch deliveries from {endpoint.name}: connection lost"
     assert exc_info.value.detail == "connection lost"
@@ -101,7 +98,8 @@ def test_fetch_partner_deliveries_request_error():
 
 
 def test_fetch_partner_deliveries_unknown_source():
-    adapter = _build_adapter()
+    client = _build_http_client()
+    adapter = _build_adapter(client)
 
     with pytest.raises(PartnerDeliveryFetchError) as exc_info:
         adapter.fetch("Partner X")
@@ -109,3 +107,20 @@ def test_fetch_partner_deliveries_unknown_source():
     assert str(exc_info.value) == "Failed to fetch deliveries from Partner X: Unknown partner source"
     assert exc_info.value.detail == "Unknown partner source"
     assert exc_info.value.source == "Partner X"
+    client.run.assert_not_called()
+
+
+def test_fetch_partner_deliveries_deadline_exceeded():
+    endpoint = SimpleNamespace(name="Partner A", url="https://partner-a.test")
+    client = _build_http_client()
+    adapter = _build_adapter(client, endpoint)
+
+    async def slow_post(source, url):
+        await asyncio.sleep(1.0)
+
+    client.post = slow_post
+
+    with pytest.raises(PartnerDeliveryFetchError) as exc_info:
+        adapter.fetch("Partner A", timeout=0.01)
+
+    assert exc_info.value.detail == "Deadline of 0.01s exceeded"
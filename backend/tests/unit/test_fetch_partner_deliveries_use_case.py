@@ -4,7 +4,9 @@ from unittest.mock import MagicMock, patch
 
 from backend.application.use_cases.fetch_deliveries import FetchPartnerDeliveriesUseCase
 from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats import Stats
+from backend.domain.store_result import StoreResult
 
 
 def test_fetch_partner_deliveries_use_case_fetches_and_processes_partner_delivery():
@@ -27,8 +29,13 @@ def test_fetch_partner_deliveries_use_case_fetches_and_processes_partner_deliver
 
         stats, unified_deliveries = use_case.fetch_partner_deliveries("site-123", "Partner A")
 
-    fetch_port.fetch.assert_called_once_with("Partner A")
-    mock_processor_cls.assert_called_once_with(mapper)
+    fetch_port.fetch.assert_called_once_with("Partner A", timeout=None)
+    mock_processor_cls.assert_called_once_with(
+        mapper,
+        columnar_batch_size=None,
+        executor=None,
+        pool_chunk_size=50_000,
+    )
     mock_processor_instance.process.assert_called_once_with(
         delivery=partner_delivery,
         source="Partner A",
@@ -36,3 +43,32 @@ def test_fetch_partner_deliveries_use_case_fetches_and_processes_partner_deliver
     )
     assert stats is expected_stats
     assert unified_deliveries is expected_unified_deliveries
+    assert set(stats.stage_seconds) == {PipelineStage.FETCH, PipelineStage.MAP}
+
+
+def test_stream_partner_deliveries_hands_over_fixed_size_batches():
+    records = [{"delivery_id": str(index)} for index in range(5)]
+    fetch_port = MagicMock()
+    fetch_port.stream.return_value = iter(records)
+    mapper = MagicMock()
+    mapper.map.side_effect = lambda source, site_id, data: data["delivery_id"]
+    batches = []
+    stats = Stats.for_partner("Partner A")
+
+    def on_batch(batch):
+        batches.append(batch)
+        return StoreResult(inserted=len(batch))
+
+    use_case = FetchPartnerDeliveriesUseCase(fetch_partner_deliveries_port=fetch_port, partner_delivery_mapper=mapper)
+
+    use_case.stream_partner_deliveries("site-123", "Partner A", stats, 2, on_batch, timeout=3.0)
+
+    fetch_port.stream.assert_called_once_with("Partner A", timeout=3.0, stats=stats)
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+    assert stats.stored == 5
+    assert stats.as_dict()["Partner A"]["fetched"] == 5
+    assert stats.as_dict()["Partner A"]["transformed"] == 5
+    assert stats.as_dict()["Partner A"]["inserted"] == 5
+    assert stats.duration_seconds is not None
+    assert set(stats.stage_seconds) == {PipelineStage.MAP, PipelineStage.STORE}
+    assert stats.peak_rss_bytes > 0
@@ -0,0 +1,23 @@
+from backend.shared.utils.iter_utils import batched
+
+
+def test_batched_yields_full_batches_then_the_remainder():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_batched_consumes_the_input_lazily():
+    consumed = []
+
+    def items():
+        for item in range(10):
+            consumed.append(item)
+            yield item
+
+    first = next(batched(items(), 3))
+
+    assert first == [0, 1, 2]
+    assert consumed == [0, 1, 2]
+
+
+def test_batched_yields_nothing_for_empty_input():
+    assert list(batched([], 3)) == []
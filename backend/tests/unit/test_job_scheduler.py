@@ -1,3 +1,5 @@
+import threading
+import time
 from datetime import datetime, timezone
 from uuid import UUID
 from unittest.mock import Mock, patch
@@ -6,12 +8,16 @@ from backend.adapters.scheduling import job_scheduler
 from backend.adapters.scheduling.job_config import JobConfig
 from backend.adapters.scheduling.job_scheduler import Scheduler
 from backend.adapters.scheduling.job_status import JobStatus
+from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
+from backend.domain.pipeline_stage import PipelineStage
 from backend.domain.stats import Stats
+from backend.domain.store_result import StoreResult
 
 
 def test_scheduler_run_fetch_partner_deliveries_job_schedules_and_starts():
     fetch_use_case = Mock()
     store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
     clock = Mock()
     job_config = Mock(spec=JobConfig)
     job_config.model_dump.return_value = {"id": "123"}
@@ -41,6 +47,7 @@ def test_scheduler_run_fetch_partner_deliveries_job_schedules_and_starts():
 def test_scheduler_run_fetch_job_invokes_use_case_with_expected_arguments():
     fetch_use_case = Mock()
     store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
     clock = Mock()
     job_config = Mock()
     jobs_repository = Mock()
@@ -58,7 +65,7 @@ def test_scheduler_run_fetch_job_invokes_use_case_with_expected_arguments():
     scheduler._run_fetch_job("site-456", partner_sources)
 
     assert clock.get_utc_now.call_count == 2
-    fetch_use_case.fetch_partner_deliveries.assert_called_once_with("site-456", "source-a")
+    fetch_use_case.fetch_partner_deliveries.assert_called_once_with("site-456", "source-a", timeout=None)
 
     jobs_repository.create_job.assert_called_once()
     call_args = jobs_repository.create_job.call_args
@@ -71,3 +78,214 @@ def test_scheduler_run_fetch_job_invokes_use_case_with_expected_arguments():
 
     store_use_case.store.assert_called_once_with(job_id, unified_deliveries)
     jobs_repository.update_job_stats.assert_called_once_with(job_id, stats_result, scheduled_time, None)
+
+
+def test_scheduler_run_fetch_job_fetches_partners_concurrently():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    barrier = threading.Barrier(2, timeout=1.0)
+
+    def fetch(site_id, source, timeout):
+        barrier.wait()
+        return Stats.for_partner(source), []
+
+    fetch_use_case.fetch_partner_deliveries.side_effect = fetch
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a", "source-b"}, partner_deadline=2.0, job_deadline=5.0)
+
+    assert fetch_use_case.fetch_partner_deliveries.call_count == 2
+    for call in fetch_use_case.fetch_partner_deliveries.call_args_list:
+        assert 0 < call.kwargs["timeout"] <= 2.0
+    recorded = {call.args[1].partner: call.args[3] for call in jobs_repository.update_job_stats.call_args_list}
+    assert recorded == {"source-a": None, "source-b": None}
+
+
+def test_scheduler_run_fetch_job_isolates_partner_failures():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    stats_b = Stats.for_partner("source-b")
+
+    def fetch(site_id, source, timeout):
+        if source == "source-a":
+            raise PartnerDeliveryFetchError(source, "boom")
+        return stats_b, []
+
+    fetch_use_case.fetch_partner_deliveries.side_effect = fetch
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a", "source-b"})
+
+    recorded = {call.args[1].partner: call.args for call in jobs_repository.update_job_stats.call_args_list}
+    assert recorded["source-a"][3] == "Failed to fetch deliveries from source-a: boom"
+    assert recorded["source-b"][1] is stats_b
+    assert recorded["source-b"][3] is None
+    store_use_case.store.assert_called_once()
+
+
+def test_scheduler_run_fetch_job_records_partners_exceeding_job_deadline():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    release = threading.Event()
+
+    def fetch(site_id, source, timeout):
+        if source == "source-a":
+            release.wait(1.0)
+        return Stats.for_partner(source), []
+
+    fetch_use_case.fetch_partner_deliveries.side_effect = fetch
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    started = time.monotonic()
+    scheduler._run_fetch_job("site-456", {"source-a", "source-b"}, job_deadline=0.1)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 0.9
+    recorded = {call.args[1].partner: call.args[3] for call in jobs_repository.update_job_stats.call_args_list}
+    assert recorded == {"source-a": "Job deadline of 0.1s exceeded", "source-b": None}
+
+
+def _join_partner_threads() -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith("partner-fetch"):
+            thread.join(2.0)
+
+
+def test_scheduler_run_fetch_job_does_not_store_deliveries_fetched_after_job_deadline():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    release = threading.Event()
+
+    def fetch(site_id, source, timeout):
+        release.wait(1.0)
+        return Stats.for_partner(source), ["late-delivery"]
+
+    fetch_use_case.fetch_partner_deliveries.side_effect = fetch
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a"}, job_deadline=0.1)
+    release.set()
+    _join_partner_threads()
+
+    store_use_case.store.assert_not_called()
+    assert jobs_repository.update_job_stats.call_args.args[3] == "Job deadline of 0.1s exceeded"
+
+
+def test_scheduler_run_fetch_job_stops_streaming_batches_once_store_runs_past_job_deadline():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    stored = []
+    release = threading.Event()
+
+    def store(job_id, batch):
+        release.wait(1.0)
+        stored.append(batch)
+        return StoreResult(inserted=len(batch))
+
+    def stream(site_id, source, stats, batch_size, on_batch, timeout):
+        for batch in (["d-1", "d-2"], ["d-3", "d-4"], ["d-5"]):
+            on_batch(batch)
+
+    store_use_case.store.side_effect = store
+    fetch_use_case.stream_partner_deliveries.side_effect = stream
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a"}, job_deadline=0.1, streaming=True, stream_batch_size=2)
+    release.set()
+    _join_partner_threads()
+
+    # The batch being stored at the deadline completes; no batch is written after it.
+    assert stored == [["d-1", "d-2"]]
+    jobs_repository.update_job_stats.assert_called_once()
+    assert jobs_repository.update_job_stats.call_args.args[3] == "Job deadline of 0.1s exceeded"
+
+
+def test_scheduler_records_a_partner_that_stopped_at_the_deadline_as_exceeding_it():
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    scheduler = Scheduler(Mock(), Mock(), clock, Mock(), jobs_repository)
+    partial = Stats.for_partner("source-a")
+    partial.record_stored(2)
+    # The task noticed the deadline before `as_completed` timed out, so the job thread sees its result.
+    scheduler._fetch_and_store_partner_deliveries = Mock(return_value=(partial, job_scheduler._ABANDONED))
+
+    outcome = scheduler._fan_out_fetch_job("site-456", {"source-a"}, None, 5.0, False, 1000)
+
+    assert outcome == job_scheduler._DEADLINE_EXCEEDED
+    jobs_repository.update_job_stats.assert_called_once()
+    assert jobs_repository.update_job_stats.call_args.args[1] is partial
+    assert jobs_repository.update_job_stats.call_args.args[3] == "Job deadline of 5.0s exceeded"
+
+
+def test_scheduler_run_fetch_job_streams_partner_deliveries_in_batches():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+
+    def stream(site_id, source, stats, batch_size, on_batch, timeout):
+        on_batch(["delivery-1", "delivery-2"])
+        stats.record_stored(2)
+
+    fetch_use_case.stream_partner_deliveries.side_effect = stream
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a"}, streaming=True, stream_batch_size=2)
+
+    fetch_use_case.fetch_partner_deliveries.assert_not_called()
+    job_id = jobs_repository.create_job.call_args.args[0]
+    store_use_case.store.assert_called_once_with(job_id, ["delivery-1", "delivery-2"])
+    _, stats, _, error = jobs_repository.update_job_stats.call_args.args
+    assert stats.partner == "source-a"
+    assert stats.stored == 2
+    assert error is None
+
+
+def test_scheduler_run_fetch_job_records_stored_count_and_store_time_once():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult(inserted=3)
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    jobs_repository = Mock()
+    fetch_use_case.fetch_partner_deliveries.return_value = (Stats.for_partner("source-a"), ["d-1", "d-2", "d-3"])
+
+    scheduler = Scheduler(fetch_use_case, store_use_case, clock, Mock(), jobs_repository)
+
+    scheduler._run_fetch_job("site-456", {"source-a"})
+
+    _, stats, _, _ = jobs_repository.update_job_stats.call_args.args
+    assert stats.stored == 3
+    assert stats.inserted == 3
+    assert PipelineStage.STORE in stats.stage_seconds
+    assert stats.duration_seconds is not None
+    assert stats.peak_rss_bytes > 0
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from backend.shared.utils.json_stream import iter_json_array
+
+
+def _chunks(payload: bytes, size: int) -> list[bytes]:
+    return [payload[index:index + size] for index in range(0, len(payload), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_iter_json_array_yields_elements_across_chunk_boundaries(chunk_size):
+    records = [
+        {"deliveryId": "DEL-001-A", "signedBy": "Lukas Müller", "nested": {"signed": True}},
+        {"deliveryId": "DEL-002-A", "signedBy": None, "tags": ["a", "b"]},
+        12345,
+        "plain, \"quoted\" ] string",
+    ]
+    payload = json.dumps(records, ensure_ascii=False, indent=2).encode("utf-8")
+
+    assert list(iter_json_array(_chunks(payload, chunk_size))) == records
+
+
+def test_iter_json_array_handles_empty_array():
+    assert list(iter_json_array([b" [ ", b" ] "])) == []
+
+
+@pytest.mark.parametrize("payload", [b'{"a": 1}', b'[{"a": 1},', b'[{"a": 1} {"b": 2}]', b'[{"a": 1}] []'])
+def test_iter_json_array_rejects_malformed_payloads(payload):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(payload, 3)))
@@ -0,0 +1,210 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.adapters.repostory.jobs.async_job_repository import get_async_jobs_port
+from backend.adapters.repostory.unified_deliveries.async_unified_delivery_repository import (
+    get_async_unified_deliveries_port,
+)
+from backend.domain.count_mode import CountMode
+from backend.shared.utils.columnar_export import delivery_record_batch
+from backend.domain.delivery_filter import DeliveryFilter
+from backend.domain.json_page import JsonPage
+from backend.domain.page import Page
+from backend.main import app
+from backend.shared.config.settings import get_settings
+from backend.shared.utils.cursor import InvalidCursorError
+
+
+@pytest.fixture
+def deliveries_port():
+    port = AsyncMock()
+    app.dependency_overrides[get_async_unified_deliveries_port] = lambda: port
+    yield port
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager, so the lifespan (database, HTTP pools) is not started.
+    return TestClient(app)
+
+
+def test_list_deliveries_passes_cursor_and_returns_next_cursor(client, deliveries_port):
+    deliveries_port.list_deliveries.return_value = Page(items=[], total=0, next_cursor="next")
+
+    response = client.get("/deliveries", params={"limit": 5, "cursor": "abc"})
+
+    assert response.status_code == 200
+    assert response.json()["nextCursor"] == "next"
+    deliveries_port.list_deliveries.assert_called_once_with(
+        limit=5, offset=0, cursor="abc", count_mode=CountMode.NONE, delivery_filter=DeliveryFilter(),
+    )
+
+
+def test_list_deliveries_reports_the_count_mode_used(client, deliveries_port):
+    deliveries_port.list_deliveries.return_value = Page(items=[], total=12, count_mode=CountMode.ESTIMATED)
+
+    response = client.get("/deliveries", params={"count": "estimated"})
+
+    assert response.json()["total"] == 12
+    assert response.json()["countMode"] == "estimated"
+    deliveries_port.list_deliveries.assert_called_once_with(
+        limit=50, offset=0, cursor=None, count_mode=CountMode.ESTIMATED, delivery_filter=DeliveryFilter(),
+    )
+
+
+def test_list_deliveries_parses_filters_and_formats_delivered_at(client, deliveries_port):
+    deliveries_port.list_deliveries.return_value = Page(
+        items=[{"id": "DEL-1", "deliveredAt": datetime(2025, 8, 1, 9, 41)}],
+        total=1,
+    )
+
+    response = client.get(
+        "/deliveries",
+        params={"siteId": "site-1", "status": "delivered", "deliveredFrom": "2025-08-01T00:00:00Z"},
+    )
+
+    assert response.json()["items"][0]["deliveredAt"] == "2025-08-01T09:41:00Z"
+    delivery_filter = deliveries_port.list_deliveries.call_args.kwargs["delivery_filter"]
+    assert delivery_filter.site_id == "site-1"
+    assert delivery_filter.status == "delivered"
+    assert delivery_filter.delivered_from == datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+
+def test_list_deliveries_forwards_items_rendered_by_the_database(client, deliveries_port, monkeypatch):
+    monkeypatch.setattr(get_settings(), "db_json_pages_enabled", True)
+    deliveries_port.list_deliveries_json.return_value = JsonPage(
+        items_json='[{"id" : "DEL-1", "deliveryScore" : 1.0}]', total=1, next_cursor="next",
+    )
+
+    response = client.get("/deliveries", params={"limit": 1})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "items": [{"id": "DEL-1", "deliveryScore": 1.0}],
+        "total": 1,
+        "countMode": "exact",
+        "limit": 1,
+        "offset": 0,
+        "nextCursor": "next",
+    }
+    deliveries_port.list_deliveries.assert_not_called()
+
+
+def test_list_deliveries_rejects_cursor_combined_with_offset(client, deliveries_port):
+    response = client.get("/deliveries", params={"offset": 10, "cursor": "abc"})
+
+    assert response.status_code == 400
+    deliveries_port.list_deliveries.assert_not_called()
+
+
+def test_list_deliveries_maps_malformed_cursor_to_bad_request(client, deliveries_port):
+    deliveries_port.list_deliveries.side_effect = InvalidCursorError("Malformed pagination cursor")
+
+    response = client.get("/deliveries", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Malformed pagination cursor"
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+_EXPORTED = {
+    "id": "DEL-1",
+    "supplier": "SupplierX",
+    "deliveredAt": datetime(2025, 8, 1, 9, 41, tzinfo=timezone.utc),
+    "status": "delivered",
+    "signed": True,
+    "siteId": "site-123",
+    "source": "source-a",
+    "deliveryScore": 1.0,
+}
+
+
+def test_export_deliveries_streams_filtered_batches_as_ndjson(client, deliveries_port):
+    deliveries_port.export_deliveries = MagicMock(return_value=_batches([_EXPORTED], [{**_EXPORTED, "id": "DEL-2"}]))
+
+    response = client.get("/deliveries/export", params={"status": "delivered"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="deliveries.ndjson"'
+    assert response.text.splitlines() == [
+        '{"id":"DEL-1","supplier":"SupplierX","deliveredAt":"2025-08-01T09:41:00Z","status":"delivered",'
+        '"signed":true,"siteId":"site-123","source":"source-a","deliveryScore":1.0}',
+        '{"id":"DEL-2","supplier":"SupplierX","deliveredAt":"2025-08-01T09:41:00Z","status":"delivered",'
+        '"signed":true,"siteId":"site-123","source":"source-a","deliveryScore":1.0}',
+    ]
+    deliveries_port.export_deliveries.assert_called_once_with(DeliveryFilter(status="delivered"))
+
+
+def test_export_deliveries_writes_gzipped_csv(client, deliveries_port):
+    deliveries_port.export_deliveries = MagicMock(return_value=_batches([_EXPORTED]))
+
+    response = client.get("/deliveries/export", params={"format": "csv", "gzip": "true"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    # The client decodes the gzip body transparently.
+    assert response.text.splitlines() == [
+        "id,supplier,deliveredAt,status,signed,siteId,source,deliveryScore",
+        "DEL-1,SupplierX,2025-08-01T09:41:00Z,delivered,true,site-123,source-a,1.0",
+    ]
+
+
+def test_export_deliveries_rejects_unknown_format(client, deliveries_port):
+    response = client.get("/deliveries/export", params={"format": "xml"})
+
+    assert response.status_code == 422
+
+
+def test_export_deliveries_columnar_serves_a_parquet_file_and_removes_it(client, deliveries_port, monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "export_dir", str(tmp_path))
+    batch = delivery_record_batch([[value] for value in _EXPORTED.values()])
+    deliveries_port.export_delivery_batches = MagicMock(return_value=_batches(batch, batch))
+
+    response = client.get("/deliveries/export/columnar", params={"jobId": "job-1"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert 'filename="deliveries.parquet"' in response.headers["content-disposition"]
+    table = pq.read_table(pa.BufferReader(response.content))
+    assert table.column("id").to_pylist() == ["DEL-1", "DEL-1"]
+    deliveries_port.export_delivery_batches.assert_called_once_with(DeliveryFilter(job_id="job-1"))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_deliveries_columnar_removes_the_file_when_the_export_fails(client, deliveries_port, monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "export_dir", str(tmp_path))
+
+    async def failing_batches():
+        raise RuntimeError("connection lost")
+        yield
+
+    deliveries_port.export_delivery_batches = MagicMock(return_value=failing_batches())
+
+    with pytest.raises(RuntimeError):
+        client.get("/deliveries/export/columnar", params={"format": "arrow"})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_list_jobs_returns_next_cursor(client):
+    port = AsyncMock()
+    port.list_jobs.return_value = Page(items=[], total=3, next_cursor="jobs-next")
+    app.dependency_overrides[get_async_jobs_port] = lambda: port
+    try:
+        response = client.get("/deliveries/jobs", params={"limit": 1})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.json()["nextCursor"] == "jobs-next"
+    assert response.json()["total"] == 3
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.repostory.jobs.job_model import Base
+from backend.adapters.repostory.unified_deliveries.async_unified_delivery_repository import (
+    get_async_unified_deliveries_port,
+)
+from backend.adapters.repostory.unified_deliveries.unified_delivery_repository import UnifiedDeliveriesRepository
+from backend.adapters.scheduling.job_scheduler import Scheduler
+from backend.benchmarks.synthetic import unified_deliveries
+from backend.domain.page import Page
+from backend.domain.partner_delivery_fetch_error import PartnerDeliveryFetchError
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
+from backend.domain.store_result import StoreResult
+from backend.main import app
+from backend.shared.utils.metrics import observe_pool
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client():
+    port = AsyncMock()
+    port.list_deliveries.return_value = Page(items=[], total=0)
+    app.dependency_overrides[get_async_unified_deliveries_port] = lambda: port
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_requests_are_timed_under_their_route_template(client):
+    before = _sample("http_request_seconds_count", method="GET", route="/deliveries")
+    unmatched = _sample("http_requests_total", method="GET", route="unmatched", status="404")
+
+    client.get("/deliveries", params={"limit": 5})
+    client.get("/deliveries", params={"limit": 0})
+    client.get("/no-such-route/42")
+
+    assert _sample("http_request_seconds_count", method="GET", route="/deliveries") == before + 2
+    assert _sample("http_requests_total", method="GET", route="/deliveries", status="422") >= 1
+    assert _sample("http_requests_total", method="GET", route="unmatched", status="404") == unmatched + 1
+
+
+def test_metrics_endpoint_serves_the_prometheus_text_format(client):
+    client.get("/deliveries")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_seconds_bucket{le="0.005",method="GET",route="/deliveries"}' in response.text
+
+
+def test_pool_gauges_are_read_from_the_engine_at_scrape_time(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=3)
+    observe_pool("test", engine)
+
+    with engine.connect():
+        assert _sample("db_pool_checked_out", engine="test") == 1
+        assert _sample("db_pool_size", engine="test") == 2
+    assert _sample("db_pool_checked_out", engine="test") == 0
+    engine.dispose()
+
+
+def test_store_many_records_batch_latency_and_rows_written(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'deliveries.db'}")
+    Base.metadata.create_all(engine)
+    repository = UnifiedDeliveriesRepository(sessionmaker(bind=engine), batch_size=2)
+    batches = _sample("db_insert_batch_seconds_count", method="upsert")
+    inserted = _sample("db_rows_written_total", result="inserted")
+
+    repository.store_many(uuid4(), list(unified_deliveries(5)))
+
+    assert _sample("db_insert_batch_seconds_count", method="upsert") == batches + 3
+    assert _sample("db_rows_written_total", result="inserted") == inserted + 5
+
+
+def test_scheduler_records_job_and_partner_outcomes():
+    fetch_use_case = Mock()
+    store_use_case = Mock()
+    store_use_case.store.return_value = StoreResult()
+    clock = Mock()
+    clock.get_utc_now.return_value = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    stats_b = Stats.for_partner("source-b")
+    stats_b.record_transformed(4)
+    stats_b.record_stage(PipelineStage.MAP, 0.5)
+
+    def fetch(site_id, source, timeout):
+        if source == "source-a":
+            raise PartnerDeliveryFetchError(source, "boom")
+        return stats_b, []
+
+    fetch_use_case.fetch_partner_deliveries.side_effect = fetch
+    failed_jobs = _sample("scheduler_jobs_total", outcome="failed")
+    failed_runs = _sample("scheduler_partner_runs_total", source="source-a", outcome="failed")
+    mapped = _sample("partner_records_total", source="source-b", result="mapped")
+    throughput = _sample("mapping_records_per_second_sum", source="source-b")
+
+    Scheduler(fetch_use_case, store_use_case, clock, Mock(), Mock())._run_fetch_job(
+        "site-456", {"source-a", "source-b"}
+    )
+
+    assert _sample("scheduler_jobs_total", outcome="failed") == failed_jobs + 1
+    assert _sample("scheduler_job_seconds_count", outcome="failed") >= 1
+    assert _sample("scheduler_partner_runs_total", source="source-a", outcome="failed") == failed_runs + 1
+    assert _sample("partner_records_total", source="source-b", result="mapped") == mapped + 4
+    assert _sample("mapping_records_per_second_sum", source="source-b") == throughput + 8
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.application.use_cases.mapper.parnter_a_delivery_mapper import map_partner_delivery_a
+from backend.application.use_cases.mapper.parnter_b_delivery_mapper import map_partner_delivery_b
+
+
+def test_partner_a_mapper_parses_timestamp_once_and_stores_score():
+    delivery = map_partner_delivery_a(
+        "source-a",
+        "site-1",
+        {
+            "deliveryId": "DEL-001-A",
+            "supplier": "Innotech",
+            "timestamp": "2025-08-01T11:54:00+02:00",
+            "status": "Delivered ",
+            "signedBy": "Martin Schulz",
+        },
+    )
+
+    assert delivery.delivered_at == datetime(2025, 8, 1, 9, 54, tzinfo=timezone.utc)
+    assert delivery.delivered_at.tzinfo is timezone.utc
+    assert delivery.delivery_score == 1.2
+    assert delivery.status == "delivered"
+
+
+def test_partner_b_mapper_parses_timestamp_once_and_stores_score():
+    delivery = map_partner_delivery_b(
+        "source-b",
+        "site-1",
+        {
+            "id": "b-1000",
+            "provider": "SupplierB4",
+            "deliveredAt": "2025-08-01T15:13:00+00:00",
+            "statusCode": "OK",
+            "receiver": {"name": "Lukas Müller", "signed": False},
+        },
+    )
+
+    assert delivery.delivered_at == datetime(2025, 8, 1, 15, 13, tzinfo=timezone.utc)
+    assert delivery.delivery_score == 0.3
+    assert delivery.status == "delivered"
+
+
+def test_mapper_rejects_timestamps_without_timezone():
+    with pytest.raises(ValueError):
+        map_partner_delivery_a("source-a", "site-1", {"deliveryId": "x", "supplier": "y", "timestamp": "2025-08-01T11:54:00"})
+
+
+@pytest.mark.parametrize("delivery_id", [1001, None, ["DEL-001-A"]])
+def test_mapper_rejects_non_text_identifiers(delivery_id):
+    with pytest.raises(ValueError):
+        map_partner_delivery_a(
+            "source-a",
+            "site-1",
+            {"deliveryId": delivery_id, "supplier": "y", "timestamp": "2025-08-01T11:54:00+02:00"},
+        )
+
+
+def test_unified_delivery_records_carry_no_instance_dict():
+    delivery = map_partner_delivery_b(
+        "source-b",
+        "site-1",
+        {"id": "b-1000", "provider": "SupplierB4", "deliveredAt": "2025-08-01T15:13:00+00:00", "statusCode": "OK"},
+    )
+
+    assert not hasattr(delivery, "__dict__")
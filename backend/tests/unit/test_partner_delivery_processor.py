@@ -0,0 +1,111 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.application.use_cases.mapper.partner_delivery_mapper import get_partner_delivery_mapper
+from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
+from backend.benchmarks.synthetic import partner_a_records
+from backend.domain.partner_delivery import PartnerDelivery
+from backend.domain.pipeline_stage import PipelineStage
+from backend.domain.stats import Stats
+from backend.domain.stats_fields import StatsFields
+from backend.shared.config.settings import get_settings
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("columnar_batch_size", [None, 4])
+def test_pool_mapping_matches_inline_mapping_and_merges_chunk_stats(process_pool, columnar_batch_size):
+    source = get_settings().source_a
+    delivery = PartnerDelivery(delivery_data=list(partner_a_records(30)))
+    inline = PartnerDeliveryProcessor(get_partner_delivery_mapper(), columnar_batch_size=columnar_batch_size)
+    pooled = PartnerDeliveryProcessor(
+        get_partner_delivery_mapper(),
+        columnar_batch_size=columnar_batch_size,
+        executor=process_pool,
+        pool_chunk_size=7,
+    )
+
+    expected, expected_stats = inline.process(delivery=delivery, source=source, site_id="site-1")
+    mapped, stats = pooled.process(delivery=delivery, source=source, site_id="site-1")
+
+    assert mapped == expected
+    assert stats.stats[StatsFields.FETCHED] == expected_stats.stats[StatsFields.FETCHED] == 30
+    assert stats.stats[StatsFields.TRANSFORMED] == 30
+
+
+def test_payloads_up_to_the_chunk_size_are_mapped_inline():
+    executor = MagicMock()
+    processor = PartnerDeliveryProcessor(get_partner_delivery_mapper(), executor=executor, pool_chunk_size=30)
+
+    mapped, _ = processor.process(
+        delivery=PartnerDelivery(delivery_data=list(partner_a_records(30))),
+        source=get_settings().source_a,
+        site_id="site-1",
+    )
+
+    assert len(mapped) == 30
+    executor.map.assert_not_called()
+
+
+def _partner_a_record(delivery_id, timestamp="2025-08-01T09:41:00Z"):
+    return {"deliveryId": delivery_id, "supplier": "S", "timestamp": timestamp, "status": "delivered", "signedBy": "M"}
+
+
+@pytest.mark.parametrize("columnar_batch_size", [None, 4])
+def test_records_that_cannot_be_mapped_are_counted_and_skipped(columnar_batch_size):
+    processor = PartnerDeliveryProcessor(get_partner_delivery_mapper(), columnar_batch_size=columnar_batch_size)
+    records = [_partner_a_record("DEL-1"), _partner_a_record("DEL-2", timestamp="bad"), _partner_a_record("DEL-3")]
+
+    mapped, stats = processor.process(
+        delivery=PartnerDelivery(delivery_data=records), source=get_settings().source_a, site_id="site-1"
+    )
+
+    assert [delivery.id for delivery in mapped] == ["DEL-1", "DEL-3"]
+    assert stats.stats[StatsFields.FETCHED] == 3
+    assert stats.stats[StatsFields.TRANSFORMED] == 2
+    assert stats.stats[StatsFields.ERRORS] == 1
+
+
+@pytest.mark.parametrize("columnar_batch_size", [None, 4])
+def test_streamed_records_that_cannot_be_mapped_do_not_end_the_stream(columnar_batch_size):
+    processor = PartnerDeliveryProcessor(get_partner_delivery_mapper(), columnar_batch_size=columnar_batch_size)
+    records = [_partner_a_record("DEL-1"), _partner_a_record(7), "not a record", _partner_a_record("DEL-4")]
+    stats = Stats.for_partner(get_settings().source_a)
+
+    mapped = list(
+        processor.process_stream(records=iter(records), source=get_settings().source_a, site_id="site-1", stats=stats)
+    )
+
+    assert [delivery.id for delivery in mapped] == ["DEL-1", "DEL-4"]
+    assert stats.stats[StatsFields.ERRORS] == 2
+    assert stats.stats[StatsFields.TRANSFORMED] == 2
+
+
+def test_stats_merge_adds_counts_of_another_chunk():
+    stats = Stats.for_partner("Partner A")
+    stats.record_fetched(3)
+    stats.record_bytes_received(1_000)
+    stats.record_stage(PipelineStage.DECODE, 0.5)
+    chunk_stats = Stats.for_partner("Partner A")
+    chunk_stats.record_fetched(2)
+    chunk_stats.record_transformed(1)
+    chunk_stats.record_errors(1)
+    chunk_stats.record_stored(1)
+    chunk_stats.record_stage(PipelineStage.DECODE, 0.25)
+    chunk_stats.record_stage(PipelineStage.MAP, 2.0)
+
+    stats.merge(chunk_stats)
+
+    assert stats.stats[StatsFields.FETCHED] == 5
+    assert stats.stats[StatsFields.TRANSFORMED] == 1
+    assert stats.stats[StatsFields.ERRORS] == 1
+    assert stats.stored == 1
+    assert stats.bytes_received == 1_000
+    assert stats.stage_seconds == {PipelineStage.DECODE: 0.75, PipelineStage.MAP: 2.0}
@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.adapters.outbound.partners.partner_payload_schemas import (
+    GENERIC_SCHEMA,
+    PARTNER_A_SCHEMA,
+    PARTNER_B_SCHEMA,
+)
+from backend.application.use_cases.mapper.parnter_a_delivery_mapper import map_partner_delivery_a
+from backend.application.use_cases.mapper.parnter_b_delivery_mapper import map_partner_delivery_b
+from backend.application.use_cases.mapper.partner_delivery_mapper import get_partner_delivery_mapper
+from backend.application.use_cases.partner_delivery_processor import PartnerDeliveryProcessor
+from backend.domain.malformed_record import MalformedRecord
+from backend.domain.partner_delivery import PartnerDelivery
+from backend.shared.config.settings import get_settings
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.mark.parametrize(
+    ("schema", "mapper", "fixture"),
+    [
+        (PARTNER_A_SCHEMA, map_partner_delivery_a, "mock_logistics_a"),
+        (PARTNER_B_SCHEMA, map_partner_delivery_b, "mock_logistics_b"),
+    ],
+)
+def test_decoded_fixture_records_map_like_the_raw_json(schema, mapper, fixture):
+    content = (_REPO_ROOT / fixture / "data.json").read_bytes()
+
+    records, malformed = schema.decode(content)
+
+    assert malformed == []
+    assert [mapper("source", "site-1", record) for record in records] == [
+        mapper("source", "site-1", record) for record in json.loads(content)
+    ]
+
+
+def test_partner_b_schema_reports_each_malformed_record_with_its_position():
+    content = json.dumps([
+        {"id": "b-1", "provider": "SupplierB1", "deliveredAt": "2025-08-01T05:39:00+00:00", "receiver": None},
+        {"id": "b-2", "deliveredAt": "2025-08-01T05:39:00+00:00"},
+        {"id": "b-3", "provider": "SupplierB1", "deliveredAt": "2025-08-01T05:39:00+00:00", "statusCode": None},
+        {"id": "b-4", "provider": "SupplierB1", "deliveredAt": "2025-08-01T05:39:00+00:00", "receiver": "yes"},
+    ]).encode()
+
+    records, malformed = PARTNER_B_SCHEMA.decode(content)
+
+    assert [record["id"] for record in records] == ["b-1"]
+    assert [record.index for record in malformed] == [1, 2, 3]
+    assert malformed[0].reason == "provider: Field required"
+    assert malformed[1].reason == "statusCode: Input should be a valid string"
+
+
+@pytest.mark.parametrize("content", [b'{"deliveries": []}', b"[{", b""])
+def test_payloads_that_are_not_json_arrays_are_rejected_as_a_whole(content):
+    with pytest.raises(ValueError, match="Expected a JSON array of delivery objects"):
+        GENERIC_SCHEMA.decode(content)
+
+
+def test_processor_counts_malformed_records_and_decode_time():
+    settings = get_settings()
+    delivery = PartnerDelivery(
+        delivery_data=[{
+            "deliveryId": "DEL-001-A",
+            "supplier": "SupplierX",
+            "timestamp": "2025-08-01T11:54:00+02:00",
+        }],
+        malformed=[MalformedRecord(index=1, reason="supplier: Field required")],
+        decoded_bytes=2_000_000,
+        decode_seconds=0.01,
+    )
+
+    _, stats = PartnerDeliveryProcessor(get_partner_delivery_mapper()).process(
+        delivery=delivery,
+        source=settings.source_a,
+        site_id="site-1",
+    )
+
+    partner_stats = stats.as_dict()[settings.source_a]
+    assert partner_stats["fetched"] == 2
+    assert partner_stats["transformed"] == 1
+    assert partner_stats["errors"] == 1
+    assert partner_stats["bytesReceived"] == 2_000_000
+    assert partner_stats["decodeMsPerMb"] == 5.0
+    assert partner_stats["stageSeconds"] == {"decode": 0.01}
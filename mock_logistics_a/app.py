@@ -1,23 +1,172 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+import asyncio
+import gzip
 import json
-from typing import List
+import os
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, List
 
-app = FastAPI(title="Mock Partner A", root_path="/mock-a")
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-with open("/srv/data.json") as f:
-    data = json.load(f)
+# Without MOCK_RECORD_COUNT the fixed data.json is served; otherwise a synthetic dataset of that size.
+RECORD_COUNT = int(os.environ.get("MOCK_RECORD_COUNT", "0"))
+DATA_FILE = os.environ.get("MOCK_DATA_FILE", "/srv/data.json")
+SEED = int(os.environ.get("MOCK_SEED", "1"))
+LATENCY_MS = float(os.environ.get("MOCK_LATENCY_MS", "0"))
+LATENCY_JITTER_MS = float(os.environ.get("MOCK_LATENCY_JITTER_MS", "0"))
+ERROR_RATE = float(os.environ.get("MOCK_ERROR_RATE", "0"))
+TIMEOUT_RATE = float(os.environ.get("MOCK_TIMEOUT_RATE", "0"))
+TIMEOUT_SECONDS = float(os.environ.get("MOCK_TIMEOUT_SECONDS", "60"))
+GZIP = os.environ.get("MOCK_GZIP", "false").lower() in ("1", "true", "yes")
+STREAM = os.environ.get("MOCK_STREAM", "false").lower() in ("1", "true", "yes")
+CHUNK_SIZE = int(os.environ.get("MOCK_CHUNK_SIZE", "65536"))
+CHUNK_DELAY_MS = float(os.environ.get("MOCK_CHUNK_DELAY_MS", "0"))
 
-class LogisticsAResponse(BaseModel):
-    deliveryId: str
-    supplier: str
-    timestamp: str
-    status: str
-    signedBy: str
+SUPPLIERS = ("SupplierX", "SupplierY", "SupplierZ", "Acme", "Globex", "Innotech")
+STATUSES = ("delivered", "pending", "cancelled")
+SIGNERS = ("Martin Schulz", "Sophie Wagner", "Felix Keller", "Laura Fischer", "Mia Weber")
+EPOCH = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+faults = random.Random(SEED)
+
+
+@dataclass
+class Dataset:
+    """A dataset serialized once: every record's JSON plus the full body, gzipped on first use."""
+
+    records: List[bytes]
+    body: bytes
+    _gzipped: bytes | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def of(cls, records: List[dict]) -> "Dataset":
+        serialized = [json.dumps(record, separators=(",", ":")).encode() for record in records]
+        return cls(records=serialized, body=b"[" + b",".join(serialized) + b"]")
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+    def page(self, start: int, stop: int) -> bytes:
+        if start == 0 and stop >= len(self.records):
+            return self.body
+        return b"[" + b",".join(self.records[start:stop]) + b"]"
+
+
+def generate_records(count: int, seed: int) -> Iterator[dict]:
+    rng = random.Random(seed)
+    for index in range(count):
+        delivered_at = EPOCH + timedelta(minutes=rng.randrange(60 * 24 * 30))
+        yield {
+            "deliveryId": f"DEL-{index + 1:07d}-A",
+            "supplier": rng.choice(SUPPLIERS),
+            "timestamp": delivered_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "status": rng.choice(STATUSES),
+            "signedBy": rng.choice(SIGNERS) if rng.random() < 0.4 else "",
+        }
+
+
+@lru_cache(maxsize=4)
+def dataset(count: int) -> Dataset:
+    if count:
+        return Dataset.of(list(generate_records(count, SEED)))
+    with open(DATA_FILE) as f:
+        return Dataset.of(json.load(f))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Serialize (and compress) up front so the first request is not the slow one.
+    data = dataset(RECORD_COUNT)
+    if GZIP:
+        data.gzipped()
+    yield
+
+
+app = FastAPI(title="Mock Partner A", root_path="/mock-a", lifespan=lifespan)
+
+
+async def inject_faults(latency_ms: float, error_rate: float, timeout_rate: float) -> None:
+    delay = latency_ms + faults.uniform(0, LATENCY_JITTER_MS)
+    if delay:
+        await asyncio.sleep(delay / 1000)
+    if faults.random() < timeout_rate:
+        await asyncio.sleep(TIMEOUT_SECONDS)
+        raise HTTPException(status_code=504, detail="Injected timeout")
+    if faults.random() < error_rate:
+        raise HTTPException(status_code=500, detail="Injected failure")
+
+
+def page_bounds(
+    total: int,
+    page: int | None,
+    page_size: int | None,
+    cursor: str | None,
+    limit: int | None,
+) -> tuple[int, int]:
+    if cursor is not None or limit is not None:
+        if cursor and not cursor.isdigit():
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        start = int(cursor or 0)
+        return start, start + (limit or total)
+    if page is not None or page_size is not None:
+        size = page_size or total
+        start = ((page or 1) - 1) * size
+        return start, start + size
+    return 0, total
+
+
+def chunks(body: bytes) -> Iterator[bytes]:
+    view = memoryview(body)
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield bytes(view[start:start + CHUNK_SIZE])
+
+
+async def paced(body: bytes):
+    for chunk in chunks(body):
+        yield chunk
+        if CHUNK_DELAY_MS:
+            await asyncio.sleep(CHUNK_DELAY_MS / 1000)
+
+
+@app.post("/api/logistics-a")
+async def logistics_a(
+    request: Request,
+    count: int | None = Query(None, ge=1, description="Synthetic dataset size; overrides MOCK_RECORD_COUNT."),
+    latency_ms: float = Query(LATENCY_MS, ge=0, alias="latencyMs"),
+    error_rate: float = Query(ERROR_RATE, ge=0, le=1, alias="errorRate"),
+    timeout_rate: float = Query(TIMEOUT_RATE, ge=0, le=1, alias="timeoutRate"),
+    use_gzip: bool = Query(GZIP, alias="gzip", description="Compress when the client accepts gzip."),
+    stream: bool = Query(STREAM, description="Send the body with chunked transfer encoding."),
+    page: int | None = Query(None, ge=1),
+    page_size: int | None = Query(None, ge=1, alias="pageSize"),
+    cursor: str | None = Query(None, description="Opaque cursor from X-Next-Cursor."),
+    limit: int | None = Query(None, ge=1),
+):
+    await inject_faults(latency_ms, error_rate, timeout_rate)
+    # A new size is generated off the event loop; the configured one was built at startup.
+    data = dataset(RECORD_COUNT) if count in (None, RECORD_COUNT) else await asyncio.to_thread(dataset, count)
+    total = len(data.records)
+    start, stop = page_bounds(total, page, page_size, cursor, limit)
+    headers = {"X-Total-Count": str(total)}
+    if stop < total:
+        headers["X-Next-Cursor"] = str(stop)
+
+    if use_gzip and "gzip" in request.headers.get("accept-encoding", ""):
+        whole = start == 0 and stop >= total
+        body = data.gzipped() if whole else gzip.compress(data.page(start, stop), compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body = data.page(start, stop)
+    if stream:
+        return StreamingResponse(paced(body), media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
-@app.post("/api/logistics-a", response_model=List[LogisticsAResponse])
-async def logistics_a():
-    return data
 
 @app.get("/healthz")
 async def healthz():